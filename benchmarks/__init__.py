@@ -0,0 +1 @@
+"""Performance benchmarks for the Pulumi Cloud API client."""
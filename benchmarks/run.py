@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Benchmark the client's throughput, latency and memory use against a local fake server.
+
+Results are written as JSON and compared with a saved baseline, failing when a metric regressed
+by more than the tolerance::
+
+    python -m benchmarks.run --save-baseline      # record a baseline on this machine
+    python -m benchmarks.run                      # compare against it, exit code 1 on regressions
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from pulumi_cloud_client.client import PulumiClient
+from pulumi_cloud_client.models import Stack
+from pulumi_cloud_client.tagindex import TagIndex
+from pulumi_cloud_client.testing import FakeDataset, FakePulumiServer, constant_latency
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Client concurrency levels of the latency benchmark
+CONCURRENCY_LEVELS = (1, 8, 32)
+
+
+@dataclass
+class Metric:
+    """A benchmark measurement."""
+
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than its baseline by more than the tolerance."""
+
+    name: str
+    baseline: float
+    current: float
+    change: float
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Return the nearest-rank percentile ``q`` (between 0 and 1) of some values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def bench_list_throughput(scale: float) -> Dict[str, Metric]:
+    """Measure how fast stacks.list fetches and parses paginated listings."""
+    stacks = max(int(1000 * scale), 10)
+    with FakePulumiServer(FakeDataset(projects=10, stacks=stacks, resources=0), page_size=500) as server:
+        client = server.client()
+        client.stacks.list("org-0")
+        started = time.perf_counter()
+        count = len(client.stacks.list("org-0"))
+        elapsed = time.perf_counter() - started
+        client.close()
+    return {"stacks_list.throughput": Metric(count / elapsed, "stacks/s", higher_is_better=True)}
+
+
+def bench_get_latency(scale: float) -> Dict[str, Metric]:
+    """Measure stacks.get latency percentiles at several client concurrency levels."""
+    calls = max(int(400 * scale), 20)
+    metrics = {}
+    with FakePulumiServer(FakeDataset(projects=1, stacks=100, resources=0), latency=constant_latency(0.002)) as server:
+        for workers in CONCURRENCY_LEVELS:
+            client = server.client(pool_maxsize=workers)
+            client.warmup(workers)
+
+            def timed_get(index: int) -> float:
+                started = time.perf_counter()
+                client.stacks.get("org-0", "project-0", f"stack-{index % 100}")
+                return time.perf_counter() - started
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                latencies = list(executor.map(timed_get, range(calls)))
+            client.close()
+
+            for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+                metrics[f"stacks_get.c{workers}.{name}"] = Metric(percentile(latencies, q) * 1000, "ms")
+    return metrics
+
+
+def bench_transfer_throughput(scale: float) -> Dict[str, Metric]:
+    """Measure the throughput of transfer_many against a server answering in 5 ms."""
+    stacks = max(int(200 * scale), 10)
+    dataset = FakeDataset(projects=1, stacks=stacks, resources=0)
+    with FakePulumiServer(dataset, page_size=500, latency=constant_latency(0.005)) as server:
+        client = server.client(pool_maxsize=8)
+        listing = client.stacks.list("org-0")
+        started = time.perf_counter()
+        summary = client.stacks.transfer_many("org-1", listing, max_workers=8)
+        elapsed = time.perf_counter() - started
+        client.close()
+    if summary.failed:
+        raise RuntimeError(f"{len(summary.failed)} transfers failed")
+    return {"transfer_many.throughput": Metric(len(summary.transferred) / elapsed, "stacks/s", higher_is_better=True)}
+
+
+def _serve(dataset_kwargs: Dict[str, Any], urls: Any, stop: Any) -> None:
+    """Run a fake server in a child process until ``stop`` is set."""
+    with FakePulumiServer(FakeDataset(**dataset_kwargs)) as server:
+        urls.put(server.url)
+        stop.wait()
+
+
+def bench_export_memory(scale: float) -> Dict[str, Metric]:
+    """Measure the peak memory of exporting a large deployment, fully and streamed."""
+    resources = max(int(20000 * scale), 100)
+
+    # Serve from another process so that only the client's allocations are traced
+    context = multiprocessing.get_context("spawn")
+    urls, stop = context.Queue(), context.Event()
+    process = context.Process(target=_serve, args=({"projects": 1, "stacks": 1, "resources": resources}, urls, stop))
+    process.start()
+    try:
+        client = PulumiClient("fake-token", base_url=urls.get(timeout=30))
+
+        def export_deployment() -> None:
+            client.stacks.export_deployment("org-0", "project-0", "stack-0")
+
+        def iter_deployment_resources() -> None:
+            for _ in client.stacks.iter_deployment_resources("org-0", "project-0", "stack-0"):
+                pass
+
+        metrics = {}
+        for export in (export_deployment, iter_deployment_resources):
+            tracemalloc.start()
+            export()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            metrics[f"{export.__name__}.peak_memory"] = Metric(peak / 2**20, "MiB")
+        client.close()
+    finally:
+        stop.set()
+        process.join()
+    return metrics
+
+
+def bench_model_construction(scale: float) -> Dict[str, Metric]:
+    """Measure the cost of building Stack models from API dictionaries."""
+    count = max(int(10000 * scale), 100)
+    items = [
+        {
+            "orgName": "org-0",
+            "projectName": f"project-{i % 10}",
+            "name": f"stack-{i}",
+            "lastUpdate": "2024-05-01T12:00:00Z",
+            "resourceCount": i % 50,
+            "tags": {"env": "prod", "team": "payments"},
+        }
+        for i in range(count)
+    ]
+    best = min(timeit.repeat(lambda: Stack.from_api_list(items), number=1, repeat=5))
+    return {"stack_model.construction": Metric(best / count * 1e6, "us/stack")}
+
+
+def bench_tag_index(scale: float) -> Dict[str, Metric]:
+    """Measure tag index queries over a fleet of 50,000 stacks, first run and repeated."""
+    count = max(int(50000 * scale), 100)
+    stacks = [
+        Stack(
+            f"stack-{i}",
+            "org-0",
+            f"project-{i % 100}",
+            None,
+            0,
+            tags={"env": ("dev", "staging", "prod")[i % 3], "team": f"team-{i % 20}"},
+        )
+        for i in range(count)
+    ]
+    index = TagIndex(stacks)
+    selectors = ["env=prod,team=team-5", "env in (dev, staging),team notin (team-1, team-2)", "!owner,env!=dev"]
+
+    def query() -> None:
+        for selector in selectors:
+            index.names(selector)
+
+    def cold_query() -> None:
+        # Retag one stack to drop the cached results, as an incremental update would
+        index.update([stacks[0]])
+        query()
+
+    cold = min(timeit.repeat(cold_query, number=1, repeat=5)) / len(selectors)
+    warm = min(timeit.repeat(query, number=1000, repeat=5)) / 1000 / len(selectors)
+    return {
+        "tag_index.query": Metric(cold * 1e3, "ms"),
+        "tag_index.repeated_query": Metric(warm * 1e6, "us"),
+    }
+
+
+def bench_import_time(scale: float) -> Dict[str, Metric]:
+    """Measure the time taken to import the client in a fresh interpreter."""
+    code = "import time; t = time.perf_counter(); import pulumi_cloud_client.client; print(time.perf_counter() - t)"
+    runs = [
+        float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout)
+        for _ in range(5)
+    ]
+    return {"import.client": Metric(min(runs) * 1000, "ms")}
+
+
+BENCHMARKS: Dict[str, Callable[[float], Dict[str, Metric]]] = {
+    "list": bench_list_throughput,
+    "get": bench_get_latency,
+    "transfer": bench_transfer_throughput,
+    "export": bench_export_memory,
+    "models": bench_model_construction,
+    "tags": bench_tag_index,
+    "import": bench_import_time,
+}
+
+
+def run_benchmarks(selected: Optional[List[str]] = None, scale: float = 1.0) -> Dict[str, Any]:
+    """
+    Run benchmarks and collect their results.
+
+    Args:
+        selected: Names of the benchmarks to run (all of them if None)
+        scale: Factor applied to the dataset and call counts, e.g. 0.1 for a quick run
+
+    Returns:
+        JSON-compatible results, with metadata about the environment
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for name in selected or list(BENCHMARKS):
+        for metric_name, metric in BENCHMARKS[name](scale).items():
+            results[metric_name] = asdict(metric)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": scale,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Regression]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        current: Results of this run
+        baseline: Saved results to compare with
+        tolerance: Relative change tolerated before a metric counts as regressed, e.g. 0.25
+
+    Returns:
+        The regressed metrics; metrics missing from either side are ignored
+    """
+    regressions = []
+    for name, metric in current["results"].items():
+        saved = baseline["results"].get(name)
+        if not saved or not saved["value"]:
+            continue
+        change = (metric["value"] - saved["value"]) / saved["value"]
+        worse = -change if metric["higher_is_better"] else change
+        if worse > tolerance:
+            regressions.append(Regression(name, saved["value"], metric["value"], change))
+    return regressions
+
+
+def get_args(argv: Optional[List[str]] = None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the Pulumi Cloud API client against a local fake server")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Only run these benchmarks")
+    parser.add_argument("--scale", type=float, default=1.0, help="Scale of datasets and call counts (default: 1.0)")
+    parser.add_argument("--output", "-o", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", "-b", default=DEFAULT_BASELINE, help="Baseline results to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Save the results as the new baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Relative change tolerated before failing (default: 0.25)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks, report the results and return the exit code."""
+    args = get_args(argv)
+    results = run_benchmarks(args.only, args.scale)
+
+    for name, metric in results["results"].items():
+        print(f"{name:40} {metric['value']:12.3f} {metric['unit']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["meta"].get("scale") != args.scale:
+        print(f"Warning: the baseline was recorded with --scale {baseline['meta'].get('scale')}")
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.baseline:.3f} -> {regression.current:.3f} "
+            f"({regression.change:+.0%})"
+        )
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.tolerance:.0%} of the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
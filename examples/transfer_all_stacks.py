@@ -5,12 +5,25 @@ import argparse
 import os
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from pulumi_cloud_client.bulk import BulkExecutor, TransferJournal, TransferProgress
 from pulumi_cloud_client.client import PulumiClient
+from pulumi_cloud_client.concurrency import AdaptiveConcurrencyLimiter
 from pulumi_cloud_client.exceptions import PulumiAPIError
+from pulumi_cloud_client.metrics import MetricsRecorder
 from pulumi_cloud_client.models.stack import Stack
 
+# Upper bound on parallel transfers with --parallel auto
+MAX_AUTO_PARALLEL = 32
+
+
+def parallelism(value: str) -> Optional[int]:
+    """Parse the --parallel option, returning None for 'auto'."""
+    if value == "auto":
+        return None
+    return int(value)
+
 
 def get_args():
     """Parse command line arguments."""
@@ -20,8 +33,16 @@ def get_args():
     parser.add_argument("--source-org", "-s", required=True, help="Source organization name")
     parser.add_argument("--dest-org", "-d", required=True, help="Destination organization name")
     parser.add_argument("--project", "-p", help="Optional: Only transfer stacks for a specific project")
-    parser.add_argument("--parallel", type=int, default=4, help="Number of parallel transfers (default: 4)")
+    parser.add_argument(
+        "--parallel",
+        type=parallelism,
+        default=4,
+        help="Number of parallel transfers, or 'auto' to adapt it to the API's responsiveness (default: 4)",
+    )
     parser.add_argument("--dry-run", action="store_true", help="Dry run, don't actually transfer stacks")
+    parser.add_argument(
+        "--journal", "-j", help="Optional: Record progress in this file and resume from it if the job is restarted"
+    )
     return parser.parse_args()
 
 
@@ -53,6 +74,71 @@ def transfer_stack(client: PulumiClient, stack: Stack, dest_org: str, dry_run: b
         return stack, f"Error transferring {stack.full_name}: {e.message} (Status: {e.status_code})", False
 
 
+def print_progress(progress: TransferProgress, stack_name: str, error: Optional[str]) -> None:
+    """Print the outcome of one transfer along with throughput and ETA."""
+    done = progress.total - progress.remaining
+    message = f"Error transferring {stack_name}: {error}" if error else f"Successfully transferred {stack_name}"
+    eta = f"{progress.eta:.0f}s" if progress.eta is not None else "unknown"
+    rate = f"{progress.rate:.1f} stacks/s, {progress.concurrency} in flight"
+    print(f"[{done}/{progress.total}] {message} ({rate}, ETA {eta})")
+
+
+def journaled_transfer(client: PulumiClient, args) -> None:
+    """Transfer stacks using a journal, resuming a previous run if the journal already exists."""
+    stacks = None
+    if TransferJournal(args.journal).exists():
+        print(f"Resuming transfer from journal '{args.journal}'")
+    else:
+        stacks = client.stacks.list(args.source_org, args.project)
+        if not stacks:
+            print("No stacks found to transfer.")
+            return
+        confirm = input(f"\nTransfer {len(stacks)} stacks from '{args.source_org}' to '{args.dest_org}'? (y/n): ")
+        if confirm.lower() != "y":
+            print("Transfer cancelled.")
+            return
+
+    limiter = AdaptiveConcurrencyLimiter(max_limit=MAX_AUTO_PARALLEL) if args.parallel is None else None
+    client.warmup(args.parallel or 4)
+    summary = client.stacks.transfer_many(
+        args.dest_org,
+        stacks,
+        journal_path=args.journal,
+        max_workers=args.parallel or 1,
+        progress_callback=print_progress,
+        limiter=limiter,
+    )
+
+    print("\nTransfer summary:")
+    print(f"  Already transferred in a previous run: {summary.skipped}")
+    print(f"  Successfully transferred: {len(summary.transferred)}")
+    print(f"  Failed transfers: {len(summary.failed)}")
+
+
+def adaptive_transfer(client: PulumiClient, stacks: List[Stack], dest_org: str, dry_run: bool) -> None:
+    """Transfer stacks with a concurrency that adapts to the API's latency and rate limiting."""
+    limiter = AdaptiveConcurrencyLimiter(max_limit=MAX_AUTO_PARALLEL)
+    limiter.attach(client.metrics)
+    executor = BulkExecutor(limiter=limiter)
+    successful = 0
+
+    print("\nTransferring stacks...")
+    outcomes = executor.map_unordered(lambda stack: transfer_stack(client, stack, dest_org, dry_run), stacks)
+    for i, outcome in enumerate(outcomes, 1):
+        if outcome.result is not None:
+            _, message, success = outcome.result
+        else:
+            message, success = f"Error transferring {outcome.item.full_name}: {outcome.error}", False
+        print(f"[{i}/{len(stacks)}] {message} ({executor.concurrency} in flight)")
+        successful += success
+    limiter.detach()
+
+    print("\nTransfer summary:")
+    print(f"  Total stacks: {len(stacks)}")
+    print(f"  Successfully transferred: {successful}")
+    print(f"  Failed transfers: {len(stacks) - successful}")
+
+
 def main():
     """Transfer all stacks between organizations."""
     args = get_args()
@@ -63,10 +149,20 @@ def main():
         print("Error: PULUMI_ACCESS_TOKEN environment variable not set")
         sys.exit(1)
 
-    # Initialize Pulumi API client
-    client = PulumiClient(access_token=access_token)
+    # Initialize Pulumi API client with a connection pool large enough for every worker; with
+    # --parallel auto, its metrics let the concurrency limiter see rate limiting behind retries
+    client = PulumiClient(
+        access_token=access_token,
+        pool_maxsize=max(10, args.parallel or MAX_AUTO_PARALLEL),
+        pool_block=True,
+        metrics=MetricsRecorder() if args.parallel is None else None,
+    )
 
     try:
+        if args.journal and not args.dry_run:
+            journaled_transfer(client, args)
+            return
+
         # Get all stacks in source organization, optionally filtered by project
         if args.project:
             stacks = client.stacks.list(args.source_org, args.project)
@@ -96,6 +192,14 @@ def main():
         # Track results
         results: Dict[str, int] = {"successful": 0, "failed": 0}
 
+        # Open the pooled connections before the burst of transfers
+        if not args.dry_run:
+            client.warmup(args.parallel or 4)
+
+        if args.parallel is None:
+            adaptive_transfer(client, stacks, args.dest_org, args.dry_run)
+            return
+
         # Transfer stacks in parallel
         with ThreadPoolExecutor(max_workers=args.parallel) as executor:
             future_to_stack = {
@@ -0,0 +1,335 @@
+"""Asynchronous client library for interacting with the Pulumi Cloud API.
+
+Mirrors :class:`pulumi_cloud_client.client.PulumiClient` on top of ``aiohttp`` so a single
+event loop can keep many requests in flight over one pooled set of keep-alive connections.
+Requires the optional ``aiohttp`` package (``pip install aiohttp``).
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from pulumi_cloud_client.circuit import CircuitBreaker
+from pulumi_cloud_client.codec import JSONCodec, default_codec
+from pulumi_cloud_client.exceptions import CircuitOpenError, DeadlineExceededError, PulumiAPIError
+from pulumi_cloud_client.metrics import MetricsRecorder
+from pulumi_cloud_client.ratelimit import RateLimiter
+from pulumi_cloud_client.retry import RetryBudget, backoff_delay, current_deadline
+from pulumi_cloud_client.retry import deadline as deadline_scope
+from pulumi_cloud_client.retry import is_retryable_status, retry_after_seconds
+from pulumi_cloud_client.routes import endpoint_template
+
+from .resources.organizations import AsyncOrganizationsResource
+from .resources.policies import AsyncPoliciesResource
+from .resources.projects import AsyncProjectsResource
+from .resources.stacks import AsyncStacksResource
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+
+class AsyncPulumiClient:
+    """Asynchronous client for the Pulumi Service Admin API."""
+
+    def __init__(
+        self,
+        access_token: str,
+        base_url: str = "https://api.pulumi.com",
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_delay: int = 1,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = 15,
+        rate_limiter: Optional[RateLimiter] = None,
+        codec: Optional[JSONCodec] = None,
+        metrics: Optional[MetricsRecorder] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_retry_delay: float = 30.0,
+        deadline: Optional[float] = None,
+        retry_budget: Optional[RetryBudget] = None,
+    ):
+        """
+        Initialize the asynchronous Pulumi API client.
+
+        The underlying connection pool is created lazily on first use, inside the running event loop.
+
+        Args:
+            access_token: The API access token for authentication
+            base_url: Base URL for the Pulumi API (defaults to https://api.pulumi.com)
+            timeout: Timeout of each attempt in seconds
+            max_retries: Maximum number of retry attempts for recoverable errors
+            retry_delay: Initial delay between retries in seconds; it doubles after each retry up to
+                ``max_retry_delay``, and each sleep is drawn at random below it
+            max_connections: Maximum number of simultaneously open connections (0 for no limit)
+            max_connections_per_host: Maximum number of connections per host (0 for no limit)
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            rate_limiter: Optional token bucket shared by every task using this client; it adapts
+                to the service's rate-limit headers
+            codec: JSON codec for request and response bodies; defaults to orjson when it is installed
+                and the standard library otherwise
+            metrics: Optional recorder of latency, retry, status code, payload size and decode time
+                metrics per endpoint template
+            circuit_breaker: Optional per-endpoint circuit breaker; while an endpoint's circuit is open,
+                calls to it raise CircuitOpenError at once instead of being sent and retried
+            max_retry_delay: Upper bound of the delay between retries in seconds
+            deadline: Optional time budget of each call in seconds, covering every attempt and
+                backoff sleep; calls that cannot complete in time raise DeadlineExceededError
+            retry_budget: Optional budget capping retries as a share of calls, shared by every
+                task using this client (or by several clients)
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncPulumiClient requires aiohttp; install it with 'pip install aiohttp'")
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.rate_limiter = rate_limiter
+        self.codec = codec if codec is not None else default_codec()
+        self.metrics = metrics
+        self.circuit_breaker = circuit_breaker
+        self.max_retry_delay = max_retry_delay
+        self.deadline = deadline
+        self.retry_budget = retry_budget
+
+        self.headers = {
+            "Authorization": f"token {access_token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+        self.stacks = AsyncStacksResource(self)
+        self.projects = AsyncProjectsResource(self)
+        self.organizations = AsyncOrganizationsResource(self)
+        self.policies = AsyncPoliciesResource(self)
+
+    async def __aenter__(self) -> "AsyncPulumiClient":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the connection pool on exit."""
+        await self.close()
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it on first access."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _handle_response(self, response: "aiohttp.ClientResponse", raw: bool = False) -> Any:
+        """Process API response and handle errors, returning the body undecoded if ``raw`` is set."""
+        content = await response.read()
+        if response.status < 400:
+            if raw:
+                return content
+            if content:
+                return self.codec.loads(content)
+            return None
+
+        error_data = None
+        error_message = response.reason or ""
+
+        try:
+            error_data = self.codec.loads(content)
+            if isinstance(error_data, dict) and "message" in error_data:
+                error_message = error_data["message"]
+        except ValueError:
+            # Only catch JSON parsing errors, not all exceptions
+            pass
+
+        raise PulumiAPIError(
+            status_code=response.status,
+            message=error_message,
+            response_data=error_data,
+            headers=response.headers,
+        )
+
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+    ) -> Any:
+        """
+        Send a request to the Pulumi API with retry logic.
+
+        Args:
+            method: HTTP method (get, post, put, patch, delete)
+            path: API endpoint path
+            params: URL parameters to include
+            data: JSON body data
+            raw: Return the response body as undecoded bytes
+
+        Returns:
+            Parsed API response, or the response body if ``raw`` is set
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        body = self.codec.dumps(data) if data is not None else None
+        metrics = self.metrics
+        breaker = self.circuit_breaker
+        endpoint = endpoint_template(path) if metrics is not None or breaker is not None else path
+        budget = self.retry_budget
+        started = time.monotonic()
+        expires = current_deadline(self.deadline)
+        if budget is not None:
+            budget.record_request()
+
+        retries = 0
+
+        while True:
+            admitted = True
+            if self.rate_limiter is not None:
+                if expires is not None:
+                    # Never sleep for a slot the deadline leaves no time to use
+                    wait = self.rate_limiter.try_reserve(expires - time.monotonic())
+                else:
+                    wait = self.rate_limiter.reserve()
+                admitted = wait is not None
+                if wait:
+                    await asyncio.sleep(wait)
+
+            # Without a deadline, attempts use the session's timeout
+            options: Dict[str, Any] = {}
+            if expires is not None:
+                remaining = expires - time.monotonic()
+                if remaining <= 0 or not admitted:
+                    if metrics is not None:
+                        metrics.record_request(endpoint, time.monotonic() - started, retries, ok=False)
+                    raise DeadlineExceededError(endpoint, retries, time.monotonic() - started)
+                options["timeout"] = aiohttp.ClientTimeout(total=min(self.timeout, remaining))
+
+            # Only ask the breaker once the attempt is about to be sent, so a half-open probe slot
+            # is never held by a task still waiting for the limiter
+            if breaker is not None:
+                try:
+                    breaker.before_call(endpoint)
+                except CircuitOpenError:
+                    if metrics is not None:
+                        metrics.record_request(endpoint, time.monotonic() - started, retries, ok=False)
+                    raise
+
+            attempt_started = time.monotonic()
+            responded = False
+            try:
+                async with self.session.request(method.upper(), url, params=params, data=body, **options) as response:
+                    content = await response.read()
+                    responded = True
+                    if breaker is not None:
+                        breaker.record(endpoint, response.status)
+                    if metrics is not None:
+                        metrics.record_attempt(
+                            endpoint,
+                            response.status,
+                            time.monotonic() - attempt_started,
+                            len(body or b""),
+                            len(content),
+                        )
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.update_from_headers(response.headers)
+
+                    decode_started = time.monotonic()
+                    result = await self._handle_response(response, raw)
+                    if metrics is not None:
+                        metrics.record_decode(endpoint, time.monotonic() - decode_started)
+                        metrics.record_request(endpoint, time.monotonic() - started, retries + 1, ok=True)
+                    return result
+            except (aiohttp.ClientError, asyncio.TimeoutError, PulumiAPIError) as e:
+                if not responded:
+                    if breaker is not None:
+                        breaker.record(endpoint, None)
+                    if metrics is not None:
+                        metrics.record_attempt(endpoint, None, time.monotonic() - attempt_started, len(body or b""))
+                retries += 1
+
+                # Network errors are retryable, API errors depend on the status code
+                retryable = not isinstance(e, PulumiAPIError) or is_retryable_status(e.status_code)
+
+                if not retryable or retries > self.max_retries:
+                    if metrics is not None:
+                        metrics.record_request(endpoint, time.monotonic() - started, retries, ok=False)
+                    raise
+
+                wait = backoff_delay(self.retry_delay, retries, self.max_retry_delay)
+                if isinstance(e, PulumiAPIError) and e.status_code == 429:
+                    retry_after = retry_after_seconds(e.headers)
+                    if self.rate_limiter is not None:
+                        # The shared limiter holds back every task before the next attempt
+                        if retry_after is None:
+                            self.rate_limiter.pause(wait)
+                        wait = 0
+                    elif retry_after is not None:
+                        wait = retry_after
+
+                out_of_time = expires is not None and time.monotonic() + wait >= expires
+                if out_of_time or (budget is not None and not budget.try_retry()):
+                    if metrics is not None:
+                        metrics.record_request(endpoint, time.monotonic() - started, retries, ok=False)
+                    if out_of_time:
+                        raise DeadlineExceededError(endpoint, retries, time.monotonic() - started) from e
+                    raise
+
+                if metrics is not None:
+                    metrics.record_backoff(endpoint, wait)
+                await asyncio.sleep(wait)
+            except BaseException:
+                # Cancelled before any outcome: give back a half-open probe slot, or the circuit
+                # would reject every later call
+                if not responded and breaker is not None:
+                    breaker.release(endpoint)
+                raise
+
+    # General purpose request method
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        """
+        Make a custom API request for endpoints not explicitly covered.
+
+        Args:
+            method: HTTP method (get, post, put, patch, delete)
+            path: API endpoint path
+            params: URL parameters to include
+            data: JSON body data
+            raw: Return the response body as undecoded bytes
+            deadline: Optional time budget of this call in seconds, covering every attempt and
+                backoff sleep
+
+        Returns:
+            Parsed API response, or the response body if ``raw`` is set
+        """
+        if deadline is None:
+            return await self._make_request(method.lower(), path, params, data, raw=raw)
+        with deadline_scope(deadline):
+            return await self._make_request(method.lower(), path, params, data, raw=raw)
@@ -0,0 +1,475 @@
+"""Bulk operations for the Pulumi Cloud API client.
+
+Provides a bounded-concurrency executor for running many API calls, optionally with an adaptive
+concurrency limit, a resumable bulk stack transfer that records its progress in an append-only
+journal on local disk, and a tag reconciler that only writes the tags of stacks that differ from
+the desired state.
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .concurrency import AdaptiveConcurrencyLimiter, is_overload_error
+from .exceptions import PulumiAPIError
+from .metrics import MetricsRecorder
+from .models.stack import Stack
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class BulkResult(Generic[T, R]):
+    """Outcome of a single call made by :class:`BulkExecutor`."""
+
+    item: T
+    result: Optional[R] = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the call succeeded."""
+        return self.error is None
+
+
+class BulkExecutor:
+    """Runs a function over many items with a bounded number of calls in flight.
+
+    Items are pulled from the input lazily, so an iterator over a very large listing is never
+    materialized, and results are yielded as they complete. With a limiter, the number of calls in
+    flight follows the limiter's current limit instead of ``max_workers``, and every outcome is
+    reported back to it.
+    """
+
+    def __init__(self, max_workers: int = 4, limiter: Optional[AdaptiveConcurrencyLimiter] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of calls in flight at once (ignored when a limiter is given)
+            limiter: Optional adaptive limit on the number of calls in flight
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.limiter = limiter
+
+    @property
+    def concurrency(self) -> int:
+        """Current maximum number of calls in flight."""
+        return self.limiter.limit if self.limiter is not None else self.max_workers
+
+    def map_unordered(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[BulkResult[T, R]]:
+        """
+        Call ``fn`` for every item and yield the outcomes in completion order.
+
+        Exceptions raised by ``fn`` are captured in the yielded result rather than propagated.
+
+        Args:
+            fn: Function to call for each item
+            items: Items to process
+
+        Yields:
+            One BulkResult per item
+        """
+
+        def timed(item: T) -> BulkResult[T, R]:
+            started = time.monotonic()
+            try:
+                return BulkResult(item, result=fn(item), duration=time.monotonic() - started)
+            except Exception as e:
+                return BulkResult(item, error=e, duration=time.monotonic() - started)
+
+        pending: Set["Future[BulkResult[T, R]]"] = set()
+        iterator = iter(items)
+        exhausted = False
+        limiter = self.limiter
+        threads = limiter.max_limit if limiter is not None else self.max_workers
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            while True:
+                while not exhausted and len(pending) < self.concurrency:
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    # Run each call in a copy of the caller's context so tracing spans nest under it and
+                    # deadlines set by the caller apply
+                    pending.add(executor.submit(contextvars.copy_context().run, timed, item))
+
+                if not pending:
+                    return
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outcome = future.result()
+                    if limiter is not None:
+                        limiter.record(outcome.duration, overloaded=is_overload_error(outcome.error))
+                    yield outcome
+
+
+def describe_error(error: Optional[BaseException]) -> str:
+    """Return a one-line description of an error captured by :class:`BulkExecutor`."""
+    if isinstance(error, PulumiAPIError):
+        return f"{error.message} (Status: {error.status_code})"
+    return str(error)
+
+
+def _stack_key(org_name: str, project_name: str, stack_name: str) -> str:
+    """Return the journal key of a stack."""
+    return f"{org_name}/{project_name}/{stack_name}"
+
+
+class TransferJournal:
+    """Append-only JSON-lines journal of a bulk stack transfer.
+
+    The first record is the transfer plan: the destination organization and every stack to move.
+    Each finished transfer appends a ``transferred`` or ``failed`` record and is flushed to disk
+    immediately, so a restarted job can skip the stacks already moved without listing them again.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Path of the journal file (created on first write)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Return True if the journal already holds a transfer plan."""
+        return self.load()[0] is not None
+
+    def load(self) -> Tuple[Optional[Dict[str, Any]], Set[str], Dict[str, str]]:
+        """
+        Read the journal.
+
+        Returns:
+            Tuple of (plan record or None, keys of transferred stacks, error message per failed stack key)
+        """
+        plan = None
+        transferred: Set[str] = set()
+        failed: Dict[str, str] = {}
+        if not os.path.exists(self.path):
+            return plan, transferred, failed
+
+        with open(self.path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A record cut short by a crash; everything before it is intact
+                    continue
+
+                kind = record.get("type")
+                if kind == "plan":
+                    plan = record
+                elif kind == "transferred":
+                    transferred.add(record["stack"])
+                    failed.pop(record["stack"], None)
+                elif kind == "failed":
+                    failed[record["stack"]] = record.get("error", "")
+
+        return plan, transferred, failed
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a record and flush it to disk."""
+        line = json.dumps({**record, "at": datetime.now(timezone.utc).isoformat()}) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as journal:
+                journal.write(line)
+                journal.flush()
+                os.fsync(journal.fileno())
+
+
+@dataclass
+class TransferProgress:
+    """Progress of a bulk stack transfer."""
+
+    total: int
+    transferred: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    concurrency: int = 0
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of stacks still to process."""
+        return self.total - self.transferred - self.failed - self.skipped
+
+    @property
+    def rate(self) -> float:
+        """Return the number of stacks processed per second in this run."""
+        processed = self.transferred + self.failed
+        return processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Return the estimated number of seconds until the transfer completes."""
+        return self.remaining / self.rate if self.rate > 0 else None
+
+
+@dataclass
+class TransferSummary:
+    """Result of a bulk stack transfer."""
+
+    transferred: List[Stack] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    skipped: int = 0
+    elapsed: float = 0.0
+
+
+def transfer_many(
+    client,
+    new_org_name: str,
+    stacks: Optional[Iterable[Stack]] = None,
+    journal_path: Optional[str] = None,
+    max_workers: int = 4,
+    retry_failed: bool = True,
+    progress_callback: Optional[Callable[[TransferProgress, str, Optional[str]], None]] = None,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+) -> TransferSummary:
+    """
+    Transfer many stacks to a new organization with bounded concurrency.
+
+    See :meth:`pulumi_cloud_client.resources.stacks.StacksResource.transfer_many`.
+    """
+    journal = TransferJournal(journal_path) if journal_path else None
+    plan, done, previously_failed = journal.load() if journal else (None, set(), {})
+
+    planned: List[Tuple[str, str, str]]
+    if plan is not None:
+        if plan["destination"] != new_org_name:
+            raise ValueError(
+                f"Journal {journal_path} transfers stacks to '{plan['destination']}', not '{new_org_name}'"
+            )
+        planned = [(entry[0], entry[1], entry[2]) for entry in plan["stacks"]]
+    elif stacks is not None:
+        planned = [(stack.organization, stack.project, stack.name) for stack in stacks]
+        if journal:
+            journal.append({"type": "plan", "destination": new_org_name, "stacks": planned})
+    else:
+        raise ValueError("stacks must be provided unless resuming from an existing journal")
+
+    pending = []
+    for org_name, project_name, stack_name in planned:
+        key = _stack_key(org_name, project_name, stack_name)
+        if key in done or (not retry_failed and key in previously_failed):
+            continue
+        pending.append((org_name, project_name, stack_name))
+
+    summary = TransferSummary(skipped=len(planned) - len(pending))
+    progress = TransferProgress(total=len(planned), skipped=summary.skipped)
+    started = time.monotonic()
+
+    def transfer(entry: Tuple[str, str, str]) -> Stack:
+        org_name, project_name, stack_name = entry
+        return client.stacks.transfer_stack(org_name, project_name, stack_name, new_org_name)
+
+    executor = BulkExecutor(max_workers, limiter)
+    with _attached(limiter, client):
+        for outcome in executor.map_unordered(transfer, pending):
+            key = _stack_key(*outcome.item)
+            error = None
+            if outcome.ok:
+                summary.transferred.append(cast(Stack, outcome.result))
+                progress.transferred += 1
+                if journal:
+                    journal.append({"type": "transferred", "stack": key})
+            else:
+                error = describe_error(outcome.error)
+                summary.failed[key] = error
+                progress.failed += 1
+                if journal:
+                    journal.append({"type": "failed", "stack": key, "error": error})
+
+            progress.elapsed = time.monotonic() - started
+            progress.concurrency = executor.concurrency
+            if progress_callback:
+                progress_callback(progress, key, error)
+
+    summary.elapsed = time.monotonic() - started
+    return summary
+
+
+@contextlib.contextmanager
+def _attached(limiter: Optional[AdaptiveConcurrencyLimiter], client: Any) -> Iterator[None]:
+    """Let a limiter also see the 429s and 5xx responses retried within each call of a bulk operation."""
+    metrics = getattr(client, "metrics", None)
+    if limiter is not None and isinstance(metrics, MetricsRecorder):
+        limiter.attach(metrics)
+    try:
+        yield
+    finally:
+        if limiter is not None:
+            limiter.detach()
+
+
+# Desired tags of a stack; a None value removes the tag
+DesiredTags = Mapping[str, Optional[str]]
+TagPolicy = Union[Mapping[str, DesiredTags], Callable[[Stack], Optional[DesiredTags]]]
+
+
+@dataclass
+class TagDiff:
+    """Changes needed to bring the tags of a stack to their desired state."""
+
+    added: Dict[str, str] = field(default_factory=dict)
+    changed: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    removed: Dict[str, str] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """Return True if any tag has to change."""
+        return bool(self.added or self.changed or self.removed)
+
+    def apply(self, tags: Mapping[str, str]) -> Dict[str, str]:
+        """Return the tags with the changes applied."""
+        result = {key: value for key, value in tags.items() if key not in self.removed}
+        result.update(self.added)
+        result.update((key, new) for key, (_, new) in self.changed.items())
+        return result
+
+
+def diff_tags(current: Mapping[str, str], desired: DesiredTags, prune: bool = False) -> TagDiff:
+    """
+    Compute the minimal changes from a stack's current tags to its desired tags.
+
+    Args:
+        current: Current tags of the stack
+        desired: Desired tags; a None value removes the tag
+        prune: Also remove tags missing from ``desired``, rather than leaving them as they are
+
+    Returns:
+        The changes, empty if the tags are already as desired
+    """
+    diff = TagDiff()
+    for key, value in desired.items():
+        old = current.get(key)
+        if value is None:
+            if old is not None:
+                diff.removed[key] = old
+        elif old is None:
+            diff.added[key] = value
+        elif old != value:
+            diff.changed[key] = (old, value)
+    if prune:
+        diff.removed.update((key, value) for key, value in current.items() if key not in desired)
+    return diff
+
+
+@dataclass
+class TagUpdateSummary:
+    """Result of a bulk tag reconciliation.
+
+    ``changed`` holds the changes written to (or, in a dry run, needed by) each stack, keyed by
+    its full name; ``fetched`` counts the stacks whose tags had to be read from the API.
+    """
+
+    changed: Dict[str, TagDiff] = field(default_factory=dict)
+    unchanged: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    fetched: int = 0
+    elapsed: float = 0.0
+
+
+def update_tags_many(
+    client,
+    desired: TagPolicy,
+    stacks: Optional[Iterable[Stack]] = None,
+    prune: bool = False,
+    refresh: bool = False,
+    max_workers: int = 4,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    dry_run: bool = False,
+) -> TagUpdateSummary:
+    """
+    Bring the tags of many stacks to their desired state, writing only those that differ.
+
+    See :meth:`pulumi_cloud_client.resources.stacks.StacksResource.update_tags_many`.
+    """
+    targets: Iterable[Tuple[Optional[Stack], str, Optional[DesiredTags]]]
+    if callable(desired):
+        if stacks is None:
+            raise ValueError("stacks must be provided when the desired tags are computed by a function")
+        policy = desired
+        targets = ((stack, stack.full_name, policy(stack)) for stack in stacks)
+    elif stacks is None:
+        targets = ((None, key, tags) for key, tags in desired.items())
+    else:
+        wanted = desired
+        targets = ((stack, stack.full_name, wanted.get(stack.full_name)) for stack in stacks)
+
+    summary = TagUpdateSummary()
+    started = time.monotonic()
+
+    def pending() -> Iterator[Tuple[Optional[Stack], str, DesiredTags, Optional[Mapping[str, str]]]]:
+        # Stacks whose listed tags already match are settled here, without a call or a worker
+        for stack, key, tags in targets:
+            if tags is None:
+                summary.unchanged.append(key)
+                continue
+            current = stack.tags if stack is not None and not refresh else None
+            if current is not None and not diff_tags(current, tags, prune):
+                summary.unchanged.append(key)
+                continue
+            yield stack, key, tags, current
+
+    def reconcile(entry: Tuple[Optional[Stack], str, DesiredTags, Optional[Mapping[str, str]]]) -> Tuple[TagDiff, bool]:
+        stack, key, tags, current = entry
+        org_name, project_name, stack_name = key.split("/", 2)
+        fetched = current is None
+        if current is None:
+            current = client.stacks.list_tags(org_name, project_name, stack_name) or {}
+        diff = diff_tags(current, tags, prune)
+        if diff and not dry_run:
+            # The API replaces every tag of the stack with the ones sent
+            updated = diff.apply(current)
+            client.stacks.update_tags(org_name, project_name, stack_name, updated)
+            if stack is not None:
+                stack.tags = updated
+        return diff, fetched
+
+    executor = BulkExecutor(max_workers, limiter)
+    with _attached(limiter, client):
+        for outcome in executor.map_unordered(reconcile, pending()):
+            key = outcome.item[1]
+            if outcome.result is None:
+                summary.failed[key] = describe_error(outcome.error)
+                continue
+            diff, fetched = outcome.result
+            summary.fetched += fetched
+            if diff:
+                summary.changed[key] = diff
+            else:
+                summary.unchanged.append(key)
+
+    summary.elapsed = time.monotonic() - started
+    return summary
@@ -0,0 +1,226 @@
+"""In-memory response cache for the Pulumi Cloud API client.
+
+Caches parsed GET responses with a per-endpoint TTL and a bounded LRU size. Expired entries that
+carried an ``ETag`` or ``Last-Modified`` header are revalidated with a conditional request, and
+mutating requests invalidate the cached responses they may have changed.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from .routes import endpoint_template
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# Deployment exports can be very large, so they are not cached unless explicitly configured
+DEFAULT_TTLS: Dict[str, float] = {"/api/stacks/{org}/{project}/{stack}/export": 0}
+
+
+@dataclass
+class CacheEntry:
+    """A cached response."""
+
+    value: Any
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def revalidatable(self) -> bool:
+        """Return True if the entry can be revalidated with a conditional request."""
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the headers for a conditional request revalidating this entry."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """Counters describing the effectiveness of a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+def _is_related(cached_path: str, mutated_path: str, sibling_prefix: Optional[str]) -> bool:
+    """Return True if a mutation of ``mutated_path`` may have changed ``cached_path``."""
+    # The resource itself, its sub-resources, and the listings and parents containing it
+    if (
+        cached_path == mutated_path
+        or mutated_path.startswith(cached_path + "/")
+        or cached_path.startswith(mutated_path + "/")
+    ):
+        return True
+    return sibling_prefix is not None and cached_path.startswith(sibling_prefix)
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of parsed GET responses.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 30.0,
+        ttls: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            max_entries: Maximum number of cached responses before the least recently used is evicted
+            default_ttl: Seconds a response stays fresh when its endpoint has no specific TTL
+            ttls: TTL in seconds per endpoint template (e.g. ``/api/stacks/{org}/{project}/{stack}``);
+                a TTL of 0 disables caching for that endpoint
+            clock: Monotonic clock, injectable for tests
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._clock = clock
+
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @staticmethod
+    def key(path: str, params: Optional[Mapping[str, Any]] = None) -> CacheKey:
+        """Return the cache key for a request."""
+        normalized = "/" + path.strip("/")
+        return normalized, tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL in seconds for responses of the endpoint behind ``path``."""
+        return self.ttls.get(endpoint_template(path), self.default_ttl)
+
+    def lookup(self, key: CacheKey) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key of the request
+
+        Returns:
+            Tuple of (entry, fresh); the entry is None on a miss, and stale entries are returned so
+            they can be revalidated
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None, False
+
+            self._entries.move_to_end(key)
+            if entry.expires_at > self._clock():
+                self._stats.hits += 1
+                return entry, True
+
+            if not entry.revalidatable:
+                del self._entries[key]
+            self._stats.misses += 1
+            return entry, False
+
+    def store(self, key: CacheKey, value: Any, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: Cache key of the request
+            value: Parsed response
+            headers: Response headers, used to remember the validators of the response
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return
+
+        headers = headers or {}
+        entry = CacheEntry(
+            value=value,
+            expires_at=self._clock() + ttl,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def revalidated(self, key: CacheKey, entry: CacheEntry) -> Any:
+        """
+        Mark a stale entry as fresh again after the service answered 304 Not Modified.
+
+        Args:
+            key: Cache key of the request
+            entry: The revalidated entry
+
+        Returns:
+            The cached value
+        """
+        with self._lock:
+            entry.expires_at = self._clock() + self.ttl_for(key[0])
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._stats.revalidations += 1
+        return entry.value
+
+    def invalidate(self, path: str) -> int:
+        """
+        Drop cached responses that a mutating request to ``path`` may have changed.
+
+        This covers the resource itself and its sub-resources, the listings and parent resources
+        containing it and, for sub-resources and actions, their sibling sub-resources.
+
+        Args:
+            path: Path of the mutating request
+
+        Returns:
+            Number of invalidated entries
+        """
+        mutated_path = "/" + path.strip("/")
+        # Sub-resources and actions such as /tags or /transfer can also change their siblings,
+        # e.g. a stack's tags and export after it is transferred
+        sibling_prefix = None
+        if not endpoint_template(mutated_path).endswith("}"):
+            sibling_prefix = mutated_path.rsplit("/", 1)[0] + "/"
+
+        with self._lock:
+            stale = [key for key in self._entries if _is_related(key[0], mutated_path, sibling_prefix)]
+            for key in stale:
+                del self._entries[key]
+            self._stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                revalidations=self._stats.revalidations,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                size=len(self._entries),
+            )
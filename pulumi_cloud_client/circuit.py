@@ -0,0 +1,256 @@
+"""Per-endpoint circuit breaking for the Pulumi Cloud API client.
+
+A :class:`CircuitBreaker` tracks the failures of every endpoint template. Once an endpoint keeps
+failing, its circuit opens and calls to it fail fast with
+:class:`~pulumi_cloud_client.exceptions.CircuitOpenError` instead of every caller retrying and
+sleeping against a degraded service. After a recovery period a few probe calls are let through;
+their outcome closes the circuit again or reopens it.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional
+
+from .exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_failure_status(status_code: Optional[int]) -> bool:
+    """Return True if an attempt with this status code (None for a network error) counts as a failure."""
+    return status_code is None or status_code >= 500
+
+
+@dataclass
+class CircuitStatus:
+    """Snapshot of the circuit of one endpoint."""
+
+    state: str
+    consecutive_failures: int
+    failure_rate: float
+    opened: int
+    rejected: int
+    retry_in: Optional[float] = None
+
+
+class _Circuit:
+    """State of one endpoint's circuit (guarded by the breaker's lock)."""
+
+    __slots__ = (
+        "state",
+        "consecutive_failures",
+        "outcomes",
+        "opened_at",
+        "probes",
+        "probe_successes",
+        "opened",
+        "rejected",
+    )
+
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+        self.opened = 0
+        self.rejected = 0
+
+    def failure_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker keyed by endpoint template.
+
+    A closed circuit opens after ``failure_threshold`` consecutive failed attempts or, with
+    ``failure_rate`` set, once that share of the last ``window`` attempts failed. Server errors
+    and network errors count as failures; other responses, including 4xx errors, show the
+    service is answering and count as successes. An open circuit rejects calls for
+    ``recovery_time`` seconds, then turns half-open and lets up to ``half_open_calls`` probes
+    through at a time: ``success_threshold`` successful probes close it, a failed one reopens it.
+
+    Pass one to ``PulumiClient(circuit_breaker=...)``; a breaker may be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        failure_rate: Optional[float] = None,
+        window: int = 20,
+        recovery_time: float = 30.0,
+        half_open_calls: int = 1,
+        success_threshold: int = 1,
+        on_state_change: Optional[Callable[[str, str, str], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Number of consecutive failed attempts that opens a circuit
+            failure_rate: Optional share of failed attempts in the window that opens a circuit
+            window: Number of recent attempts the failure rate is computed over; the rate is
+                only checked once the window is full
+            recovery_time: Seconds an open circuit rejects calls before letting probes through
+            half_open_calls: Maximum number of probe calls in flight while half-open
+            success_threshold: Number of successful probes that close a half-open circuit
+            on_state_change: Called with the endpoint template, the old state and the new state
+                whenever a circuit changes state
+            clock: Monotonic clock, injectable for tests
+        """
+        if failure_threshold < 1 or half_open_calls < 1 or success_threshold < 1:
+            raise ValueError("failure_threshold, half_open_calls and success_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.failure_rate = failure_rate
+        self.window = window
+        self.recovery_time = recovery_time
+        self.half_open_calls = half_open_calls
+        self.success_threshold = success_threshold
+        self.on_state_change = on_state_change
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        """Return the circuit of an endpoint, creating it on first use (call with the lock held)."""
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit(self.window)
+        return circuit
+
+    def _transition(self, endpoint: str, circuit: _Circuit, state: str) -> Optional[Callable[[], None]]:
+        """Move a circuit to a new state, returning the notification to send once the lock is released."""
+        previous, circuit.state = circuit.state, state
+        if state == OPEN:
+            circuit.opened_at = self._clock()
+            circuit.opened += 1
+        if state != CLOSED:
+            circuit.probes = circuit.probe_successes = 0
+        else:
+            circuit.consecutive_failures = 0
+            circuit.outcomes.clear()
+
+        callback = self.on_state_change
+        if callback is None:
+            return None
+        return lambda: callback(endpoint, previous, state)
+
+    def before_call(self, endpoint: str) -> None:
+        """
+        Check that an attempt may be sent to an endpoint.
+
+        Args:
+            endpoint: Endpoint template
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open, or half-open with all probes in flight
+        """
+        notify = None
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self.recovery_time - self._clock()
+                if retry_in > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(endpoint, retry_in)
+                notify = self._transition(endpoint, circuit, HALF_OPEN)
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.half_open_calls:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(endpoint, 0.0)
+                circuit.probes += 1
+        if notify is not None:
+            notify()
+
+    def release(self, endpoint: str) -> None:
+        """
+        Give back the probe slot taken by :meth:`before_call` for an attempt that produced no outcome.
+
+        Call it instead of :meth:`record` when an attempt was abandoned before a response or a
+        network error, e.g. because the caller was cancelled, so a half-open circuit keeps letting
+        probes through.
+
+        Args:
+            endpoint: Endpoint template
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+
+    def record(self, endpoint: str, status_code: Optional[int]) -> None:
+        """
+        Record the outcome of an attempt let through by :meth:`before_call`.
+
+        Args:
+            endpoint: Endpoint template
+            status_code: Response status code, or None if no response arrived
+        """
+        failed = is_failure_status(status_code)
+        notify = None
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+                if failed:
+                    notify = self._transition(endpoint, circuit, OPEN)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.success_threshold:
+                        notify = self._transition(endpoint, circuit, CLOSED)
+            elif circuit.state == CLOSED:
+                circuit.outcomes.append(not failed)
+                circuit.consecutive_failures = circuit.consecutive_failures + 1 if failed else 0
+                if failed and self._should_open(circuit):
+                    notify = self._transition(endpoint, circuit, OPEN)
+        if notify is not None:
+            notify()
+
+    def _should_open(self, circuit: _Circuit) -> bool:
+        if circuit.consecutive_failures >= self.failure_threshold:
+            return True
+        window_full = len(circuit.outcomes) == self.window
+        return self.failure_rate is not None and window_full and circuit.failure_rate() >= self.failure_rate
+
+    def state(self, endpoint: str) -> str:
+        """Return the state of an endpoint's circuit: ``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return circuit.state if circuit is not None else CLOSED
+
+    def snapshot(self) -> Dict[str, CircuitStatus]:
+        """
+        Return the status of every circuit.
+
+        Returns:
+            Circuit status keyed by endpoint template
+        """
+        now = self._clock()
+        with self._lock:
+            return {
+                endpoint: CircuitStatus(
+                    circuit.state,
+                    circuit.consecutive_failures,
+                    circuit.failure_rate(),
+                    circuit.opened,
+                    circuit.rejected,
+                    max(circuit.opened_at + self.recovery_time - now, 0.0) if circuit.state == OPEN else None,
+                )
+                for endpoint, circuit in sorted(self._circuits.items())
+            }
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """Close one endpoint's circuit, or every circuit, forgetting past failures."""
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint, None)
@@ -3,13 +3,27 @@
 This module provides the main client interface for accessing Pulumi Cloud resources.
 """
 
-import json
+import threading
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from pulumi_cloud_client.exceptions import PulumiAPIError
+from pulumi_cloud_client.cache import ResponseCache
+from pulumi_cloud_client.circuit import CLOSED, CircuitBreaker
+from pulumi_cloud_client.codec import JSONCodec, default_codec
+from pulumi_cloud_client.exceptions import CircuitOpenError, DeadlineExceededError, PulumiAPIError
+from pulumi_cloud_client.hedging import HedgingPolicy
+from pulumi_cloud_client.metrics import MetricsRecorder
+from pulumi_cloud_client.ratelimit import RateLimiter
+from pulumi_cloud_client.retry import RetryBudget, backoff_delay, current_deadline
+from pulumi_cloud_client.retry import deadline as deadline_scope
+from pulumi_cloud_client.retry import is_retryable_status, retry_after_seconds
+from pulumi_cloud_client.routes import endpoint_template
+from pulumi_cloud_client.singleflight import SingleFlight
+from pulumi_cloud_client.tracing import Tracer
 
 from .resources.organizations import OrganizationsResource
 from .resources.policies import PoliciesResource
@@ -17,6 +31,39 @@ from .resources.projects import ProjectsResource
 from .resources.stacks import StacksResource
 
 
+def _response_size(response: requests.Response, stream: bool) -> int:
+    """Return the size of a response body without reading a streamed body."""
+    if not stream:
+        return len(response.content)
+    try:
+        return int(response.headers.get("Content-Length", 0))
+    except ValueError:
+        return 0
+
+
+def _trace_attempt(
+    tracer: Tracer,
+    number: int,
+    queued: Optional[float],
+    attempt_started: float,
+    responded: Optional[float],
+    decode_started: Optional[float],
+    response: Optional[requests.Response],
+    error: Optional[BaseException] = None,
+) -> None:
+    """Record the span of one request attempt, with its queueing, network and decode phases."""
+    ended = time.monotonic()
+    attempt = tracer.start_span("attempt", started=queued if queued is not None else attempt_started, attempt=number)
+    if response is not None:
+        attempt.set_attribute("status_code", response.status_code)
+    if queued is not None:
+        tracer.record("queue", queued, attempt_started, parent=attempt)
+    tracer.record("network", attempt_started, responded if responded is not None else ended, parent=attempt)
+    if decode_started is not None:
+        tracer.record("decode", decode_started, ended, parent=attempt)
+    tracer.finish(attempt, ended, error)
+
+
 class PulumiClient:
     """Client for the Pulumi Service Admin API."""
 
@@ -27,6 +74,22 @@ class PulumiClient:
         timeout: int = 30,
         max_retries: int = 3,
         retry_delay: int = 1,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        session_strategy: str = "shared",
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        codec: Optional[JSONCodec] = None,
+        metrics: Optional[MetricsRecorder] = None,
+        tracer: Optional[Tracer] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_retry_delay: float = 30.0,
+        deadline: Optional[float] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hedging: Optional[HedgingPolicy] = None,
     ):
         """
         Initialize the Pulumi API client.
@@ -34,44 +97,205 @@ class PulumiClient:
         Args:
             access_token: The API access token for authentication
             base_url: Base URL for the Pulumi API (defaults to https://api.pulumi.com)
-            timeout: Request timeout in seconds
+            timeout: Timeout of each attempt in seconds
             max_retries: Maximum number of retry attempts for recoverable errors
-            retry_delay: Initial delay between retries in seconds (increases exponentially)
+            retry_delay: Initial delay between retries in seconds; it doubles after each retry up to
+                ``max_retry_delay``, and each sleep is drawn at random below it
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum number of connections kept open per host; size this to the
+                number of threads sharing the client so connections are reused rather than rebuilt
+            pool_block: Block callers when all pooled connections are busy instead of opening
+                short-lived extra connections
+            keep_alive: Keep connections open between requests
+            session_strategy: "shared" to use one thread-safe connection pool for all threads, or
+                "per_thread" to give every thread its own session and pool
+            rate_limiter: Optional token bucket shared by every thread using this client (or by
+                several clients); it adapts to the service's rate-limit headers
+            cache: Optional cache for GET responses; mutating requests invalidate the entries they touch
+            coalesce_requests: Share one network call between threads issuing the same GET request at
+                the same time; every waiter receives the same (read-only) result or exception
+            codec: JSON codec for request and response bodies; defaults to orjson when it is installed
+                and the standard library otherwise
+            metrics: Optional recorder of latency, retry, status code, payload size and decode time
+                metrics per endpoint template
+            tracer: Optional tracer recording spans for every request, retry attempt and backoff sleep,
+                and for the resource method calls that issue them
+            circuit_breaker: Optional per-endpoint circuit breaker; while an endpoint's circuit is open,
+                calls to it raise CircuitOpenError at once instead of being sent and retried
+            max_retry_delay: Upper bound of the delay between retries in seconds
+            deadline: Optional time budget of each call in seconds, covering every attempt and
+                backoff sleep; calls that cannot complete in time raise DeadlineExceededError
+            retry_budget: Optional budget capping retries as a share of calls, shared by every
+                thread using this client (or by several clients), so a degraded API is not hit
+                with several times its normal load
+            hedging: Optional policy sending a second copy of GET requests not answered within a
+                latency percentile of their endpoint, using whichever response arrives first
         """
+        if session_strategy not in ("shared", "per_thread"):
+            raise ValueError("session_strategy must be 'shared' or 'per_thread'")
+
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.session_strategy = session_strategy
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.codec = codec if codec is not None else default_codec()
+        self.metrics = metrics
+        self.tracer = tracer
+        self.circuit_breaker = circuit_breaker
+        self.max_retry_delay = max_retry_delay
+        self.deadline = deadline
+        self.retry_budget = retry_budget
+        self.hedging = hedging
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_executor_lock = threading.Lock()
+
+        self.headers = {
+            "Authorization": f"token {access_token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        self._local = threading.local()
+        self.session = self._create_session()
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"token {access_token}",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-        )
         self.stacks = StacksResource(self)
         self.projects = ProjectsResource(self)
         self.organizations = OrganizationsResource(self)
         self.policies = PoliciesResource(self)
 
-    def _handle_response(self, response: requests.Response) -> Any:
-        """Process API response and handle errors."""
+    def __enter__(self) -> "PulumiClient":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close all pooled connections on exit."""
+        self.close()
+
+    def _create_session(self) -> requests.Session:
+        """Create a session with the configured connection pool."""
+        session = requests.Session()
+        session.headers.update(self.headers)
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        with self._sessions_lock:
+            self._sessions.append(session)
+        return session
+
+    def _get_session(self) -> requests.Session:
+        """Return the session to use from the calling thread."""
+        if self.session_strategy == "shared":
+            return self.session
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._create_session()
+        return session
+
+    def warmup(self, connections: Optional[int] = None) -> int:
+        """
+        Open pooled connections ahead of a burst of requests.
+
+        Connections are opened concurrently and returned to the pool of the calling thread's
+        session, so subsequent requests skip the TCP and TLS handshakes.
+
+        Args:
+            connections: Number of connections to open (defaults to, and is capped at, pool_maxsize)
+
+        Returns:
+            Number of connections successfully opened
+        """
+        count = min(connections or self.pool_maxsize, self.pool_maxsize)
+        session = self._get_session()
+        barrier = threading.Barrier(count)
+
+        def open_connection() -> bool:
+            try:
+                # Stream the response so the connection stays checked out until every worker has
+                # one, forcing distinct connections rather than reusing the first one to finish
+                response = session.head(f"{self.base_url}/", timeout=self.timeout, stream=True)
+            except requests.RequestException:
+                barrier.abort()
+                return False
+            try:
+                barrier.wait(timeout=self.timeout)
+            except threading.BrokenBarrierError:
+                pass
+            # Reading the (empty) body releases the connection back to the pool
+            response.content
+            return True
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            results = list(executor.map(lambda _: open_connection(), range(count)))
+        return sum(results)
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Return connection reuse counters across all sessions created by this client.
+
+        Returns:
+            Dictionary with the number of connections opened and requests sent over them
+        """
+        stats = {"connections_opened": 0, "requests": 0}
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                if not isinstance(adapter, HTTPAdapter):
+                    continue
+                for key in adapter.poolmanager.pools.keys():
+                    pool = adapter.poolmanager.pools[key]
+                    stats["connections_opened"] += pool.num_connections
+                    stats["requests"] += pool.num_requests
+        return stats
+
+    def close(self) -> None:
+        """Close all sessions and their pooled connections."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        with self._hedge_executor_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _handle_response(self, response: requests.Response, raw: bool = False) -> Any:
+        """Process API response and handle errors, returning the body undecoded if ``raw`` is set."""
         try:
             response.raise_for_status()
+            if raw:
+                return response.content
             if response.content:
-                return response.json()
+                return self.codec.loads(response.content)
             return None
         except requests.HTTPError:
             error_data = None
             error_message = response.reason
 
             try:
-                error_data = response.json()
+                error_data = self.codec.loads(response.content)
                 if isinstance(error_data, dict) and "message" in error_data:
                     error_message = error_data["message"]
-            except (json.JSONDecodeError, ValueError):
+            except ValueError:
                 # Only catch JSON parsing errors, not all exceptions
                 pass
 
@@ -79,6 +303,7 @@ class PulumiClient:
                 status_code=response.status_code,
                 message=error_message,
                 response_data=error_data,
+                headers=response.headers,
             )
 
     def _make_request(
@@ -87,6 +312,7 @@ class PulumiClient:
         path: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
     ) -> Any:
         """
         Send a request to the Pulumi API with retry logic.
@@ -96,49 +322,341 @@ class PulumiClient:
             path: API endpoint path
             params: URL parameters to include
             data: JSON body data
+            raw: Return the response body as undecoded bytes; raw GETs bypass the response cache
+                and request coalescing
 
         Returns:
-            Parsed API response
+            Parsed API response, or the response body if ``raw`` is set
+        """
+        if self.tracer is None:
+            return self._dispatch(method, path, params, data, raw)
+        with self.tracer.span("request", method=method.upper(), path=path, endpoint=endpoint_template(path)):
+            return self._dispatch(method, path, params, data, raw)
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        raw: bool,
+    ) -> Any:
+        """Route a request through request coalescing, the response cache and the retry loop."""
+        if method == "get" and data is None:
+            if raw:
+                return self._send(method, path, params, raw=True)[1]
+            if self.single_flight is not None:
+                return self.single_flight.do(
+                    ResponseCache.key(path, params),
+                    lambda: self._get(path, params),
+                    deadline=current_deadline(self.deadline),
+                    endpoint=endpoint_template(path),
+                )
+            return self._get(path, params)
+
+        if self.cache is None:
+            return self._send(method, path, params, data, raw=raw)[1]
+
+        try:
+            return self._send(method, path, params, data, raw=raw)[1]
+        finally:
+            # Even a failed mutation may have been applied, so never keep serving the old state
+            self.cache.invalidate(path)
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]]) -> Any:
+        """Send a GET request, going through the response cache if one is configured."""
+        if self.cache is not None:
+            return self._cached_get(self.cache, path, params)
+        return self._send("get", path, params)[1]
+
+    def _cached_get(self, cache: ResponseCache, path: str, params: Optional[Dict[str, Any]]) -> Any:
+        """Serve a GET request from the response cache, revalidating stale entries."""
+        key = cache.key(path, params)
+        entry, fresh = cache.lookup(key)
+        if entry is not None and fresh:
+            return entry.value
+
+        headers = entry.conditional_headers() if entry is not None else None
+        response, result = self._send("get", path, params, headers=headers)
+        if entry is not None and response.status_code == 304:
+            return cache.revalidated(key, entry)
+
+        cache.store(key, result, response.headers)
+        return result
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Tuple[requests.Response, Any]:
+        """
+        Send a request, retrying recoverable errors.
+
+        Args:
+            method: HTTP method (get, post, put, patch, delete)
+            path: API endpoint path
+            params: URL parameters to include
+            data: JSON body data
+            headers: Additional request headers
+            stream: Leave the body of a successful response unread (the parsed response is then None)
+            raw: Return the response body as undecoded bytes instead of parsing it
+
+        Returns:
+            Tuple of (final response, parsed API response)
         """
         url = f"{self.base_url}/{path.lstrip('/')}"
+        body = self.codec.dumps(data) if data is not None else None
+        metrics = self.metrics
+        breaker = self.circuit_breaker
+        hedging = self.hedging
+        templated = metrics is not None or breaker is not None or hedging is not None
+        endpoint = endpoint_template(path) if templated else path
+        if hedging is not None and (method != "get" or stream or not hedging.applies(endpoint)):
+            # Only GETs are idempotent, so only they may be sent twice when the first copy is slow
+            hedging = None
+        if hedging is not None:
+            # Every exchange of a hedged call passes the circuit breaker and records its outcome
+            # on its own, see _hedged_request
+            breaker = None
+        tracer = self.tracer
+        budget = self.retry_budget
+        started = time.monotonic()
+        expires = current_deadline(self.deadline)
+        if budget is not None:
+            budget.record_request()
 
         retries = 0
-        delay = self.retry_delay
 
         while True:
+            queued = None
+            admitted = True
+            if self.rate_limiter is not None:
+                queued = time.monotonic()
+                # Never sleep for a slot the deadline leaves no time to use
+                max_wait = expires - queued if expires is not None else None
+                admitted = self.rate_limiter.acquire(max_wait=max_wait) is not None
+
+            timeout: float = self.timeout
+            if expires is not None:
+                remaining = expires - time.monotonic()
+                if remaining <= 0 or not admitted:
+                    if metrics is not None:
+                        metrics.record_request(endpoint, time.monotonic() - started, retries, ok=False)
+                    raise DeadlineExceededError(endpoint, retries, time.monotonic() - started)
+                timeout = min(timeout, remaining)
+
+            # Only ask the breaker once the attempt is about to be sent, so a half-open probe slot
+            # is never held by a call still waiting for the limiter
+            if breaker is not None:
+                try:
+                    breaker.before_call(endpoint)
+                except CircuitOpenError:
+                    # Fail fast, even part way through the retries of this call
+                    if metrics is not None:
+                        metrics.record_request(endpoint, time.monotonic() - started, retries, ok=False)
+                    raise
+
+            attempt_started = time.monotonic()
+            response = None
+            responded = decode_started = None
             try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=data,
-                    timeout=self.timeout,
-                )
-                return self._handle_response(response)
+                if hedging is not None:
+                    response = self._hedged_request(hedging, endpoint, expires, url, params, body, headers)
+                else:
+                    response = self._get_session().request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        data=body,
+                        headers=headers,
+                        timeout=timeout,
+                        stream=stream,
+                    )
+                responded = time.monotonic()
+                if breaker is not None:
+                    breaker.record(endpoint, response.status_code)
+                if metrics is not None:
+                    metrics.record_attempt(
+                        endpoint,
+                        response.status_code,
+                        responded - attempt_started,
+                        len(body or b""),
+                        _response_size(response, stream),
+                    )
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update_from_headers(response.headers)
+
+                if stream and response.ok:
+                    result = None
+                else:
+                    decode_started = time.monotonic()
+                    result = self._handle_response(response, raw)
+                    if metrics is not None:
+                        metrics.record_decode(endpoint, time.monotonic() - decode_started)
+
+                if tracer is not None:
+                    _trace_attempt(tracer, retries + 1, queued, attempt_started, responded, decode_started, response)
+                if metrics is not None:
+                    metrics.record_request(endpoint, time.monotonic() - started, retries + 1, ok=True)
+                return response, result
+            except CircuitOpenError:
+                # Only raised here by a hedged exchange; fail fast as when the breaker is asked above
+                if metrics is not None:
+                    metrics.record_request(endpoint, time.monotonic() - started, retries, ok=False)
+                raise
             except (requests.RequestException, PulumiAPIError) as e:
+                if tracer is not None:
+                    _trace_attempt(tracer, retries + 1, queued, attempt_started, responded, decode_started, response, e)
+                if response is None:
+                    if breaker is not None:
+                        breaker.record(endpoint, None)
+                    if metrics is not None:
+                        metrics.record_attempt(endpoint, None, time.monotonic() - attempt_started, len(body or b""))
                 retries += 1
 
-                # Determine if error is retryable
-                retryable = False
-                if isinstance(e, requests.RequestException):
-                    # Network errors are retryable
-                    retryable = True
-                elif isinstance(e, PulumiAPIError) and e.status_code in (
-                    429,
-                    500,
-                    502,
-                    503,
-                    504,
-                ):
-                    # Rate limits and server errors are retryable
-                    retryable = True
+                # Network errors are retryable, API errors depend on the status code
+                retryable = isinstance(e, requests.RequestException) or is_retryable_status(e.status_code)
 
                 if not retryable or retries > self.max_retries:
+                    if metrics is not None:
+                        metrics.record_request(endpoint, time.monotonic() - started, retries, ok=False)
+                    raise
+
+                wait = backoff_delay(self.retry_delay, retries, self.max_retry_delay)
+                if isinstance(e, PulumiAPIError) and e.status_code == 429:
+                    wait = self._rate_limited_wait(e, wait)
+
+                # Give up now rather than sleep past the deadline, and stop amplifying load once
+                # the budget shows most calls are being retried
+                out_of_time = expires is not None and time.monotonic() + wait >= expires
+                if out_of_time or (budget is not None and not budget.try_retry()):
+                    if metrics is not None:
+                        metrics.record_request(endpoint, time.monotonic() - started, retries, ok=False)
+                    if out_of_time:
+                        raise DeadlineExceededError(endpoint, retries, time.monotonic() - started) from e
                     raise
 
-                # Exponential backoff with jitter
-                time.sleep(delay * (0.9 + 0.2 * (retries / self.max_retries)))
-                delay *= 2
+                if metrics is not None:
+                    metrics.record_backoff(endpoint, wait)
+                backoff_started = time.monotonic()
+                time.sleep(wait)
+                if tracer is not None:
+                    tracer.record("backoff", backoff_started, time.monotonic(), seconds=wait)
+            except BaseException:
+                # Interrupted before any outcome, e.g. by KeyboardInterrupt: give back a half-open
+                # probe slot, or the circuit would reject every later call
+                if response is None and breaker is not None:
+                    breaker.release(endpoint)
+                raise
+
+    def _hedged_request(
+        self,
+        hedging: HedgingPolicy,
+        endpoint: str,
+        expires: Optional[float],
+        url: str,
+        params: Optional[Dict[str, Any]],
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+    ) -> requests.Response:
+        """
+        Send a GET request through the hedging policy, returning the first response to arrive.
+
+        The caller has already waited for the rate limiter for the original exchange. Hedges are
+        only sent if the limiter has a token at hand and the endpoint's circuit is closed. Every
+        exchange checks the deadline and the circuit breaker before it is sent, like an attempt
+        of :meth:`_send`, and records its outcome on the breaker.
+        """
+        metrics = self.metrics
+        breaker = self.circuit_breaker
+        limiter = self.rate_limiter
+
+        def send() -> requests.Response:
+            # Hedges start later, so their timeout is taken from the deadline when they are sent
+            timeout: float = self.timeout
+            if expires is not None:
+                remaining = expires - time.monotonic()
+                if remaining <= 0:
+                    raise requests.Timeout(f"Deadline passed before a request to {endpoint} was sent")
+                timeout = min(timeout, remaining)
+            if breaker is not None:
+                breaker.before_call(endpoint)
+            try:
+                response = self._get_session().request(
+                    method="get", url=url, params=params, data=body, headers=headers, timeout=timeout
+                )
+            except requests.RequestException:
+                if breaker is not None:
+                    breaker.record(endpoint, None)
+                raise
+            except BaseException:
+                if breaker is not None:
+                    breaker.release(endpoint)
+                raise
+            if breaker is not None:
+                breaker.record(endpoint, response.status_code)
+            return response
+
+        def admit() -> bool:
+            # Never wait for a hedge, and send none during a 429 pause or while the circuit recovers
+            if breaker is not None and breaker.state(endpoint) != CLOSED:
+                return False
+            return limiter is None or limiter.try_reserve(0.0) is not None
+
+        def on_hedge(delay: float, won: bool) -> None:
+            if metrics is not None:
+                metrics.record_hedge(endpoint, delay, won)
+
+        executor = self._get_hedge_executor(hedging)
+        try:
+            return hedging.run(
+                executor, endpoint, send, requests.Response.close, on_hedge, admit=admit, deadline=expires
+            )
+        except TimeoutError as e:
+            raise requests.Timeout(str(e)) from e
+
+    def _get_hedge_executor(self, hedging: HedgingPolicy) -> ThreadPoolExecutor:
+        """Return the thread pool sending hedged requests, creating it on first use."""
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None:
+                # Enough threads for every pooled connection to carry a call and its hedges, so
+                # hedged calls are not held to fewer concurrent requests than the session allows
+                workers = hedging.max_workers or self.pool_maxsize * (hedging.max_hedges + 1)
+                self._hedge_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pulumi-hedge")
+            return self._hedge_executor
+
+    def _stream_request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Send a request and return the response with its body still unread.
+
+        Retries apply until a successful response arrives; the caller reads the body incrementally
+        (e.g. with ``iter_content``) and must close the response.
+
+        Args:
+            method: HTTP method (get, post, put, patch, delete)
+            path: API endpoint path
+            params: URL parameters to include
+
+        Returns:
+            The streamed response
+        """
+        return self._send(method, path, params, stream=True)[0]
+
+    def _rate_limited_wait(self, error: PulumiAPIError, backoff: float) -> float:
+        """Return how long to sleep after a 429, honoring the Retry-After header."""
+        retry_after = retry_after_seconds(error.headers)
+        if self.rate_limiter is None:
+            return retry_after if retry_after is not None else backoff
+
+        # The shared limiter holds back every caller, this one waits in acquire() before retrying
+        if retry_after is None:
+            self.rate_limiter.pause(backoff)
+        return 0
 
     # General purpose request method
     def request(
@@ -147,6 +665,8 @@ class PulumiClient:
         path: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        deadline: Optional[float] = None,
     ) -> Any:
         """
         Make a custom API request for endpoints not explicitly covered.
@@ -156,8 +676,15 @@ class PulumiClient:
             path: API endpoint path
             params: URL parameters to include
             data: JSON body data
+            raw: Return the response body as undecoded bytes, e.g. to save it without a decode and
+                re-encode; wrap it in ``memoryview`` to slice it without copying
+            deadline: Optional time budget of this call in seconds, covering every attempt and
+                backoff sleep
 
         Returns:
-            Parsed API response
+            Parsed API response, or the response body if ``raw`` is set
         """
-        return self._make_request(method.lower(), path, params, data)
+        if deadline is None:
+            return self._make_request(method.lower(), path, params, data, raw=raw)
+        with deadline_scope(deadline):
+            return self._make_request(method.lower(), path, params, data, raw=raw)
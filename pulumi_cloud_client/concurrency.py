@@ -0,0 +1,178 @@
+"""Adaptive concurrency limiting for bulk operations.
+
+An :class:`AdaptiveConcurrencyLimiter` decides how many calls a
+:class:`~pulumi_cloud_client.bulk.BulkExecutor` keeps in flight. It raises the limit additively
+while latency stays near its baseline, and cuts it multiplicatively on rate limiting, server
+errors, network errors or latency spikes (AIMD), so long-running jobs settle close to the
+concurrency the service can sustain without picking a worker count by hand.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+
+from .exceptions import CircuitOpenError, DeadlineExceededError, PulumiAPIError
+from .metrics import MetricEvent, MetricsRecorder
+from .retry import is_retryable_status
+
+
+def is_overload_error(error: Optional[BaseException]) -> bool:
+    """Return True if an error suggests the service is overloaded (429, 5xx or a network error).
+
+    Open circuits and exceeded deadlines carry 503 and 504 but are raised by the client itself,
+    so they are not overload signals.
+    """
+    if isinstance(error, (CircuitOpenError, DeadlineExceededError)):
+        return False
+    if isinstance(error, PulumiAPIError):
+        return is_retryable_status(error.status_code)
+    return isinstance(error, requests.RequestException)
+
+
+@dataclass
+class ConcurrencyStats:
+    """Snapshot of an adaptive concurrency limiter."""
+
+    limit: int
+    baseline_latency: Optional[float]
+    smoothed_latency: Optional[float]
+    increases: int
+    decreases: int
+
+
+class AdaptiveConcurrencyLimiter:
+    """Thread-safe AIMD concurrency limit driven by call latencies and overload signals.
+
+    Every completed call reports its latency. The limit grows by ``increase`` per window of
+    ``limit`` calls while the smoothed latency stays within ``latency_tolerance`` times its
+    baseline, i.e. the lowest smoothed latency seen recently. The baseline drifts up slowly, so
+    it follows lasting changes in the service's speed. An overload cuts the limit to
+    ``backoff`` times its value, and a latency spike to ``latency_backoff`` times; after a cut,
+    further cuts wait for a window of calls, since the calls already in flight were sent at the
+    old limit.
+
+    Attach the limiter to a client's :class:`~pulumi_cloud_client.metrics.MetricsRecorder` to
+    also react to 429 and 5xx responses that the client retries before the call completes.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_backoff: float = 0.8,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        baseline_drift: float = 0.001,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Initial concurrency limit
+            min_limit: Lowest concurrency limit
+            max_limit: Highest concurrency limit
+            increase: Amount the limit grows by per window of successful calls
+            backoff: Factor applied to the limit on 429s, 5xx responses and network errors
+            latency_backoff: Factor applied to the limit on latency spikes
+            latency_tolerance: Ratio of smoothed latency to baseline latency counted as a spike
+            smoothing: Weight of each new latency in the smoothed latency
+            baseline_drift: Relative amount the baseline latency rises per call
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial <= max_limit")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_backoff = latency_backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.baseline_drift = baseline_drift
+
+        self._lock = threading.Lock()
+        self._limit = float(initial)
+        self._baseline: Optional[float] = None
+        self._smoothed: Optional[float] = None
+        self._since_decrease = 0
+        self._increases = 0
+        self._decreases = 0
+        self._metrics: Optional[MetricsRecorder] = None
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    def record(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Report a completed call.
+
+        Args:
+            latency: Duration of the call in seconds
+            overloaded: Whether the call failed because the service is overloaded
+        """
+        with self._lock:
+            self._since_decrease += 1
+            if overloaded:
+                self._decrease(self.backoff)
+                return
+
+            smoothed = (
+                latency if self._smoothed is None else self._smoothed + self.smoothing * (latency - self._smoothed)
+            )
+            self._smoothed = smoothed
+            if self._baseline is None or smoothed < self._baseline:
+                self._baseline = smoothed
+            else:
+                self._baseline *= 1 + self.baseline_drift
+
+            if smoothed > self._baseline * self.latency_tolerance:
+                self._decrease(self.latency_backoff)
+            elif self._limit < self.max_limit:
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+                self._increases += 1
+
+    def record_overload(self) -> None:
+        """Report a rate-limited or failed attempt of a call that is still in flight."""
+        with self._lock:
+            self._decrease(self.backoff)
+
+    def _decrease(self, factor: float) -> None:
+        """Cut the limit, at most once per window of calls (call with the lock held)."""
+        if self._decreases and self._since_decrease < self._limit:
+            return
+        self._limit = max(float(self.min_limit), self._limit * factor)
+        self._since_decrease = 0
+        self._decreases += 1
+
+    def attach(self, metrics: MetricsRecorder) -> None:
+        """
+        React to the attempts recorded by a client's metrics recorder.
+
+        Args:
+            metrics: Recorder of the client making the calls
+        """
+        self.detach()
+        metrics.add_listener(self._on_metric)
+        self._metrics = metrics
+
+    def detach(self) -> None:
+        """Stop listening to the metrics recorder passed to :meth:`attach`."""
+        if self._metrics is not None:
+            self._metrics.remove_listener(self._on_metric)
+            self._metrics = None
+
+    def _on_metric(self, event: MetricEvent) -> None:
+        if event.kind == "attempt" and (event.status_code is None or is_retryable_status(event.status_code)):
+            self.record_overload()
+
+    def stats(self) -> ConcurrencyStats:
+        """Return a snapshot of the limiter, e.g. for progress reporting."""
+        with self._lock:
+            return ConcurrencyStats(self.limit, self._baseline, self._smoothed, self._increases, self._decreases)
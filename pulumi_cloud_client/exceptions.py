@@ -1,11 +1,46 @@
-from typing import Any
+from typing import Any, Mapping, Optional
 
 
 class PulumiAPIError(Exception):
     """Exception raised for Pulumi API errors."""
 
-    def __init__(self, status_code: int, message: str, response_data: Any = None):
+    def __init__(
+        self,
+        status_code: int,
+        message: str,
+        response_data: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
         self.status_code = status_code
         self.message = message
         self.response_data = response_data
+        self.headers = headers
         super().__init__(f"Pulumi API Error ({status_code}): {message}")
+
+
+class CircuitOpenError(PulumiAPIError):
+    """Exception raised without contacting the API when the circuit breaker of an endpoint is open.
+
+    It carries a 503 status code, so callers handling unavailable services treat it alike, but
+    the client never retries it.
+    """
+
+    def __init__(self, endpoint: str, retry_in: float):
+        """Initialize the error with the endpoint template and the seconds until probes are let through."""
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(503, f"Circuit open for {endpoint}, retry in {retry_in:.1f}s")
+
+
+class DeadlineExceededError(PulumiAPIError):
+    """Exception raised when a call cannot complete, or retry, before its deadline.
+
+    It carries a 504 status code. The error of the last attempt, if any, is its ``__cause__``.
+    """
+
+    def __init__(self, endpoint: str, attempts: int, elapsed: float):
+        """Initialize the error with the endpoint template, the attempts made and the seconds spent."""
+        self.endpoint = endpoint
+        self.attempts = attempts
+        self.elapsed = elapsed
+        super().__init__(504, f"Deadline exceeded for {endpoint} after {attempts} attempts in {elapsed:.1f}s")
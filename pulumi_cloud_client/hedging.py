@@ -0,0 +1,257 @@
+"""Request hedging for idempotent GET requests.
+
+With a :class:`HedgingPolicy`, :class:`~pulumi_cloud_client.client.PulumiClient` sends a second
+copy of a GET request when the first has not been answered within a high percentile of the
+endpoint's recent latency. The first response to arrive is used and the other is discarded, so
+the few slow responses no longer decide how long a page waiting on hundreds of calls takes. A
+budget keeps hedges to a small share of calls, so a slow API does not receive twice the load.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
+from typing import Callable, Collection, Dict, List, Optional, Set, TypeVar
+
+from .metrics import Histogram
+from .retry import RetryBudget
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgingStats:
+    """Counters of a hedging policy."""
+
+    calls: int
+    hedges: int
+    wins: int
+    refused: int
+
+
+class _Latency:
+    """Recent exchange latencies of one endpoint (guarded by the policy's lock).
+
+    Once ``current`` holds a full window of samples it becomes ``previous`` and a new window
+    starts, so the delay follows changes in the endpoint's latency.
+    """
+
+    __slots__ = ("current", "previous")
+
+    def __init__(self) -> None:
+        self.current = Histogram()
+        self.previous: Optional[Histogram] = None
+
+
+class HedgingPolicy:
+    """Decides when to hedge GET requests and runs hedged exchanges.
+
+    A call waits ``quantile`` of the endpoint's recent latency (or ``fallback_delay`` until
+    ``min_samples`` exchanges were observed), clamped to ``min_delay`` and ``max_delay``, before
+    sending a hedge, and the same delay again before each further one, up to ``max_hedges`` per
+    call. Hedges are also limited to ``budget_ratio`` times the hedged calls of the last 10
+    seconds. Exchanges run on a thread pool of the client and the delay is counted from when the
+    first exchange is actually sent, so time spent waiting for a free thread never triggers a
+    hedge. The pending exchanges of a call that has been answered are cancelled if they have not
+    started yet, and their responses are closed and discarded otherwise.
+
+    Pass one to ``PulumiClient(hedging=...)``.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        fallback_delay: float = 0.1,
+        min_delay: float = 0.005,
+        max_delay: float = 2.0,
+        min_samples: int = 20,
+        sample_window: int = 1000,
+        max_hedges: int = 1,
+        budget_ratio: float = 0.1,
+        endpoints: Optional[Collection[str]] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize the hedging policy.
+
+        Args:
+            quantile: Latency quantile to wait for before hedging, between 0 and 1
+            fallback_delay: Delay in seconds used until an endpoint has enough latency samples
+            min_delay: Lowest hedging delay in seconds
+            max_delay: Highest hedging delay in seconds
+            min_samples: Number of exchanges observed before their latency sets the delay
+            sample_window: Number of exchanges after which older latency samples are forgotten
+            max_hedges: Maximum number of hedges per call
+            budget_ratio: Maximum number of hedges as a share of hedged calls
+            endpoints: Endpoint templates to hedge, e.g. ``{"/api/stacks/{org}/{project}/{stack}"}``;
+                all GET requests are hedged if not set
+            max_workers: Number of threads sending hedged exchanges; defaults to enough for every
+                connection of the client's pool (``pool_maxsize``) to carry a call and its hedges
+        """
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if max_hedges < 1 or (max_workers is not None and max_workers < 2):
+            raise ValueError("max_hedges must be at least 1 and max_workers at least 2")
+
+        self.quantile = quantile
+        self.fallback_delay = fallback_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.sample_window = sample_window
+        self.max_hedges = max_hedges
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        self.max_workers = max_workers
+
+        self._budget = RetryBudget(ratio=budget_ratio, min_retries_per_second=0)
+        self._lock = threading.Lock()
+        self._latency: Dict[str, _Latency] = {}
+        self._calls = self._hedges = self._wins = 0
+
+    def applies(self, endpoint: str) -> bool:
+        """Return True if GET requests to an endpoint template are hedged."""
+        return self.endpoints is None or endpoint in self.endpoints
+
+    def delay(self, endpoint: str) -> float:
+        """
+        Return how long a call waits for a response before sending a hedge.
+
+        Args:
+            endpoint: Endpoint template
+
+        Returns:
+            Delay in seconds
+        """
+        with self._lock:
+            latency = self._latency.get(endpoint)
+            histogram = None
+            if latency is not None:
+                histogram = latency.current if latency.current.count >= self.min_samples else latency.previous
+            estimate = histogram.quantile(self.quantile) if histogram is not None else None
+        if estimate is None:
+            return self.fallback_delay
+        return min(max(estimate, self.min_delay), self.max_delay)
+
+    def observe(self, endpoint: str, latency: float) -> None:
+        """
+        Record the latency of a completed exchange.
+
+        Args:
+            endpoint: Endpoint template
+            latency: Seconds from sending the request to receiving the response
+        """
+        with self._lock:
+            samples = self._latency.get(endpoint)
+            if samples is None:
+                samples = self._latency[endpoint] = _Latency()
+            if samples.current.count >= self.sample_window:
+                samples.previous, samples.current = samples.current, Histogram()
+            samples.current.observe(latency)
+
+    def run(
+        self,
+        executor: Executor,
+        endpoint: str,
+        send: Callable[[], T],
+        discard: Callable[[T], None],
+        on_hedge: Optional[Callable[[float, bool], None]] = None,
+        admit: Optional[Callable[[], bool]] = None,
+        deadline: Optional[float] = None,
+    ) -> T:
+        """
+        Run an exchange, hedging it if no response arrives in time.
+
+        Args:
+            executor: Executor running the exchanges
+            endpoint: Endpoint template
+            send: Sends the request and returns its response
+            discard: Releases a response that lost the race
+            on_hedge: Called for every hedge sent once the call completes, with the delay after
+                which it was sent and whether it answered first
+            admit: Called before sending each hedge; no further hedges are sent once it returns False
+            deadline: Optional ``time.monotonic()`` timestamp after which the call stops waiting
+                for a response
+
+        Returns:
+            The first response to arrive
+
+        Raises:
+            TimeoutError: If no response arrived before the deadline
+            Exception: The error of the original exchange if every exchange failed
+        """
+        self._budget.record_request()
+        delay = self.delay(endpoint)
+        sent = threading.Event()
+
+        def first() -> T:
+            sent.set()
+            return self._timed(endpoint, send)
+
+        futures: List[Future] = [executor.submit(first)]
+        futures[0].add_done_callback(lambda _: sent.set())
+        pending: Set[Future] = set(futures)
+        # Waiting for a free thread says nothing about the endpoint, so only start the hedge timer
+        # once the request is sent; otherwise a busy pool would queue hedges behind the calls
+        timed_out = not sent.wait(max(deadline - time.monotonic(), 0.0) if deadline is not None else None)
+        started = time.monotonic()
+        hedging = True
+        winner: Optional[Future] = None
+
+        while pending and not timed_out:
+            # Wake up for the next hedge or at the deadline, whichever comes first
+            wake_at = [started + delay * len(futures)] if hedging else []
+            if deadline is not None:
+                wake_at.append(deadline)
+            timeout = max(min(wake_at) - time.monotonic(), 0.0) if wake_at else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            winner = next((future for future in futures if future in done and future.exception() is None), None)
+            if winner is not None:
+                break
+            if not done:
+                if deadline is not None and time.monotonic() >= deadline:
+                    timed_out = True
+                # No response in time: hedge, unless the budget is spent or the caller refuses it
+                elif self._budget.try_retry() and (admit is None or admit()):
+                    future = executor.submit(self._timed, endpoint, send)
+                    futures.append(future)
+                    pending.add(future)
+                    hedging = len(futures) <= self.max_hedges
+                else:
+                    hedging = False
+
+        for future in pending:
+            # The original exchange is never cancelled, even after a timeout, so whatever send
+            # takes on for it is always settled
+            if future is futures[0] or not future.cancel():
+                future.add_done_callback(lambda lost: self._discard(lost, discard))
+
+        hedges = futures[1:]
+        with self._lock:
+            self._calls += 1
+            self._hedges += len(hedges)
+            self._wins += winner in hedges
+        if on_hedge is not None:
+            for number, hedge in enumerate(hedges, 1):
+                on_hedge(delay * number, hedge is winner)
+
+        if winner is None:
+            if timed_out:
+                raise TimeoutError(f"No response from {endpoint} before the deadline")
+            raise next(error for error in (future.exception() for future in futures) if error is not None)
+        return winner.result()
+
+    def _timed(self, endpoint: str, send: Callable[[], T]) -> T:
+        started = time.monotonic()
+        result = send()
+        self.observe(endpoint, time.monotonic() - started)
+        return result
+
+    @staticmethod
+    def _discard(future: Future, discard: Callable[[T], None]) -> None:
+        if not future.cancelled() and future.exception() is None:
+            discard(future.result())
+
+    def stats(self) -> HedgingStats:
+        """Return the number of hedged calls, of hedges sent and won, and of hedges refused by the budget."""
+        with self._lock:
+            return HedgingStats(self._calls, self._hedges, self._wins, self._budget.stats().rejected)
@@ -0,0 +1,420 @@
+"""Organization-wide inventory crawling for the Pulumi Cloud API client.
+
+Walks organizations, their projects, the stacks of every project and the tags of every stack,
+running each level with its own bounded concurrency so the whole tree is crawled in parallel.
+Snapshots can be saved to disk and brought up to date incrementally on the next run.
+"""
+
+import json
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .bulk import BulkExecutor, describe_error
+from .exceptions import PulumiAPIError
+from .models.base import SlottedModel
+from .models.organization import Organization
+from .models.project import Project
+from .models.stack import Stack, StackResource
+
+# Version of the file format written by InventorySnapshot.save
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+@dataclass
+class InventoryEvent:
+    """A single result streamed by :meth:`InventoryCrawler.crawl`.
+
+    ``kind`` is ``"organization"``, ``"project"``, ``"stack"`` or ``"error"``. ``key`` is the
+    organization name or the full name of the project or stack the event is about, and is empty
+    for an error listing the organizations themselves.
+    """
+
+    kind: str
+    key: str
+    item: Any = None
+    error: Optional[str] = None
+
+
+@dataclass
+class InventorySnapshot:
+    """Organizations, projects and stacks collected by one crawl.
+
+    Models are keyed by their full name. Listings that failed are recorded in ``errors`` under the
+    key of the organization, project or stack they were made for, so a partial crawl is never
+    mistaken for a complete one.
+    """
+
+    organizations: Dict[str, Organization] = field(default_factory=dict)
+    projects: Dict[str, Project] = field(default_factory=dict)
+    stacks: Dict[str, Stack] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    latest_updates: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    @property
+    def complete(self) -> bool:
+        """Return True if the crawl finished without errors."""
+        return self.completed_at is not None and not self.errors
+
+    def stacks_in(self, org_name: str, project_name: Optional[str] = None) -> List[Stack]:
+        """Return the stacks of an organization, or of one of its projects, sorted by full name."""
+        return [
+            stack
+            for key, stack in sorted(self.stacks.items())
+            if stack.organization == org_name and (project_name is None or stack.project == project_name)
+        ]
+
+    def add(self, event: InventoryEvent) -> None:
+        """Record a crawl event."""
+        if event.kind == "organization":
+            self.organizations[event.key] = event.item
+        elif event.kind == "project":
+            self.projects[event.key] = event.item
+        elif event.kind == "stack":
+            self.stacks[event.key] = event.item
+        elif event.kind == "error":
+            self.errors[event.key] = event.error or ""
+
+    def save(self, path: str) -> None:
+        """
+        Write the snapshot to a JSON file, replacing it atomically.
+
+        Args:
+            path: Path of the file to write
+        """
+        document = {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "started_at": _to_json(self.started_at),
+            "completed_at": _to_json(self.completed_at),
+            "organizations": [_to_json(org) for org in self.organizations.values()],
+            "projects": [_to_json(project) for project in self.projects.values()],
+            "stacks": [_to_json(stack) for stack in self.stacks.values()],
+            "errors": self.errors,
+            "latest_updates": self.latest_updates,
+        }
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(document, file)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "InventorySnapshot":
+        """
+        Read a snapshot written by :meth:`save`.
+
+        Args:
+            path: Path of the file to read
+
+        Returns:
+            An InventorySnapshot instance
+        """
+        with open(path, encoding="utf-8") as file:
+            document = json.load(file)
+        if document.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported inventory snapshot version: {document.get('version')}")
+
+        snapshot = cls(
+            errors=document["errors"],
+            latest_updates=document["latest_updates"],
+            started_at=datetime.fromisoformat(document["started_at"]) if document["started_at"] else None,
+            completed_at=datetime.fromisoformat(document["completed_at"]) if document["completed_at"] else None,
+        )
+        for fields in document["organizations"]:
+            org = Organization(**fields)
+            snapshot.organizations[org.name] = org
+        for fields in document["projects"]:
+            project = Project(**fields)
+            snapshot.projects[project.full_name] = project
+        for fields in document["stacks"]:
+            if fields.get("resources") is not None:
+                fields["resources"] = [StackResource(**resource) for resource in fields["resources"]]
+            stack = Stack(**fields)
+            snapshot.stacks[stack.full_name] = stack
+        return snapshot
+
+
+@dataclass
+class InventoryDelta:
+    """Changes found by :meth:`InventoryCrawler.sync`, as sorted stack full names."""
+
+    snapshot: InventorySnapshot
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def empty(self) -> bool:
+        """Return True if no stack was added, removed or changed."""
+        return not (self.added or self.removed or self.changed)
+
+
+def _to_json(value: Any) -> Any:
+    """Convert models and datetimes to JSON-compatible values."""
+    if isinstance(value, SlottedModel):
+        return {name: _to_json(getattr(value, name)) for name in value._fields}
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    return value
+
+
+class InventoryCrawler:
+    """Crawls the organizations, projects, stacks and stack tags visible to a client.
+
+    The levels form a pipeline: stacks of the first project are listed, and their tags fetched,
+    while the projects of other organizations are still being listed. Each level has its own
+    bound on concurrent calls, so size the client's connection pool to their sum.
+    """
+
+    def __init__(
+        self,
+        client,
+        organizations: Optional[Iterable[str]] = None,
+        org_workers: int = 4,
+        project_workers: int = 8,
+        stack_workers: int = 16,
+        fetch_tags: bool = True,
+    ):
+        """
+        Initialize the crawler.
+
+        Args:
+            client: The Pulumi client instance to use for API calls
+            organizations: Names of the organizations to crawl (defaults to every organization the
+                caller has access to)
+            org_workers: Maximum number of organizations whose projects are listed at once
+            project_workers: Maximum number of projects whose stacks are listed at once
+            stack_workers: Maximum number of stacks whose tags are fetched at once
+            fetch_tags: Fetch the tags of every stack; disable to keep the tags returned by the
+                stack listing
+        """
+        self.client = client
+        self.organizations = list(organizations) if organizations is not None else None
+        self.org_workers = org_workers
+        self.project_workers = project_workers
+        self.stack_workers = stack_workers
+        self.fetch_tags = fetch_tags
+
+    def crawl(self, snapshot: Optional[InventorySnapshot] = None) -> Iterator[InventoryEvent]:
+        """
+        Crawl the inventory, yielding results as they arrive.
+
+        Stacks are yielded once their tags have been fetched. Failed listings are yielded as
+        ``error`` events and their subtree is skipped.
+
+        Args:
+            snapshot: Optional snapshot to record every event in
+
+        Returns:
+            Iterator over InventoryEvent objects
+        """
+        return self._crawl(snapshot, self._fetch_tags if self.fetch_tags else None)
+
+    def _fetch_tags(self, stack: Stack) -> Stack:
+        """Fetch the tags of a listed stack."""
+        stack.tags = self.client.stacks.list_tags(stack.organization, stack.project, stack.name)
+        return stack
+
+    def _crawl(
+        self,
+        snapshot: Optional[InventorySnapshot],
+        refresh: Optional[Callable[[Stack], Stack]],
+        reuse: Optional[Callable[[Stack], Optional[Stack]]] = None,
+    ) -> Iterator[InventoryEvent]:
+        """
+        Crawl the inventory, passing listed stacks through ``refresh`` with bounded concurrency.
+
+        Args:
+            snapshot: Optional snapshot to record every event in
+            refresh: Function returning the full version of a listed stack, or None to keep listings
+            reuse: Function returning an already known version of a listed stack, which is then
+                emitted without being refreshed, or None if the stack needs refreshing
+
+        Yields:
+            InventoryEvent objects
+        """
+        events: Deque[InventoryEvent] = deque()
+
+        def emit(event: InventoryEvent) -> None:
+            if snapshot is not None:
+                snapshot.add(event)
+            events.append(event)
+
+        def organizations() -> Iterator[Organization]:
+            if self.organizations is not None:
+                orgs = [Organization(name=name) for name in self.organizations]
+            else:
+                try:
+                    orgs = self.client.organizations.list()
+                except Exception as e:
+                    emit(InventoryEvent("error", "", error=describe_error(e)))
+                    return
+            for org in orgs:
+                emit(InventoryEvent("organization", org.name, org))
+                yield org
+
+        def projects() -> Iterator[Project]:
+            listings = BulkExecutor(self.org_workers).map_unordered(
+                lambda org: self.client.projects.list(org.name), organizations()
+            )
+            for outcome in listings:
+                if not outcome.ok:
+                    emit(InventoryEvent("error", outcome.item.name, error=describe_error(outcome.error)))
+                    continue
+                for project in outcome.result or ():
+                    emit(InventoryEvent("project", project.full_name, project))
+                    yield project
+
+        def stacks() -> Iterator[Stack]:
+            listings = BulkExecutor(self.project_workers).map_unordered(
+                lambda project: self.client.stacks.list(project.organization, project.name), projects()
+            )
+            for outcome in listings:
+                if not outcome.ok:
+                    emit(InventoryEvent("error", outcome.item.full_name, error=describe_error(outcome.error)))
+                    continue
+                yield from outcome.result or ()
+
+        def stale_stacks() -> Iterator[Stack]:
+            for stack in stacks():
+                known = reuse(stack) if reuse is not None else None
+                if known is None:
+                    yield stack
+                else:
+                    emit(InventoryEvent("stack", known.full_name, known))
+
+        def refreshed_stacks() -> Iterator[Tuple[Stack, Optional[str]]]:
+            if refresh is None:
+                for stack in stale_stacks():
+                    yield stack, None
+                return
+
+            for outcome in BulkExecutor(self.stack_workers).map_unordered(refresh, stale_stacks()):
+                if outcome.ok and outcome.result is not None:
+                    yield outcome.result, None
+                else:
+                    yield outcome.item, describe_error(outcome.error)
+
+        for stack, error in refreshed_stacks():
+            # Yield the parents discovered while this stack was pulled through the pipeline first
+            while events:
+                yield events.popleft()
+            if error is None:
+                emit(InventoryEvent("stack", stack.full_name, stack))
+            else:
+                emit(InventoryEvent("error", stack.full_name, error=error))
+            yield events.popleft()
+
+        while events:
+            yield events.popleft()
+
+    def run(self) -> InventorySnapshot:
+        """
+        Crawl the whole inventory.
+
+        Returns:
+            The collected snapshot
+        """
+        snapshot = InventorySnapshot(started_at=datetime.now(timezone.utc))
+        for _ in self.crawl(snapshot):
+            pass
+        snapshot.completed_at = datetime.now(timezone.utc)
+        return snapshot
+
+    def sync(self, previous: InventorySnapshot) -> InventoryDelta:
+        """
+        Bring a previous snapshot up to date, refetching only the stacks that changed.
+
+        Organizations, projects and stacks are listed again, which is cheap. A listed stack whose
+        ``last_update`` and ``resource_count`` match the previous snapshot is carried over as-is;
+        the details, tags and latest update of new and changed stacks are fetched with bounded
+        concurrency. Organizations outside this crawler's ``organizations`` and the stacks under a
+        listing that failed are carried over rather than reported as removed, and stacks whose
+        refresh failed keep their previous version; failures are recorded in the new snapshot's
+        ``errors``. An organization no longer listed is dropped and its stacks reported as removed.
+
+        Args:
+            previous: Snapshot from an earlier crawl or sync
+
+        Returns:
+            The delta, holding the new snapshot
+        """
+        snapshot = InventorySnapshot(started_at=datetime.now(timezone.utc))
+        delta = InventoryDelta(snapshot)
+        latest_updates: Dict[str, Dict[str, Any]] = {}
+
+        def reuse(stack: Stack) -> Optional[Stack]:
+            key = stack.full_name
+            known = previous.stacks.get(key)
+            if known is None:
+                delta.added.append(key)
+                return None
+            if known.last_update != stack.last_update or known.resource_count != stack.resource_count:
+                delta.changed.append(key)
+                return None
+
+            delta.unchanged += 1
+            if key in previous.latest_updates:
+                latest_updates[key] = previous.latest_updates[key]
+            return known
+
+        def refresh(stack: Stack) -> Stack:
+            org_name, project_name, stack_name = stack.organization, stack.project, stack.name
+            details = self.client.stacks.get(org_name, project_name, stack_name)
+            # The next sync compares listings, so keep the listing's watermark even where the detail
+            # endpoint reports the stack differently
+            details.last_update = stack.last_update
+            details.resource_count = stack.resource_count
+            details.tags = self.client.stacks.list_tags(org_name, project_name, stack_name)
+            try:
+                latest_updates[stack.full_name] = self.client.stacks.get_latest_update(
+                    org_name, project_name, stack_name
+                )
+            except PulumiAPIError as e:
+                # A stack that was never updated has no latest update
+                if e.status_code != 404:
+                    raise
+            return details
+
+        for _ in self._crawl(snapshot, refresh, reuse):
+            pass
+
+        # Keep what this sync could not see: organizations that were not crawled and subtrees whose
+        # listing or refresh failed. An organization missing from a successful listing of every
+        # organization is gone, along with everything under it.
+        crawled = set(snapshot.organizations)
+        listed_all = self.organizations is None and "" not in snapshot.errors
+
+        def unseen(org_name: str, key: str) -> bool:
+            if org_name not in crawled:
+                return not listed_all
+            return any(key == failed or key.startswith(failed + "/") for failed in snapshot.errors)
+
+        for key, org in previous.organizations.items():
+            if key not in crawled and unseen(key, key):
+                snapshot.organizations[key] = org
+        for key, project in previous.projects.items():
+            if key not in snapshot.projects and unseen(project.organization, key):
+                snapshot.projects[key] = project
+        for key, stack in previous.stacks.items():
+            if key in snapshot.stacks:
+                continue
+            if unseen(stack.organization, key):
+                snapshot.stacks[key] = stack
+                if key in previous.latest_updates:
+                    latest_updates.setdefault(key, previous.latest_updates[key])
+            else:
+                delta.removed.append(key)
+
+        snapshot.latest_updates = latest_updates
+        snapshot.completed_at = datetime.now(timezone.utc)
+        delta.added.sort()
+        delta.changed.sort()
+        delta.removed.sort()
+        return delta
@@ -0,0 +1,327 @@
+"""Request metrics for the Pulumi Cloud API client.
+
+Records latency histograms, attempt and retry counts, status codes, payload sizes and decode time
+per endpoint template, so slowness can be attributed to the network, the retry loop or decoding.
+"""
+
+import threading
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .routes import endpoint_template
+
+# Upper bounds, in seconds, of the latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.15,
+    0.25,
+    0.35,
+    0.5,
+    0.75,
+    1.0,
+    1.5,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations in seconds.
+
+    Not thread-safe on its own; :class:`MetricsRecorder` serializes access.
+    """
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        """
+        Initialize the histogram.
+
+        Args:
+            bounds: Increasing upper bounds of the buckets
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by interpolating within its bucket.
+
+        Args:
+            q: Quantile between 0 and 1, e.g. 0.99
+
+        Returns:
+            The estimated value, or None if nothing was recorded
+        """
+        if not self.count or self.min is None or self.max is None:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                value = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(value, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the histogram as a JSON-compatible dictionary."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": {str(bound): count for bound, count in zip(self.bounds + (float("inf"),), self.counts)},
+        }
+
+
+@dataclass
+class EndpointMetrics:
+    """Metrics recorded for one endpoint template.
+
+    ``latency`` covers whole calls, including retries and backoff sleeps, while
+    ``attempt_latency`` covers individual HTTP exchanges. ``hedges`` counts the extra requests
+    sent by request hedging and ``hedge_wins`` those that answered before the original request.
+    """
+
+    requests: int = 0
+    failures: int = 0
+    attempts: int = 0
+    retries: int = 0
+    network_errors: int = 0
+    status_codes: Counter = field(default_factory=Counter)
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    backoff_seconds: float = 0.0
+    hedges: int = 0
+    hedge_wins: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+    attempt_latency: Histogram = field(default_factory=Histogram)
+    decode_time: Histogram = field(default_factory=Histogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metrics as a JSON-compatible dictionary."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "network_errors": self.network_errors,
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items())},
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "backoff_seconds": self.backoff_seconds,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "latency": self.latency.to_dict(),
+            "attempt_latency": self.attempt_latency.to_dict(),
+            "decode_time": self.decode_time.to_dict(),
+        }
+
+
+@dataclass
+class MetricEvent:
+    """A single measurement passed to the listeners of a :class:`MetricsRecorder`.
+
+    ``kind`` is ``"attempt"`` (one HTTP exchange), ``"request"`` (a whole call, ``ok`` telling
+    whether it succeeded), ``"backoff"`` (a sleep before retrying), ``"decode"`` or ``"hedge"``
+    (an extra request sent after ``duration`` seconds without a response, ``ok`` telling whether
+    it answered first).
+    """
+
+    kind: str
+    endpoint: str
+    duration: float
+    status_code: Optional[int] = None
+    attempts: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    ok: bool = True
+
+
+class MetricsRecorder:
+    """Collects request metrics per endpoint template.
+
+    Pass one to ``PulumiClient(metrics=...)``. Recording takes a lock and a few additions, and
+    listeners are only called, with :class:`MetricEvent` objects, when some are registered.
+    A recorder may be shared by several clients.
+    """
+
+    def __init__(self, listeners: Optional[List[Callable[[MetricEvent], None]]] = None):
+        """
+        Initialize the recorder.
+
+        Args:
+            listeners: Callbacks invoked with every recorded MetricEvent
+        """
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._listeners: List[Callable[[MetricEvent], None]] = list(listeners or [])
+
+    def add_listener(self, listener: Callable[[MetricEvent], None]) -> None:
+        """Register a callback invoked with every recorded MetricEvent."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[MetricEvent], None]) -> None:
+        """Unregister a callback."""
+        self._listeners.remove(listener)
+
+    def endpoint(self, path: str) -> str:
+        """Return the endpoint template metrics for a request path are recorded under."""
+        return endpoint_template(path)
+
+    def _metrics(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, creating them on first use (call with the lock held)."""
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def _notify(self, event: MetricEvent) -> None:
+        """Pass an event to every listener."""
+        for listener in list(self._listeners):
+            listener(event)
+
+    def record_attempt(
+        self,
+        endpoint: str,
+        status_code: Optional[int],
+        duration: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """
+        Record one HTTP exchange.
+
+        Args:
+            endpoint: Endpoint template
+            status_code: Response status code, or None if no response arrived
+            duration: Seconds from sending the request to receiving the response
+            bytes_sent: Size of the request body
+            bytes_received: Size of the response body
+        """
+        with self._lock:
+            metrics = self._metrics(endpoint)
+            metrics.attempts += 1
+            if status_code is None:
+                metrics.network_errors += 1
+            else:
+                metrics.status_codes[status_code] += 1
+            metrics.bytes_sent += bytes_sent
+            metrics.bytes_received += bytes_received
+            metrics.attempt_latency.observe(duration)
+        if self._listeners:
+            self._notify(MetricEvent("attempt", endpoint, duration, status_code, 1, bytes_sent, bytes_received))
+
+    def record_request(self, endpoint: str, duration: float, attempts: int, ok: bool) -> None:
+        """
+        Record a whole call, once it has succeeded or failed for good.
+
+        Args:
+            endpoint: Endpoint template
+            duration: Seconds spent in the call, including retries and backoff sleeps
+            attempts: Number of HTTP exchanges made
+            ok: Whether the call succeeded
+        """
+        with self._lock:
+            metrics = self._metrics(endpoint)
+            metrics.requests += 1
+            metrics.retries += max(attempts - 1, 0)
+            if not ok:
+                metrics.failures += 1
+            metrics.latency.observe(duration)
+        if self._listeners:
+            self._notify(MetricEvent("request", endpoint, duration, attempts=attempts, ok=ok))
+
+    def record_backoff(self, endpoint: str, duration: float) -> None:
+        """Record a sleep before retrying a call."""
+        with self._lock:
+            self._metrics(endpoint).backoff_seconds += duration
+        if self._listeners:
+            self._notify(MetricEvent("backoff", endpoint, duration))
+
+    def record_hedge(self, endpoint: str, delay: float, won: bool) -> None:
+        """
+        Record a hedged request.
+
+        Args:
+            endpoint: Endpoint template
+            delay: Seconds waited for the original request before sending the hedge
+            won: Whether the hedge answered before the original request
+        """
+        with self._lock:
+            metrics = self._metrics(endpoint)
+            metrics.hedges += 1
+            metrics.hedge_wins += won
+        if self._listeners:
+            self._notify(MetricEvent("hedge", endpoint, delay, ok=won))
+
+    def record_decode(self, endpoint: str, duration: float) -> None:
+        """Record the time spent decoding a response body."""
+        with self._lock:
+            self._metrics(endpoint).decode_time.observe(duration)
+        if self._listeners:
+            self._notify(MetricEvent("decode", endpoint, duration))
+
+    def quantile(self, endpoint: str, q: float, attempts: bool = True) -> Optional[float]:
+        """
+        Estimate a latency quantile of an endpoint.
+
+        Args:
+            endpoint: Endpoint template
+            q: Quantile between 0 and 1
+            attempts: Use the latency of single HTTP exchanges rather than of whole calls
+
+        Returns:
+            The estimated latency in seconds, or None if nothing was recorded
+        """
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            if metrics is None:
+                return None
+            return (metrics.attempt_latency if attempts else metrics.latency).quantile(q)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the metrics of every endpoint.
+
+        Returns:
+            JSON-compatible dictionary of metrics keyed by endpoint template
+        """
+        with self._lock:
+            return {endpoint: metrics.to_dict() for endpoint, metrics in sorted(self._endpoints.items())}
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._endpoints.clear()
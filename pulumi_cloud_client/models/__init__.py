@@ -3,9 +3,10 @@
 Contains data models representing Pulumi Cloud resources.
 """
 
+from .deployment import Deployment
 from .organization import Organization
 from .policy import PolicyPack
 from .project import Project
 from .stack import Stack, StackResource
 
-__all__ = ["Stack", "StackResource", "Project", "Organization", "PolicyPack"]
+__all__ = ["Stack", "StackResource", "Deployment", "Project", "Organization", "PolicyPack"]
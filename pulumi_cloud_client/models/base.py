@@ -0,0 +1,87 @@
+"""Base classes for the models of the Pulumi Cloud API client.
+
+Models are slotted classes rather than dataclasses so that large listings carry no per-instance
+``__dict__``, and timestamp fields keep the service's ISO 8601 string until they are first read.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, ClassVar, Optional, Tuple, Union
+
+TimestampValue = Union[datetime, str, int, float, None]
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp returned by the Pulumi Cloud API.
+
+    Args:
+        value: Timestamp string, optionally with a ``Z`` suffix
+
+    Returns:
+        The parsed datetime
+    """
+    # datetime.fromisoformat only accepts the "Z" suffix from Python 3.11
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+class LazyTimestamp:
+    """Descriptor for a timestamp field that is parsed on first access.
+
+    The field accepts a datetime, an ISO 8601 string, seconds since the epoch or None. Strings are
+    stored as-is in a private slot named after the field and replaced by the parsed datetime the
+    first time they are read; epoch seconds are converted to a UTC datetime right away.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Record the field name and the private slot backing it."""
+        self.name = name
+        self.slot = f"_{name}"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        """Return the field as a datetime, parsing a stored string on first access."""
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if isinstance(value, str):
+            value = parse_timestamp(value)
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance: Any, value: TimestampValue) -> None:
+        """Store a datetime, an unparsed timestamp string or None, converting epoch seconds to a datetime."""
+        if value is None or value == "":
+            value = None
+        elif isinstance(value, (int, float)):
+            value = datetime.fromtimestamp(value, timezone.utc)
+        setattr(instance, self.slot, value)
+
+
+class SlottedModel:
+    """Base class giving slotted models dataclass-style ``repr`` and equality.
+
+    Subclasses declare their storage in ``__slots__`` and list their public fields, in constructor
+    order, in ``_fields``.
+    """
+
+    __slots__ = ()
+    _fields: ClassVar[Tuple[str, ...]] = ()
+
+    def _astuple(self) -> Tuple[Any, ...]:
+        """Return the field values in declaration order."""
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __repr__(self) -> str:
+        """Return a dataclass-style representation of the model."""
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two models of the same class field by field."""
+        if not isinstance(other, SlottedModel) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    # Models are mutable, so like dataclasses they are unhashable
+    __hash__ = None  # type: ignore[assignment]
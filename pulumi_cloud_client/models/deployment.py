@@ -0,0 +1,124 @@
+"""Deployment model for the Pulumi Cloud API client.
+
+Defines an indexed view over the resources of an exported stack deployment.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .stack import StackResource
+
+
+def provider_urn(reference: str) -> str:
+    """Return the provider URN of a provider reference (``<urn>::<id>``)."""
+    # A URN has exactly three "::" separators, a reference adds the provider ID
+    return reference.rsplit("::", 1)[0] if reference.count("::") > 3 else reference
+
+
+class Deployment:
+    """Indexed view over the resources of an exported deployment.
+
+    Resources are kept as the raw dictionaries of the export and only turned into
+    :class:`StackResource` objects, with their properties, when they are accessed. Lookups by URN
+    are O(1), and resources can be listed by type, provider and parent without scanning.
+    """
+
+    def __init__(
+        self,
+        resources: Iterable[Dict[str, Any]],
+        version: Optional[int] = None,
+        manifest: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Index the resources of a deployment.
+
+        Args:
+            resources: Resource dictionaries, e.g. from ``StacksResource.iter_deployment_resources``
+            version: Version of the deployment format
+            manifest: Deployment manifest
+        """
+        self.version = version
+        self.manifest = manifest
+
+        self._raw: Dict[str, Dict[str, Any]] = {}
+        self._materialized: Dict[str, StackResource] = {}
+        self._by_type: Dict[str, List[str]] = defaultdict(list)
+        self._by_provider: Dict[str, List[str]] = defaultdict(list)
+        self._by_parent: Dict[str, List[str]] = defaultdict(list)
+
+        for item in resources:
+            urn = item["urn"]
+            self._raw[urn] = item
+            self._by_type[item["type"]].append(urn)
+            if item.get("provider"):
+                self._by_provider[provider_urn(item["provider"])].append(urn)
+            if item.get("parent"):
+                self._by_parent[item["parent"]].append(urn)
+
+    @classmethod
+    def from_export(cls, export: Dict[str, Any]) -> "Deployment":
+        """
+        Create a Deployment from the response of ``StacksResource.export_deployment``.
+
+        Args:
+            export: Exported deployment
+
+        Returns:
+            A Deployment instance
+        """
+        deployment = export.get("deployment") or {}
+        return cls(
+            deployment.get("resources") or [],
+            version=export.get("version"),
+            manifest=deployment.get("manifest"),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of resources."""
+        return len(self._raw)
+
+    def __contains__(self, urn: object) -> bool:
+        """Return True if a resource with this URN exists."""
+        return urn in self._raw
+
+    def __iter__(self) -> Iterator[StackResource]:
+        """Iterate over all resources in deployment order."""
+        for urn in self._raw:
+            yield self._resource(urn)
+
+    def __getitem__(self, urn: str) -> StackResource:
+        """Return the resource with this URN, raising KeyError if there is none."""
+        if urn not in self._raw:
+            raise KeyError(urn)
+        return self._resource(urn)
+
+    def _resource(self, urn: str) -> StackResource:
+        """Return the resource with this URN, building it on first access."""
+        resource = self._materialized.get(urn)
+        if resource is None:
+            resource = self._materialized[urn] = StackResource.from_api_response(self._raw[urn])
+        return resource
+
+    def get(self, urn: str) -> Optional[StackResource]:
+        """Return the resource with this URN, or None if there is none."""
+        return self._resource(urn) if urn in self._raw else None
+
+    def urns(self) -> List[str]:
+        """Return the URNs of all resources in deployment order."""
+        return list(self._raw)
+
+    def by_type(self, resource_type: str) -> List[StackResource]:
+        """Return the resources of a type, e.g. ``aws:s3/bucket:Bucket``."""
+        return [self._resource(urn) for urn in self._by_type.get(resource_type, ())]
+
+    def by_provider(self, provider: str) -> List[StackResource]:
+        """Return the resources managed by a provider, given its URN or its ``<urn>::<id>`` reference."""
+        return [self._resource(urn) for urn in self._by_provider.get(provider_urn(provider), ())]
+
+    def children(self, parent_urn: str) -> List[StackResource]:
+        """Return the direct children of a resource."""
+        return [self._resource(urn) for urn in self._by_parent.get(parent_urn, ())]
+
+    def type_counts(self) -> Dict[str, int]:
+        """Return the number of resources per type."""
+        return {resource_type: len(urns) for resource_type, urns in self._by_type.items()}
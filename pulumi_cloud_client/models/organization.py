@@ -3,19 +3,31 @@
 Defines the structure and properties of a Pulumi organization.
 """
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from .base import LazyTimestamp, SlottedModel, TimestampValue
 
-@dataclass
-class Organization:
+
+class Organization(SlottedModel):
     """Represents a Pulumi organization."""
 
-    name: str
-    display_name: Optional[str] = None
-    github_login: Optional[str] = None
-    created_on: Optional[datetime] = None
+    __slots__ = ("name", "display_name", "github_login", "_created_on")
+    _fields = ("name", "display_name", "github_login", "created_on")
+
+    created_on = LazyTimestamp()
+
+    def __init__(
+        self,
+        name: str,
+        display_name: Optional[str] = None,
+        github_login: Optional[str] = None,
+        created_on: TimestampValue = None,
+    ):
+        """Initialize the organization."""
+        self.name = name
+        self.display_name = display_name
+        self.github_login = github_login
+        self.created_on = created_on
 
     @property
     def full_name(self) -> str:
@@ -33,9 +45,18 @@ class Organization:
         Returns:
             An Organization instance
         """
-        return cls(
-            name=item["name"],
-            display_name=item.get("displayName"),
-            github_login=item.get("githubLogin"),
-            created_on=(datetime.fromisoformat(item["createdOn"]) if item.get("createdOn") else None),
-        )
+        return cls(item["name"], item.get("displayName"), item.get("githubLogin"), item.get("createdOn"))
+
+    @classmethod
+    def from_api_list(cls, items: Iterable[Dict[str, Any]]) -> List["Organization"]:
+        """
+        Create Organization instances from a list of API response dictionaries.
+
+        Args:
+            items: API response dictionaries containing organization data
+
+        Returns:
+            List of Organization instances
+        """
+        from_api_response = cls.from_api_response
+        return [from_api_response(item) for item in items]
@@ -3,22 +3,46 @@
 Defines the structure and properties of Pulumi policies.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from .base import SlottedModel
 
-@dataclass
-class PolicyPack:
+
+class PolicyPack(SlottedModel):
     """Represents a Pulumi Policy Pack."""
 
-    name: str
-    display_name: Optional[str] = None
-    version: Optional[str] = None
-    publisher: Optional[str] = None
-    description: Optional[str] = None
-    organization: Optional[str] = None
-    is_organizational: Optional[bool] = None
-    created_at: Optional[str] = None
+    __slots__ = (
+        "name",
+        "display_name",
+        "version",
+        "publisher",
+        "description",
+        "organization",
+        "is_organizational",
+        "created_at",
+    )
+    _fields = __slots__
+
+    def __init__(
+        self,
+        name: str,
+        display_name: Optional[str] = None,
+        version: Optional[str] = None,
+        publisher: Optional[str] = None,
+        description: Optional[str] = None,
+        organization: Optional[str] = None,
+        is_organizational: Optional[bool] = None,
+        created_at: Optional[str] = None,
+    ):
+        """Initialize the policy pack."""
+        self.name = name
+        self.display_name = display_name
+        self.version = version
+        self.publisher = publisher
+        self.description = description
+        self.organization = organization
+        self.is_organizational = is_organizational
+        self.created_at = created_at
 
     @property
     def full_name(self) -> str:
@@ -39,12 +63,26 @@ class PolicyPack:
             A PolicyPack instance
         """
         return cls(
-            name=data["name"],
-            display_name=data.get("displayName"),
-            version=data.get("version"),
-            publisher=data.get("publisher"),
-            description=data.get("description"),
-            organization=data.get("organization"),
-            is_organizational=data.get("isOrganizational"),
-            created_at=data.get("createdAt"),
+            data["name"],
+            data.get("displayName"),
+            data.get("version"),
+            data.get("publisher"),
+            data.get("description"),
+            data.get("organization"),
+            data.get("isOrganizational"),
+            data.get("createdAt"),
         )
+
+    @classmethod
+    def from_api_list(cls, items: Iterable[Dict[str, Any]]) -> List["PolicyPack"]:
+        """
+        Create PolicyPack instances from a page of API response data.
+
+        Args:
+            items: The API response data of each policy pack
+
+        Returns:
+            List of PolicyPack instances
+        """
+        from_api_response = cls.from_api_response
+        return [from_api_response(item) for item in items]
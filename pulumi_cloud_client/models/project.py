@@ -3,21 +3,36 @@
 Defines the structure and properties of a Pulumi project.
 """
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from .base import LazyTimestamp, SlottedModel, TimestampValue
 
-@dataclass
-class Project:
+
+class Project(SlottedModel):
     """Represents a Pulumi project."""
 
-    name: str
-    organization: str
-    description: Optional[str] = None
-    created_on: Optional[datetime] = None
-    updated_on: Optional[datetime] = None
-    runtime: Optional[str] = None
+    __slots__ = ("name", "organization", "description", "_created_on", "_updated_on", "runtime")
+    _fields = ("name", "organization", "description", "created_on", "updated_on", "runtime")
+
+    created_on = LazyTimestamp()
+    updated_on = LazyTimestamp()
+
+    def __init__(
+        self,
+        name: str,
+        organization: str,
+        description: Optional[str] = None,
+        created_on: TimestampValue = None,
+        updated_on: TimestampValue = None,
+        runtime: Optional[str] = None,
+    ):
+        """Initialize the project."""
+        self.name = name
+        self.organization = organization
+        self.description = description
+        self.created_on = created_on
+        self.updated_on = updated_on
+        self.runtime = runtime
 
     @property
     def full_name(self) -> str:
@@ -37,10 +52,25 @@ class Project:
             A Project instance
         """
         return cls(
-            name=item["name"],
-            organization=org_name,
-            description=item.get("description"),
-            runtime=item.get("runtime"),
-            created_on=(datetime.fromisoformat(item["createdOn"]) if item.get("createdOn") else None),
-            updated_on=(datetime.fromisoformat(item["lastUpdated"]) if item.get("lastUpdated") else None),
+            item["name"],
+            org_name,
+            item.get("description"),
+            item.get("createdOn"),
+            item.get("lastUpdated"),
+            item.get("runtime"),
         )
+
+    @classmethod
+    def from_api_list(cls, items: Iterable[Dict[str, Any]], org_name: str) -> List["Project"]:
+        """
+        Create Project instances from a page of API response dictionaries.
+
+        Args:
+            items: API response dictionaries containing project data
+            org_name: The organization name (may not be in the response)
+
+        Returns:
+            List of Project instances
+        """
+        from_api_response = cls.from_api_response
+        return [from_api_response(item, org_name) for item in items]
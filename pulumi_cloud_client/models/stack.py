@@ -4,35 +4,99 @@ Defines the structure and properties of a Pulumi stack.
 """
 
 # pulumi_client/models/stack.py
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from .base import LazyTimestamp, SlottedModel, TimestampValue
 
-@dataclass
-class StackResource:
+
+class StackResource(SlottedModel):
     """Represents a single resource in a Pulumi stack."""
 
-    resource_id: str
-    type: str
-    name: str
-    provider: str
-    parent: Optional[str]
-    properties: Dict[str, Any]
+    __slots__ = ("resource_id", "type", "name", "provider", "parent", "properties", "urn")
+    _fields = __slots__
+
+    def __init__(
+        self,
+        resource_id: str,
+        type: str,
+        name: str,
+        provider: str,
+        parent: Optional[str],
+        properties: Dict[str, Any],
+        urn: Optional[str] = None,
+    ):
+        """Initialize the stack resource."""
+        self.resource_id = resource_id
+        self.type = type
+        self.name = name
+        self.provider = provider
+        self.parent = parent
+        self.properties = properties
+        self.urn = urn
+
+    @classmethod
+    def from_api_response(cls, item: Dict[str, Any]) -> "StackResource":
+        """
+        Create a StackResource instance from a resource of an exported deployment.
+
+        Args:
+            item: Resource dictionary from the ``deployment.resources`` list of an export
+
+        Returns:
+            A StackResource instance
+        """
+        urn = item["urn"]
+        return cls(
+            resource_id=item.get("id") or "",
+            type=item["type"],
+            name=urn.rsplit("::", 1)[-1],
+            provider=item.get("provider") or "",
+            parent=item.get("parent"),
+            properties=item.get("outputs") or item.get("inputs") or {},
+            urn=urn,
+        )
 
 
-@dataclass
-class Stack:
-    """Represents a Pulumi stack."""
+class Stack(SlottedModel):
+    """Represents a Pulumi stack.
 
-    name: str
-    organization: str
-    project: str
-    last_update: Optional[datetime]
-    resource_count: int
-    resources: Optional[List[StackResource]] = None
-    description: Optional[str] = None
-    tags: Optional[Dict[str, str]] = None
+    ``last_update`` is kept as the service's timestamp string until it is first read.
+    """
+
+    __slots__ = (
+        "name",
+        "organization",
+        "project",
+        "_last_update",
+        "resource_count",
+        "resources",
+        "description",
+        "tags",
+    )
+    _fields = ("name", "organization", "project", "last_update", "resource_count", "resources", "description", "tags")
+
+    last_update = LazyTimestamp()
+
+    def __init__(
+        self,
+        name: str,
+        organization: str,
+        project: str,
+        last_update: TimestampValue,
+        resource_count: int,
+        resources: Optional[List[StackResource]] = None,
+        description: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None,
+    ):
+        """Initialize the stack."""
+        self.name = name
+        self.organization = organization
+        self.project = project
+        self.last_update = last_update
+        self.resource_count = resource_count
+        self.resources = resources
+        self.description = description
+        self.tags = tags
 
     @property
     def full_name(self) -> str:
@@ -51,11 +115,27 @@ class Stack:
             A Stack instance
         """
         return cls(
-            name=item["name"],
-            organization=item["orgName"],
-            project=item["projectName"],
-            last_update=(datetime.fromisoformat(item["lastUpdate"]) if item.get("lastUpdate") else None),
-            resource_count=item.get("resourceCount", 0),
-            description=item.get("description"),
-            tags=item.get("tags", {}),
+            item["name"],
+            item["orgName"],
+            item["projectName"],
+            item.get("lastUpdate"),
+            item.get("resourceCount", 0),
+            None,
+            item.get("description"),
+            # Listings may leave tags out; None keeps "unknown" apart from "no tags"
+            item.get("tags"),
         )
+
+    @classmethod
+    def from_api_list(cls, items: Iterable[Dict[str, Any]]) -> List["Stack"]:
+        """
+        Create Stack instances from a page of API response dictionaries.
+
+        Args:
+            items: API response dictionaries containing stack data
+
+        Returns:
+            List of Stack instances
+        """
+        from_api_response = cls.from_api_response
+        return [from_api_response(item) for item in items]
@@ -0,0 +1,208 @@
+"""Pagination helpers for the Pulumi Cloud API client.
+
+List endpoints either return a plain JSON array or a page object holding the items under a
+resource-specific key plus a ``continuationToken`` for the next page. These helpers follow the
+token page by page so callers never hold more than one page of raw items at a time.
+"""
+
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
+
+CONTINUATION_TOKEN = "continuationToken"
+
+
+def split_page(response: Any, items_key: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Split a list response into its items and the token of the next page.
+
+    Args:
+        response: Parsed API response (a list, or a dict with items and a continuation token)
+        items_key: Key holding the items when the response is a page object
+
+    Returns:
+        Tuple of (items, continuation_token); the token is None on the last page
+    """
+    if response is None:
+        return [], None
+    if isinstance(response, list):
+        return response, None
+    return response.get(items_key) or [], response.get(CONTINUATION_TOKEN) or None
+
+
+def _page_params(params: Optional[Dict[str, Any]], token: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Return the query parameters for the page identified by ``token``."""
+    if token is None:
+        return params
+    return {**(params or {}), CONTINUATION_TOKEN: token}
+
+
+def iter_pages(
+    client, path: str, items_key: str, params: Optional[Dict[str, Any]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Fetch a list endpoint page by page, following continuation tokens.
+
+    Args:
+        client: The Pulumi client instance to use for API calls
+        path: API endpoint path
+        items_key: Key holding the items when the response is a page object
+        params: Additional URL parameters sent with every page request
+
+    Yields:
+        The raw items of each page
+    """
+    token = None
+    while True:
+        page_params = _page_params(params, token)
+        if page_params:
+            response = client._make_request("get", path, params=page_params)
+        else:
+            response = client._make_request("get", path)
+
+        items, next_token = split_page(response, items_key)
+        yield items
+
+        # Stop on the last page, and guard against a service echoing the same token forever
+        if next_token is None or next_token == token:
+            return
+        token = next_token
+
+
+def iter_items(client, path: str, items_key: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """Yield the raw items of a paginated list endpoint one at a time."""
+    for page in iter_pages(client, path, items_key, params):
+        yield from page
+
+
+async def aiter_items(
+    client, path: str, items_key: str, params: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the raw items of a paginated list endpoint using the asynchronous client."""
+    token = None
+    while True:
+        page_params = _page_params(params, token)
+        if page_params:
+            response = await client._make_request("get", path, params=page_params)
+        else:
+            response = await client._make_request("get", path)
+
+        items, next_token = split_page(response, items_key)
+        for item in items:
+            yield item
+
+        if next_token is None or next_token == token:
+            return
+        token = next_token
+
+
+class PrefetchingPaginator:
+    """Iterate over the pages of a list endpoint while fetching the following pages in the background.
+
+    A worker thread requests up to ``depth`` pages ahead of the consumer, so the network round
+    trip for page N+1 overlaps with the processing of page N. The worker does not start a new
+    request while ``max_buffered_items`` items are already waiting, which bounds memory use to
+    roughly that many items plus one page.
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        client,
+        path: str,
+        items_key: str,
+        params: Optional[Dict[str, Any]] = None,
+        depth: int = 1,
+        max_buffered_items: Optional[int] = None,
+    ):
+        """
+        Initialize the paginator.
+
+        Args:
+            client: The Pulumi client instance to use for API calls
+            path: API endpoint path
+            items_key: Key holding the items when the response is a page object
+            params: Additional URL parameters sent with every page request
+            depth: Maximum number of pages fetched ahead of the consumer
+            max_buffered_items: Optional cap on the number of fetched but unconsumed items, at least 1
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        if max_buffered_items is not None and max_buffered_items < 1:
+            raise ValueError("max_buffered_items must be at least 1")
+
+        self.client = client
+        self.path = path
+        self.items_key = items_key
+        self.params = params
+        self.depth = depth
+        self.max_buffered_items = max_buffered_items
+
+        self._buffer: Deque[Any] = deque()
+        self._buffered_items = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def _has_room(self) -> bool:
+        """Return True if the worker may fetch another page."""
+        if len(self._buffer) >= self.depth:
+            return False
+        return self.max_buffered_items is None or self._buffered_items < self.max_buffered_items
+
+    def _put(self, entry: Any, size: int = 0) -> None:
+        """Hand a page, an exception or the end marker to the consumer."""
+        with self._condition:
+            self._buffer.append(entry)
+            self._buffered_items += size
+            self._condition.notify_all()
+
+    def _fetch(self) -> None:
+        """Fetch pages until the listing is exhausted or the paginator is closed."""
+        pages = iter_pages(self.client, self.path, self.items_key, self.params)
+        while True:
+            with self._condition:
+                while not self._closed and not self._has_room():
+                    self._condition.wait()
+                if self._closed:
+                    return
+
+            try:
+                page = next(pages)
+            except StopIteration:
+                self._put(self._END)
+                return
+            except BaseException as e:
+                # Re-raised in the consumer's thread
+                self._put(e)
+                return
+
+            self._put(page, len(page))
+
+    def close(self) -> None:
+        """Stop fetching further pages."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def __iter__(self) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the raw items of each page in order."""
+        worker = threading.Thread(target=self._fetch, name="pulumi-prefetch", daemon=True)
+        worker.start()
+        try:
+            while True:
+                with self._condition:
+                    while not self._buffer:
+                        self._condition.wait()
+                    entry = self._buffer.popleft()
+                    if isinstance(entry, list):
+                        self._buffered_items -= len(entry)
+                    self._condition.notify_all()
+
+                if entry is self._END:
+                    return
+                if isinstance(entry, BaseException):
+                    raise entry
+                yield entry
+        finally:
+            self.close()
@@ -0,0 +1,221 @@
+"""Client-side rate limiting for the Pulumi Cloud API client.
+
+A :class:`RateLimiter` is a token bucket shared by every thread (or task) using a client, so all
+callers slow down together instead of each backing off on its own after a 429.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional
+
+from .retry import retry_after_seconds
+
+
+@dataclass
+class RateLimitBudget:
+    """Snapshot of a rate limiter's current budget."""
+
+    rate: float
+    capacity: float
+    tokens: float
+    paused_for: float
+    server_limit: Optional[int] = None
+    server_remaining: Optional[int] = None
+    server_reset_in: Optional[float] = None
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    """Return the first of ``names`` present in ``headers`` as a float."""
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+class RateLimiter:
+    """Thread-safe token bucket that adapts to the rate-limit headers sent by the service.
+
+    Callers reserve a token before every request. When the bucket is empty the reservation
+    returns how long the caller must wait; reservations queue up behind each other so waiting
+    callers are released at the configured rate rather than all at once.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[float] = None,
+        min_rate: float = 0.1,
+        max_rate: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Initial number of requests allowed per second
+            burst: Maximum number of tokens the bucket can hold (defaults to ``rate``)
+            min_rate: Lower bound for the rate when adjusting to server headers
+            max_rate: Upper bound for the rate when adjusting to server headers (unbounded if None)
+            clock: Monotonic clock, injectable for tests
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+        self._server_limit: Optional[int] = None
+        self._server_remaining: Optional[int] = None
+        self._server_reset_at: Optional[float] = None
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update (caller must hold the lock)."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens for a request without blocking.
+
+        Args:
+            tokens: Number of tokens to reserve
+
+        Returns:
+            Number of seconds the caller must wait before sending the request
+        """
+        return self._reserve(tokens, math.inf)
+
+    def try_reserve(self, max_wait: float, tokens: float = 1.0) -> Optional[float]:
+        """
+        Reserve tokens for a request without blocking, unless the wait would be too long.
+
+        Args:
+            max_wait: Longest wait in seconds the caller accepts, e.g. the time left before its deadline
+            tokens: Number of tokens to reserve
+
+        Returns:
+            Number of seconds the caller must wait before sending the request, or None if that
+            would be longer than ``max_wait``, in which case nothing is reserved
+        """
+        delay = self._reserve(tokens, max_wait)
+        return delay if delay <= max_wait else None
+
+    def _reserve(self, tokens: float, max_wait: float) -> float:
+        """Return the wait for tokens, reserving them only if it is at most ``max_wait``."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            remaining = self._tokens - tokens
+            delay = max(-remaining / self.rate if remaining < 0 else 0.0, self._paused_until - now)
+            if delay <= max_wait:
+                self._tokens = remaining
+            return delay
+
+    def acquire(self, tokens: float = 1.0, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve tokens and sleep until the request may be sent.
+
+        Args:
+            tokens: Number of tokens to reserve
+            max_wait: Optional longest wait in seconds; a longer one returns at once without
+                reserving anything
+
+        Returns:
+            Number of seconds spent waiting, or None if the wait would have been longer than ``max_wait``
+        """
+        limit = max_wait if max_wait is not None else math.inf
+        delay = self._reserve(tokens, limit)
+        if delay > limit:
+            return None
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every caller for the given number of seconds.
+
+        Args:
+            seconds: Duration of the pause, typically taken from a Retry-After header
+        """
+        with self._lock:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + seconds)
+            # Start from an empty bucket when the pause ends so callers do not burst
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, clamped to the configured bounds."""
+        rate = max(rate, self.min_rate)
+        if self.max_rate is not None:
+            rate = min(rate, self.max_rate)
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = rate
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Adjust the limiter from the rate-limit headers of a response.
+
+        Understands ``Retry-After`` as well as the ``X-RateLimit-*`` and ``RateLimit-*`` families.
+        A reset value larger than a day is treated as a Unix timestamp, otherwise as seconds.
+
+        Args:
+            headers: Response headers
+        """
+        retry_after = retry_after_seconds(headers)
+        if retry_after is not None:
+            self.pause(retry_after)
+
+        limit = _header_float(headers, "X-RateLimit-Limit", "RateLimit-Limit")
+        remaining = _header_float(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+        if remaining is None:
+            return
+
+        reset_in = None
+        if reset is not None:
+            reset_in = max(0.0, reset - time.time()) if reset > 86400 else reset
+
+        with self._lock:
+            now = self._clock()
+            self._server_limit = int(limit) if limit is not None else None
+            self._server_remaining = int(remaining)
+            self._server_reset_at = now + reset_in if reset_in is not None else None
+            if remaining <= 0 and reset_in:
+                self._paused_until = max(self._paused_until, now + reset_in)
+
+        if reset_in:
+            # Spread the remaining budget evenly over the rest of the window
+            self.set_rate(remaining / reset_in)
+
+    def budget(self) -> RateLimitBudget:
+        """Return a snapshot of the current budget."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return RateLimitBudget(
+                rate=self.rate,
+                capacity=self.capacity,
+                tokens=self._tokens,
+                paused_for=max(0.0, self._paused_until - now),
+                server_limit=self._server_limit,
+                server_remaining=self._server_remaining,
+                server_reset_in=(max(0.0, self._server_reset_at - now) if self._server_reset_at is not None else None),
+            )
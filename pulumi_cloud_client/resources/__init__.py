@@ -3,9 +3,18 @@
 Contains resource classes for interacting with different Pulumi Cloud resources.
 """
 
-from .organizations import OrganizationsResource
-from .policies import PoliciesResource
-from .projects import ProjectsResource
-from .stacks import StacksResource
+from .organizations import AsyncOrganizationsResource, OrganizationsResource
+from .policies import AsyncPoliciesResource, PoliciesResource
+from .projects import AsyncProjectsResource, ProjectsResource
+from .stacks import AsyncStacksResource, StacksResource
 
-__all__ = ["StacksResource", "ProjectsResource", "OrganizationsResource", "PoliciesResource"]
+__all__ = [
+    "StacksResource",
+    "ProjectsResource",
+    "OrganizationsResource",
+    "PoliciesResource",
+    "AsyncStacksResource",
+    "AsyncProjectsResource",
+    "AsyncOrganizationsResource",
+    "AsyncPoliciesResource",
+]
@@ -3,9 +3,11 @@
 Provides methods for interacting with Pulumi organizations.
 """
 
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterator, List
 
 from ..models.organization import Organization
+from ..pagination import aiter_items, iter_items
+from ..tracing import traced
 
 
 class OrganizationsResource:
@@ -23,6 +25,7 @@ class OrganizationsResource:
         """
         self.client = client
 
+    @traced("organizations.list")
     def list(self) -> List[Organization]:
         """
         List organizations the caller has access to.
@@ -31,8 +34,9 @@ class OrganizationsResource:
             List of organization objects
         """
         response = self.client._make_request("get", "/api/user/organizations")
-        return [Organization.from_api_response(item) for item in response]
+        return Organization.from_api_list(response)
 
+    @traced("organizations.get")
     def get(self, org_name: str) -> Organization:
         """
         Get organization details.
@@ -46,6 +50,7 @@ class OrganizationsResource:
         response = self.client._make_request("get", f"/api/organizations/{org_name}")
         return Organization.from_api_response(response)
 
+    @traced("organizations.list_team_members")
     def list_team_members(self, org_name: str) -> List[Dict[str, Any]]:
         """
         List team members for an organization.
@@ -56,8 +61,21 @@ class OrganizationsResource:
         Returns:
             List of team member objects
         """
-        return self.client._make_request("get", f"/api/organizations/{org_name}/members")
+        return list(self.iter_team_members(org_name))
 
+    def iter_team_members(self, org_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the team members of an organization, one page at a time.
+
+        Args:
+            org_name: Organization name
+
+        Yields:
+            Team member objects
+        """
+        yield from iter_items(self.client, f"/api/organizations/{org_name}/members", "members")
+
+    @traced("organizations.invite_user")
     def invite_user(self, org_name: str, email: str, role: str = "member") -> Dict[str, Any]:
         """
         Invite a user to an organization.
@@ -75,3 +93,45 @@ class OrganizationsResource:
             f"/api/organizations/{org_name}/members",
             data={"email": email, "role": role},
         )
+
+
+class AsyncOrganizationsResource:
+    """Handles asynchronous API interactions for Pulumi organizations.
+
+    Mirrors :class:`OrganizationsResource` for use with the asynchronous client.
+    """
+
+    def __init__(self, client):
+        """Initialize the Organizations resource.
+
+        Args:
+            client: The asynchronous Pulumi client instance to use for API calls.
+        """
+        self.client = client
+
+    async def list(self) -> List[Organization]:
+        """List organizations the caller has access to."""
+        response = await self.client._make_request("get", "/api/user/organizations")
+        return Organization.from_api_list(response)
+
+    async def get(self, org_name: str) -> Organization:
+        """Get organization details."""
+        response = await self.client._make_request("get", f"/api/organizations/{org_name}")
+        return Organization.from_api_response(response)
+
+    async def list_team_members(self, org_name: str) -> List[Dict[str, Any]]:
+        """List team members for an organization."""
+        return [member async for member in self.iter_team_members(org_name)]
+
+    async def iter_team_members(self, org_name: str) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the team members of an organization, one page at a time."""
+        async for item in aiter_items(self.client, f"/api/organizations/{org_name}/members", "members"):
+            yield item
+
+    async def invite_user(self, org_name: str, email: str, role: str = "member") -> Dict[str, Any]:
+        """Invite a user to an organization."""
+        return await self.client._make_request(
+            "post",
+            f"/api/organizations/{org_name}/members",
+            data={"email": email, "role": role},
+        )
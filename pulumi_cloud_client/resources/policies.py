@@ -3,9 +3,11 @@
 Provides methods for interacting with Pulumi policies.
 """
 
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
 from pulumi_cloud_client.models.policy import PolicyPack
+from pulumi_cloud_client.pagination import aiter_items, iter_pages
+from pulumi_cloud_client.tracing import traced
 
 
 class PoliciesResource:
@@ -20,6 +22,7 @@ class PoliciesResource:
         """
         self.client = client
 
+    @traced("policies.list")
     def list(self, org_name: str) -> List[PolicyPack]:
         """
         List policy packs for an organization.
@@ -30,9 +33,22 @@ class PoliciesResource:
         Returns:
             List of policy pack objects
         """
-        response = self.client._make_request("get", f"/api/organizations/{org_name}/policy-packs")
-        return [PolicyPack.from_api_response(item) for item in response]
+        return list(self.iter_policy_packs(org_name))
 
+    def iter_policy_packs(self, org_name: str) -> Iterator[PolicyPack]:
+        """
+        Iterate over the policy packs of an organization, one page at a time.
+
+        Args:
+            org_name: Organization name
+
+        Yields:
+            Policy pack objects
+        """
+        for page in iter_pages(self.client, f"/api/organizations/{org_name}/policy-packs", "policyPacks"):
+            yield from PolicyPack.from_api_list(page)
+
+    @traced("policies.get")
     def get(self, org_name: str, policy_pack_name: str, version: str) -> PolicyPack:
         """
         Get policy pack details.
@@ -50,3 +66,33 @@ class PoliciesResource:
             f"/api/organizations/{org_name}/policy-packs/{policy_pack_name}/versions/{version}",
         )
         return PolicyPack.from_api_response(response)
+
+
+class AsyncPoliciesResource:
+    """Resource for managing Pulumi Policy Packs with the asynchronous client."""
+
+    def __init__(self, client):
+        """
+        Initialize the Policies resource.
+
+        Args:
+            client: The asynchronous Pulumi API client instance
+        """
+        self.client = client
+
+    async def list(self, org_name: str) -> List[PolicyPack]:
+        """List policy packs for an organization."""
+        return [policy_pack async for policy_pack in self.iter_policy_packs(org_name)]
+
+    async def iter_policy_packs(self, org_name: str) -> AsyncIterator[PolicyPack]:
+        """Iterate over the policy packs of an organization, one page at a time."""
+        async for item in aiter_items(self.client, f"/api/organizations/{org_name}/policy-packs", "policyPacks"):
+            yield PolicyPack.from_api_response(item)
+
+    async def get(self, org_name: str, policy_pack_name: str, version: str) -> PolicyPack:
+        """Get policy pack details."""
+        response = await self.client._make_request(
+            "get",
+            f"/api/organizations/{org_name}/policy-packs/{policy_pack_name}/versions/{version}",
+        )
+        return PolicyPack.from_api_response(response)
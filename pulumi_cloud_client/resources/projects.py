@@ -3,9 +3,11 @@
 Provides methods for interacting with Pulumi projects.
 """
 
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
 from ..models.project import Project
+from ..pagination import aiter_items, iter_pages
+from ..tracing import traced
 
 
 class ProjectsResource:
@@ -19,6 +21,7 @@ class ProjectsResource:
         """
         self.client = client
 
+    @traced("projects.list")
     def list(self, org_name: str) -> List[Project]:
         """
         List projects for an organization.
@@ -29,11 +32,22 @@ class ProjectsResource:
         Returns:
             List of project objects
         """
-        response = self.client._make_request("get", f"/api/organizations/{org_name}/projects")
+        return list(self.iter_projects(org_name))
 
-        # Use the from_api_response method to create instances
-        return [Project.from_api_response(item, org_name) for item in response]
+    def iter_projects(self, org_name: str) -> Iterator[Project]:
+        """
+        Iterate over the projects of an organization, one page at a time.
+
+        Args:
+            org_name: Organization name
+
+        Yields:
+            Project objects
+        """
+        for page in iter_pages(self.client, f"/api/organizations/{org_name}/projects", "projects"):
+            yield from Project.from_api_list(page, org_name)
 
+    @traced("projects.get")
     def get(self, org_name: str, project_name: str) -> Project:
         """
         Get project details.
@@ -47,3 +61,29 @@ class ProjectsResource:
         """
         response = self.client._make_request("get", f"/api/organizations/{org_name}/projects/{project_name}")
         return Project.from_api_response(response, org_name)
+
+
+class AsyncProjectsResource:
+    """Handles asynchronous API interactions for Pulumi projects."""
+
+    def __init__(self, client):
+        """Initialize the Projects resource.
+
+        Args:
+            client: The asynchronous Pulumi client instance to use for API calls.
+        """
+        self.client = client
+
+    async def list(self, org_name: str) -> List[Project]:
+        """List projects for an organization."""
+        return [project async for project in self.iter_projects(org_name)]
+
+    async def iter_projects(self, org_name: str) -> AsyncIterator[Project]:
+        """Iterate over the projects of an organization, one page at a time."""
+        async for item in aiter_items(self.client, f"/api/organizations/{org_name}/projects", "projects"):
+            yield Project.from_api_response(item, org_name)
+
+    async def get(self, org_name: str, project_name: str) -> Project:
+        """Get project details."""
+        response = await self.client._make_request("get", f"/api/organizations/{org_name}/projects/{project_name}")
+        return Project.from_api_response(response, org_name)
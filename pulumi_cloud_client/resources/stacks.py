@@ -3,10 +3,16 @@
 Provides methods for interacting with Pulumi stacks.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import os
+from contextlib import closing
+from typing import IO, Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
-from ..models import Stack
+from ..bulk import TagPolicy, TagUpdateSummary, TransferProgress, TransferSummary, transfer_many, update_tags_many
+from ..concurrency import AdaptiveConcurrencyLimiter
+from ..models import Deployment, Stack
+from ..pagination import PrefetchingPaginator, aiter_items, iter_pages
+from ..streaming import DEPLOYMENT_RESOURCES_PATH, iter_array_items
+from ..tracing import traced
 
 
 class StacksResource:
@@ -20,17 +26,50 @@ class StacksResource:
         """
         self.client = client
 
+    @traced("stacks.list")
     def list(self, org_name: str, project_name: Optional[str] = None) -> List[Stack]:
         """List stacks for an organization or project."""
+        return list(self.iter_stacks(org_name, project_name))
+
+    def iter_stacks(
+        self,
+        org_name: str,
+        project_name: Optional[str] = None,
+        prefetch: int = 0,
+        max_buffered_items: Optional[int] = None,
+    ) -> Iterator[Stack]:
+        """
+        Iterate over the stacks of an organization or project, one page at a time.
+
+        Pages are requested lazily by following the service's continuation token, so the first
+        stack is available before later pages are fetched. With ``prefetch`` set, the following
+        pages are requested in a background thread while the current one is being consumed.
+
+        Args:
+            org_name: Organization name
+            project_name: Optional project name to restrict the listing to
+            prefetch: Number of pages to fetch ahead of the consumer (0 disables prefetching)
+            max_buffered_items: Optional cap on the number of prefetched but unconsumed stacks
+
+        Yields:
+            Stack objects
+        """
         path = f"/api/stacks/{org_name}"
         if project_name:
             path += f"/{project_name}"
 
-        response = self.client._make_request("get", path)
+        pages: Iterable[List[Dict[str, Any]]]
+        if prefetch:
+            pages = PrefetchingPaginator(
+                self.client, path, "stacks", depth=prefetch, max_buffered_items=max_buffered_items
+            )
+        else:
+            pages = iter_pages(self.client, path, "stacks")
 
-        # Use the from_api_response method to create instances
-        return [Stack.from_api_response(item) for item in response]
+        for page in pages:
+            yield from Stack.from_api_list(page)
 
+    @traced("stacks.get")
     def get(self, org_name: str, project_name: str, stack_name: str) -> Stack:
         """
         Get stack details.
@@ -46,6 +85,7 @@ class StacksResource:
         response = self.client._make_request("get", f"/api/stacks/{org_name}/{project_name}/{stack_name}")
         return Stack.from_api_response(response)
 
+    @traced("stacks.get_latest_update")
     def get_latest_update(self, org_name: str, project_name: str, stack_name: str) -> Dict[str, Any]:
         """
         Get the latest update for a stack.
@@ -60,6 +100,7 @@ class StacksResource:
         """
         return self.client._make_request("get", f"/api/stacks/{org_name}/{project_name}/{stack_name}/updates/latest")
 
+    @traced("stacks.get_update")
     def get_update(self, org_name: str, project_name: str, stack_name: str, update_id: str) -> Dict[str, Any]:
         """
         Get a specific update for a stack.
@@ -78,6 +119,7 @@ class StacksResource:
             f"/api/stacks/{org_name}/{project_name}/{stack_name}/updates/{update_id}",
         )
 
+    @traced("stacks.list_tags")
     def list_tags(self, org_name: str, project_name: str, stack_name: str) -> Dict[str, str]:
         """
         List tags for a stack.
@@ -92,6 +134,7 @@ class StacksResource:
         """
         return self.client._make_request("get", f"/api/stacks/{org_name}/{project_name}/{stack_name}/tags")
 
+    @traced("stacks.update_tags")
     def update_tags(self, org_name: str, project_name: str, stack_name: str, tags: Dict[str, str]) -> None:
         """
         Update tags for a stack.
@@ -108,6 +151,7 @@ class StacksResource:
             data=tags,
         )
 
+    @traced("stacks.export_deployment")
     def export_deployment(self, org_name: str, project_name: str, stack_name: str) -> Dict[str, Any]:
         """
         Export the latest deployment for a stack.
@@ -122,6 +166,75 @@ class StacksResource:
         """
         return self.client._make_request("get", f"/api/stacks/{org_name}/{project_name}/{stack_name}/export")
 
+    @traced("stacks.export_deployment_to")
+    def export_deployment_to(
+        self,
+        org_name: str,
+        project_name: str,
+        stack_name: str,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        chunk_size: int = 65536,
+    ) -> int:
+        """
+        Stream the latest deployment of a stack to a file without loading it into memory.
+
+        Args:
+            org_name: Organization name
+            project_name: Project name
+            stack_name: Stack name
+            destination: Path of the file to write, or a writable binary file object
+            chunk_size: Number of bytes read from the network at a time
+
+        Returns:
+            Number of bytes written
+        """
+        response = self.client._stream_request("get", f"/api/stacks/{org_name}/{project_name}/{stack_name}/export")
+        with closing(response):
+            if isinstance(destination, (str, os.PathLike)):
+                with open(destination, "wb") as file:
+                    return _copy_chunks(response.iter_content(chunk_size), file)
+            return _copy_chunks(response.iter_content(chunk_size), destination)
+
+    def iter_deployment_resources(
+        self, org_name: str, project_name: str, stack_name: str, chunk_size: int = 65536
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the resources of a stack's latest deployment as they are streamed.
+
+        Only one resource is decoded at a time, so memory stays constant however large the stack is.
+
+        Args:
+            org_name: Organization name
+            project_name: Project name
+            stack_name: Stack name
+            chunk_size: Number of bytes read from the network at a time
+
+        Yields:
+            Resource dictionaries
+        """
+        response = self.client._stream_request("get", f"/api/stacks/{org_name}/{project_name}/{stack_name}/export")
+        with closing(response):
+            yield from iter_array_items(response.iter_content(chunk_size), DEPLOYMENT_RESOURCES_PATH)
+
+    @traced("stacks.get_deployment")
+    def get_deployment(self, org_name: str, project_name: str, stack_name: str) -> Deployment:
+        """
+        Get an indexed view over the resources of a stack's latest deployment.
+
+        The export is streamed and indexed resource by resource; StackResource objects are only
+        built when looked up.
+
+        Args:
+            org_name: Organization name
+            project_name: Project name
+            stack_name: Stack name
+
+        Returns:
+            Deployment object
+        """
+        return Deployment(self.iter_deployment_resources(org_name, project_name, stack_name))
+
+    @traced("stacks.create_stack")
     def create_stack(self, org_name: str, project_name: str, stack_name: str) -> Stack:
         """
         Create a new stack.
@@ -140,10 +253,11 @@ class StacksResource:
             name=response["name"],
             organization=response["orgName"],
             project=response["projectName"],
-            last_update=(datetime.fromisoformat(response["lastUpdate"]) if response.get("lastUpdate") else None),
+            last_update=response.get("lastUpdate"),
             resource_count=response.get("resourceCount", 0),
         )
 
+    @traced("stacks.delete_stack")
     def delete_stack(self, org_name: str, project_name: str, stack_name: str) -> None:
         """
         Delete a stack.
@@ -155,6 +269,7 @@ class StacksResource:
         """
         self.client._make_request("delete", f"/api/stacks/{org_name}/{project_name}/{stack_name}")
 
+    @traced("stacks.update_stack")
     def update_stack(self, org_name: str, project_name: str, stack_name: str, data: Dict[str, Any]) -> Stack:
         """
         Update a stack.
@@ -173,10 +288,11 @@ class StacksResource:
             name=response["name"],
             organization=response["orgName"],
             project=response["projectName"],
-            last_update=(datetime.fromisoformat(response["lastUpdate"]) if response.get("lastUpdate") else None),
+            last_update=response.get("lastUpdate"),
             resource_count=response.get("resourceCount", 0),
         )
 
+    @traced("stacks.transfer_stack")
     def transfer_stack(self, org_name: str, project_name: str, stack_name: str, new_org_name: str) -> Stack:
         """
         Transfer a stack to a new organization.
@@ -188,14 +304,120 @@ class StacksResource:
             new_org_name: New organization name
 
         Returns:
-            Stack object
+            The stack in its new organization; the API answers a transfer with no content, in which
+            case the stack is read back from there
         """
         data = {"toOrg": new_org_name}
         response = self.client._make_request(
             "post", f"/api/stacks/{org_name}/{project_name}/{stack_name}/transfer", data=data
         )
+        if not response:
+            return self.get(new_org_name, project_name, stack_name)
         return Stack.from_api_response(response)
 
+    @traced("stacks.transfer_many")
+    def transfer_many(
+        self,
+        new_org_name: str,
+        stacks: Optional[Iterable[Stack]] = None,
+        journal_path: Optional[str] = None,
+        max_workers: int = 4,
+        retry_failed: bool = True,
+        progress_callback: Optional[Callable[[TransferProgress, str, Optional[str]], None]] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> TransferSummary:
+        """
+        Transfer many stacks to a new organization with bounded concurrency.
+
+        With a journal, the list of stacks and the outcome of every transfer are recorded on disk as
+        they happen. Calling this again with the same journal resumes the job: the stacks are read
+        back from the journal instead of being listed again, and stacks already transferred are skipped.
+
+        With a limiter, the number of transfers in flight adapts to the service's latency and to
+        rate limiting and server errors; when the client has a metrics recorder, retried attempts
+        are taken into account too.
+
+        Args:
+            new_org_name: New organization name
+            stacks: Stacks to transfer; may be omitted when resuming from an existing journal
+            journal_path: Optional path of the append-only journal file
+            max_workers: Maximum number of transfers in flight at once
+            retry_failed: Retry stacks whose transfer failed in a previous run of the journal
+            progress_callback: Called after each transfer with the overall progress, the stack's
+                full name and the error message (None on success)
+            limiter: Optional adaptive concurrency limit, used instead of ``max_workers``
+
+        Returns:
+            Summary of transferred, failed and skipped stacks
+        """
+        return transfer_many(
+            self.client,
+            new_org_name,
+            stacks=stacks,
+            journal_path=journal_path,
+            max_workers=max_workers,
+            retry_failed=retry_failed,
+            progress_callback=progress_callback,
+            limiter=limiter,
+        )
+
+    @traced("stacks.update_tags_many")
+    def update_tags_many(
+        self,
+        desired: TagPolicy,
+        stacks: Optional[Iterable[Stack]] = None,
+        prune: bool = False,
+        refresh: bool = False,
+        max_workers: int = 4,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        dry_run: bool = False,
+    ) -> TagUpdateSummary:
+        """
+        Bring the tags of many stacks to their desired state, writing only the stacks that differ.
+
+        The desired tags of each stack are merged into its current tags: listed tags are set, tags
+        mapped to None are removed and, with ``prune``, unlisted tags are removed too. The current
+        tags are taken from the ``tags`` of the given stacks, as returned by :meth:`list`, so stacks
+        already in the desired state cost no API call at all; other stacks, and stacks listed
+        without tags (``tags`` is None), have their tags fetched.
+        Stacks that differ are then updated with the merged tags, with bounded concurrency. Updated
+        Stack objects get their new tags.
+
+        Args:
+            desired: Desired tags keyed by full stack name (``org/project/stack``), or a function
+                returning the desired tags of a stack (or None to leave it alone)
+            stacks: Stacks to reconcile, typically from :meth:`list`; may be omitted when
+                ``desired`` is a mapping, in which case the tags of every stack in it are fetched
+            prune: Remove tags that are not in the desired tags
+            refresh: Fetch the current tags of every stack instead of trusting the listed ones,
+                which may be out of date
+            max_workers: Maximum number of tag fetches and updates in flight at once
+            limiter: Optional adaptive concurrency limit, used instead of ``max_workers``
+            dry_run: Compute the changes without writing them
+
+        Returns:
+            Summary of changed, unchanged and failed stacks
+        """
+        return update_tags_many(
+            self.client,
+            desired,
+            stacks=stacks,
+            prune=prune,
+            refresh=refresh,
+            max_workers=max_workers,
+            limiter=limiter,
+            dry_run=dry_run,
+        )
+
+
+def _copy_chunks(chunks: Iterable[bytes], file: IO[bytes]) -> int:
+    """Write byte chunks to a file object, returning the number of bytes written."""
+    written = 0
+    for chunk in chunks:
+        file.write(chunk)
+        written += len(chunk)
+    return written
+
 
 class Stacks:
     """Handles API interactions for Pulumi stacks.
@@ -211,3 +433,106 @@ class Stacks:
             client: The Pulumi client instance to use for API calls.
         """
         self.client = client
+
+
+class AsyncStacksResource:
+    """Handles asynchronous API interactions for Pulumi stacks.
+
+    Mirrors :class:`StacksResource` for use with the asynchronous client.
+    """
+
+    def __init__(self, client):
+        """Initialize the Stacks resource.
+
+        Args:
+            client: The asynchronous Pulumi client instance to use for API calls.
+        """
+        self.client = client
+
+    async def list(self, org_name: str, project_name: Optional[str] = None) -> List[Stack]:
+        """List stacks for an organization or project."""
+        return [stack async for stack in self.iter_stacks(org_name, project_name)]
+
+    async def iter_stacks(self, org_name: str, project_name: Optional[str] = None) -> AsyncIterator[Stack]:
+        """Iterate over the stacks of an organization or project, one page at a time."""
+        path = f"/api/stacks/{org_name}"
+        if project_name:
+            path += f"/{project_name}"
+
+        async for item in aiter_items(self.client, path, "stacks"):
+            yield Stack.from_api_response(item)
+
+    async def get(self, org_name: str, project_name: str, stack_name: str) -> Stack:
+        """Get stack details."""
+        response = await self.client._make_request("get", f"/api/stacks/{org_name}/{project_name}/{stack_name}")
+        return Stack.from_api_response(response)
+
+    async def get_latest_update(self, org_name: str, project_name: str, stack_name: str) -> Dict[str, Any]:
+        """Get the latest update for a stack."""
+        return await self.client._make_request(
+            "get", f"/api/stacks/{org_name}/{project_name}/{stack_name}/updates/latest"
+        )
+
+    async def get_update(self, org_name: str, project_name: str, stack_name: str, update_id: str) -> Dict[str, Any]:
+        """Get a specific update for a stack."""
+        return await self.client._make_request(
+            "get",
+            f"/api/stacks/{org_name}/{project_name}/{stack_name}/updates/{update_id}",
+        )
+
+    async def list_tags(self, org_name: str, project_name: str, stack_name: str) -> Dict[str, str]:
+        """List tags for a stack."""
+        return await self.client._make_request("get", f"/api/stacks/{org_name}/{project_name}/{stack_name}/tags")
+
+    async def update_tags(self, org_name: str, project_name: str, stack_name: str, tags: Dict[str, str]) -> None:
+        """Update tags for a stack."""
+        await self.client._make_request(
+            "patch",
+            f"/api/stacks/{org_name}/{project_name}/{stack_name}/tags",
+            data=tags,
+        )
+
+    async def export_deployment(self, org_name: str, project_name: str, stack_name: str) -> Dict[str, Any]:
+        """Export the latest deployment for a stack."""
+        return await self.client._make_request("get", f"/api/stacks/{org_name}/{project_name}/{stack_name}/export")
+
+    async def create_stack(self, org_name: str, project_name: str, stack_name: str) -> Stack:
+        """Create a new stack."""
+        data = {"orgName": org_name, "projectName": project_name, "stackName": stack_name}
+        response = await self.client._make_request(
+            "post", f"/api/stacks/{org_name}/{project_name}/{stack_name}", data=data
+        )
+        return Stack(
+            name=response["name"],
+            organization=response["orgName"],
+            project=response["projectName"],
+            last_update=response.get("lastUpdate"),
+            resource_count=response.get("resourceCount", 0),
+        )
+
+    async def delete_stack(self, org_name: str, project_name: str, stack_name: str) -> None:
+        """Delete a stack."""
+        await self.client._make_request("delete", f"/api/stacks/{org_name}/{project_name}/{stack_name}")
+
+    async def update_stack(self, org_name: str, project_name: str, stack_name: str, data: Dict[str, Any]) -> Stack:
+        """Update a stack."""
+        response = await self.client._make_request(
+            "patch", f"/api/stacks/{org_name}/{project_name}/{stack_name}", data=data
+        )
+        return Stack(
+            name=response["name"],
+            organization=response["orgName"],
+            project=response["projectName"],
+            last_update=response.get("lastUpdate"),
+            resource_count=response.get("resourceCount", 0),
+        )
+
+    async def transfer_stack(self, org_name: str, project_name: str, stack_name: str, new_org_name: str) -> Stack:
+        """Transfer a stack to a new organization, reading it back if the API answers with no content."""
+        data = {"toOrg": new_org_name}
+        response = await self.client._make_request(
+            "post", f"/api/stacks/{org_name}/{project_name}/{stack_name}/transfer", data=data
+        )
+        if not response:
+            return await self.get(new_org_name, project_name, stack_name)
+        return Stack.from_api_response(response)
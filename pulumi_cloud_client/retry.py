@@ -0,0 +1,221 @@
+"""Retry helpers for the Pulumi Cloud API client.
+
+Shared by the synchronous and asynchronous clients so both follow the same retry policy: capped
+exponential backoff with full jitter, an optional client-wide :class:`RetryBudget`, and per-call
+deadlines set with :func:`deadline` that bound attempts and backoff sleeps together.
+"""
+
+import contextlib
+import math
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, List, Mapping, Optional, Tuple
+
+# Rate limits and server errors are retryable
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """Return True if a response with this status code should be retried."""
+    return status_code in RETRYABLE_STATUS_CODES
+
+
+def backoff_delay(delay: float, retries: int, max_delay: float = 30.0) -> float:
+    """
+    Compute how long to sleep before the next attempt.
+
+    Uses "full jitter": a uniformly random delay between zero and the capped exponential delay,
+    so callers that failed together do not retry in lockstep.
+
+    Args:
+        delay: Initial delay in seconds
+        retries: Number of retries performed so far, including this one
+        max_delay: Upper bound of the exponential delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    # Clamp the exponent, the cap applies long before it matters
+    return random.uniform(0, min(max_delay, delay * 2 ** min(retries - 1, 64)))
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Parse the Retry-After header of a response.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Number of seconds to wait, or None if the header is missing or malformed
+    """
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # The header may also carry an HTTP date
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_deadline: ContextVar[Optional[float]] = ContextVar("pulumi_cloud_client_deadline", default=None)
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Bound every API call made inside the block, including its retries and backoff sleeps.
+
+    Calls that cannot complete before the deadline raise
+    :class:`~pulumi_cloud_client.exceptions.DeadlineExceededError`. The deadline follows the
+    context: it covers calls made by :class:`~pulumi_cloud_client.bulk.BulkExecutor` workers and
+    asyncio tasks started inside the block. Nested blocks can only shorten it.
+
+    Args:
+        seconds: Time budget of the block in seconds
+
+    Yields:
+        The deadline as a ``time.monotonic()`` timestamp
+    """
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires = min(expires, current)
+    token = _deadline.set(expires)
+    try:
+        yield expires
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline(seconds: Optional[float] = None) -> Optional[float]:
+    """
+    Return the deadline of a call starting now.
+
+    Args:
+        seconds: Optional time budget of the call itself in seconds
+
+    Returns:
+        The earlier of the enclosing :func:`deadline` and ``seconds`` from now, as a
+        ``time.monotonic()`` timestamp, or None if neither is set
+    """
+    expires = _deadline.get()
+    if seconds is not None:
+        own = time.monotonic() + seconds
+        expires = own if expires is None else min(expires, own)
+    return expires
+
+
+@dataclass
+class RetryBudgetStats:
+    """Snapshot of a retry budget over its window."""
+
+    requests: int
+    retries: int
+    rejected: int
+
+
+class RetryBudget:
+    """Thread-safe client-wide limit on retries as a share of requests.
+
+    Within a sliding window of ``window`` seconds, retries are allowed while they number fewer
+    than ``ratio`` times the calls made plus a reserve of ``min_retries_per_second`` per second,
+    so callers keep retrying through occasional failures, but a degraded API sees at most about
+    ``1 + ratio`` times the normal load instead of ``max_retries + 1`` times. Retries refused by
+    the budget fail the call with its last error.
+
+    Pass one to ``PulumiClient(retry_budget=...)``; a budget may be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the retry budget.
+
+        Args:
+            ratio: Retries allowed per call in the window
+            min_retries_per_second: Retries always allowed per second, so a client making few
+                calls can still retry
+            window: Length of the sliding window in seconds
+            clock: Monotonic clock, injectable for tests
+        """
+        if ratio < 0 or min_retries_per_second < 0 or window <= 0:
+            raise ValueError("ratio and min_retries_per_second must not be negative, window must be positive")
+
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._clock = clock
+
+        # Counters per whole second of the window, recycled as the window slides
+        self._slots = max(1, math.ceil(window))
+        self._lock = threading.Lock()
+        self._seconds: List[int] = [-1] * self._slots
+        self._requests: List[int] = [0] * self._slots
+        self._retries: List[int] = [0] * self._slots
+        self._rejected = 0
+
+    def _slot(self, second: int) -> int:
+        """Return the counter slot of a second, clearing it if it holds an older second (call with the lock held)."""
+        slot = second % self._slots
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._requests[slot] = self._retries[slot] = 0
+        return slot
+
+    def _totals(self, second: int) -> Tuple[int, int]:
+        oldest = second - self._slots
+        requests = retries = 0
+        for slot, slot_second in enumerate(self._seconds):
+            if slot_second > oldest:
+                requests += self._requests[slot]
+                retries += self._retries[slot]
+        return requests, retries
+
+    def record_request(self) -> None:
+        """Record a call, adding ``ratio`` retries to the budget."""
+        second = int(self._clock())
+        with self._lock:
+            self._requests[self._slot(second)] += 1
+
+    def try_retry(self) -> bool:
+        """
+        Withdraw one retry from the budget.
+
+        Returns:
+            True if the retry may be sent, False if the budget is exhausted
+        """
+        second = int(self._clock())
+        with self._lock:
+            slot = self._slot(second)
+            requests, retries = self._totals(second)
+            if retries >= self.ratio * requests + self.min_retries_per_second * self.window:
+                self._rejected += 1
+                return False
+            self._retries[slot] += 1
+            return True
+
+    def stats(self) -> RetryBudgetStats:
+        """Return the calls and retries in the current window, and the retries refused so far."""
+        second = int(self._clock())
+        with self._lock:
+            requests, retries = self._totals(second)
+            return RetryBudgetStats(requests, retries, self._rejected)
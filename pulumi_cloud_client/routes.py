@@ -0,0 +1,64 @@
+"""Endpoint templates for the Pulumi Cloud API client.
+
+Maps concrete request paths such as ``/api/stacks/acme/web/prod/export`` to the endpoint template
+they were built from (``/api/stacks/{org}/{project}/{stack}/export``), so per-endpoint settings and
+statistics can be keyed by endpoint rather than by individual stack.
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+# Templates for every endpoint used by the resource classes
+ENDPOINT_TEMPLATES = (
+    "/api/user/organizations",
+    "/api/organizations/{org}",
+    "/api/organizations/{org}/members",
+    "/api/organizations/{org}/projects",
+    "/api/organizations/{org}/projects/{project}",
+    "/api/organizations/{org}/policy-packs",
+    "/api/organizations/{org}/policy-packs/{policy_pack}/versions/{version}",
+    "/api/stacks/{org}",
+    "/api/stacks/{org}/{project}",
+    "/api/stacks/{org}/{project}/{stack}",
+    "/api/stacks/{org}/{project}/{stack}/updates/latest",
+    "/api/stacks/{org}/{project}/{stack}/updates/{update_id}",
+    "/api/stacks/{org}/{project}/{stack}/tags",
+    "/api/stacks/{org}/{project}/{stack}/export",
+    "/api/stacks/{org}/{project}/{stack}/transfer",
+)
+
+
+def _split(path: str) -> List[str]:
+    """Split a path into its non-empty segments."""
+    return [segment for segment in path.split("?", 1)[0].split("/") if segment]
+
+
+def _compile(templates: Tuple[str, ...]) -> List[Tuple[str, List[str]]]:
+    """Split every template into segments, most literal templates first."""
+    compiled = [(template, _split(template)) for template in templates]
+    # Prefer literal segments over placeholders, e.g. updates/latest over updates/{update_id}
+    compiled.sort(key=lambda entry: -sum(not segment.startswith("{") for segment in entry[1]))
+    return compiled
+
+
+_COMPILED_TEMPLATES = _compile(ENDPOINT_TEMPLATES)
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(path: str) -> str:
+    """
+    Return the endpoint template a request path was built from.
+
+    Args:
+        path: API endpoint path
+
+    Returns:
+        The matching template, or the normalized path itself for endpoints not covered by a resource
+    """
+    segments = _split(path)
+    for template, template_segments in _COMPILED_TEMPLATES:
+        if len(template_segments) != len(segments):
+            continue
+        if all(t.startswith("{") or t == s for t, s in zip(template_segments, segments)):
+            return template
+    return "/" + "/".join(segments)
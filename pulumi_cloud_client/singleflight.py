@@ -0,0 +1,103 @@
+"""Request coalescing for the Pulumi Cloud API client.
+
+When several threads ask for the same resource at the same moment, :class:`SingleFlight` lets the
+first one perform the request and hands its result, or its exception, to every other caller.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .exceptions import DeadlineExceededError
+from .retry import current_deadline
+
+
+class _Call:
+    """An in-flight call and the callers waiting for it."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls into a single execution."""
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        deadline: Optional[float] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        """
+        Run ``fn`` unless a call with the same key is already in flight, in which case wait for it.
+
+        Args:
+            key: Identity of the call
+            fn: Function performing the call
+            deadline: Optional ``time.monotonic()`` timestamp after which a waiting caller gives
+                up; defaults to the enclosing :func:`~pulumi_cloud_client.retry.deadline`
+            endpoint: Name of the call in a DeadlineExceededError (defaults to the key)
+
+        Returns:
+            The result of the call, shared by every caller that asked for it while it was in flight
+
+        Raises:
+            DeadlineExceededError: If this caller's deadline passed while waiting for another's call
+            Whatever exception the call raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            # The leader runs under its own deadline, which may be much later than this caller's
+            expires = deadline if deadline is not None else current_deadline()
+            if expires is None:
+                call.done.wait()
+            else:
+                waited = time.monotonic()
+                if not call.done.wait(max(expires - waited, 0.0)):
+                    name = endpoint if endpoint is not None else str(key)
+                    raise DeadlineExceededError(name, 0, time.monotonic() - waited)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return coalescing counters.
+
+        Returns:
+            Dictionary with the number of executed calls and of calls served by another caller's request
+        """
+        with self._lock:
+            return {"executed": self._executed, "coalesced": self._coalesced, "in_flight": len(self._calls)}
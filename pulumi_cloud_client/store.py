@@ -0,0 +1,368 @@
+"""Local inventory store for the Pulumi Cloud API client.
+
+Persists organizations, projects and stacks returned by the API in a SQLite database, indexed
+for the filters reporting scripts use most, so repeated queries run against local data and the
+API is only needed to refresh it.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .inventory import InventoryDelta, InventorySnapshot
+from .models.organization import Organization
+from .models.project import Project
+from .models.stack import Stack
+
+Model = Union[Organization, Project, Stack]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS organizations (
+    name TEXT PRIMARY KEY,
+    display_name TEXT,
+    github_login TEXT,
+    created_on TEXT
+);
+CREATE TABLE IF NOT EXISTS projects (
+    organization TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    created_on TEXT,
+    updated_on TEXT,
+    runtime TEXT,
+    PRIMARY KEY (organization, name)
+);
+CREATE TABLE IF NOT EXISTS stacks (
+    id INTEGER PRIMARY KEY,
+    organization TEXT NOT NULL,
+    project TEXT NOT NULL,
+    name TEXT NOT NULL,
+    last_update REAL,
+    resource_count INTEGER NOT NULL DEFAULT 0,
+    description TEXT,
+    UNIQUE (organization, project, name)
+);
+CREATE INDEX IF NOT EXISTS stacks_last_update ON stacks (last_update);
+CREATE INDEX IF NOT EXISTS stacks_resource_count ON stacks (resource_count);
+CREATE TABLE IF NOT EXISTS stack_tags (
+    stack_id INTEGER NOT NULL REFERENCES stacks (id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (stack_id, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS stack_tags_key_value ON stack_tags (key, value, stack_id);
+"""
+
+_ORDERINGS = {
+    "name": "organization, project, name",
+    "last_update": "last_update IS NULL, last_update, organization, project, name",
+    "-last_update": "last_update IS NULL, last_update DESC, organization, project, name",
+    "resource_count": "resource_count, organization, project, name",
+    "-resource_count": "resource_count DESC, organization, project, name",
+}
+
+
+def _epoch(value: Optional[datetime]) -> Optional[float]:
+    """Return a timestamp as seconds since the epoch, treating naive datetimes as UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """Return a timestamp in ISO 8601 format."""
+    return value.isoformat() if value is not None else None
+
+
+class InventoryStore:
+    """SQLite-backed store of organizations, projects and stacks.
+
+    Write API results in with :meth:`write` (or a whole snapshot with :meth:`write_snapshot`) and
+    read them back as model objects with :meth:`stacks`, :meth:`projects` and
+    :meth:`organizations`. Stacks are indexed by organization and project, tag key and value,
+    last update time and resource count. The store can be shared between threads.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Open the store, creating the database if needed.
+
+        Args:
+            path: Path of the SQLite database file (defaults to an in-memory database)
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "InventoryStore":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the database on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def write(self, items: Union[Model, Iterable[Model]]) -> int:
+        """
+        Insert or update organizations, projects and stacks.
+
+        Stacks whose ``tags`` are None keep the tags already stored for them.
+
+        Args:
+            items: A model object, or an iterable of them, e.g. the result of ``stacks.list``
+
+        Returns:
+            Number of objects written
+        """
+        if isinstance(items, (Organization, Project, Stack)):
+            items = [items]
+
+        count = 0
+        with self._lock, self._conn:
+            for item in items:
+                if isinstance(item, Stack):
+                    self._write_stack(item)
+                elif isinstance(item, Project):
+                    self._write_project(item)
+                elif isinstance(item, Organization):
+                    self._write_organization(item)
+                else:
+                    raise TypeError(f"Cannot store {type(item).__name__} objects")
+                count += 1
+        return count
+
+    def _write_organization(self, org: Organization) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO organizations VALUES (?, ?, ?, ?)",
+            (org.name, org.display_name, org.github_login, _isoformat(org.created_on)),
+        )
+
+    def _write_project(self, project: Project) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                project.organization,
+                project.name,
+                project.description,
+                _isoformat(project.created_on),
+                _isoformat(project.updated_on),
+                project.runtime,
+            ),
+        )
+
+    def _write_stack(self, stack: Stack) -> None:
+        key = (stack.organization, stack.project, stack.name)
+        self._conn.execute(
+            """
+            INSERT INTO stacks (organization, project, name, last_update, resource_count, description)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (organization, project, name) DO UPDATE SET
+                last_update = excluded.last_update,
+                resource_count = excluded.resource_count,
+                description = excluded.description
+            """,
+            (*key, _epoch(stack.last_update), stack.resource_count or 0, stack.description),
+        )
+        if stack.tags is None:
+            return
+
+        (stack_id,) = self._conn.execute(
+            "SELECT id FROM stacks WHERE organization = ? AND project = ? AND name = ?", key
+        ).fetchone()
+        self._conn.execute("DELETE FROM stack_tags WHERE stack_id = ?", (stack_id,))
+        self._conn.executemany(
+            "INSERT INTO stack_tags VALUES (?, ?, ?)",
+            [(stack_id, tag, value) for tag, value in stack.tags.items()],
+        )
+
+    def delete_stack(self, org_name: str, project_name: str, stack_name: str) -> bool:
+        """
+        Remove a stack and its tags.
+
+        Args:
+            org_name: Organization name
+            project_name: Project name
+            stack_name: Stack name
+
+        Returns:
+            True if the stack was stored
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM stacks WHERE organization = ? AND project = ? AND name = ?",
+                (org_name, project_name, stack_name),
+            )
+        return cursor.rowcount > 0
+
+    def write_snapshot(self, snapshot: InventorySnapshot) -> None:
+        """Write every organization, project and stack of an inventory snapshot."""
+        self.write(snapshot.organizations.values())
+        self.write(snapshot.projects.values())
+        self.write(snapshot.stacks.values())
+
+    def apply_delta(self, delta: InventoryDelta) -> None:
+        """Write the added and changed stacks of an incremental sync and remove the deleted ones."""
+        snapshot = delta.snapshot
+        self.write(snapshot.stacks[key] for key in delta.added + delta.changed if key in snapshot.stacks)
+        for key in delta.removed:
+            org_name, project_name, stack_name = key.split("/", 2)
+            self.delete_stack(org_name, project_name, stack_name)
+
+    def organizations(self) -> List[Organization]:
+        """Return the stored organizations sorted by name."""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM organizations ORDER BY name").fetchall()
+        return [Organization(*row) for row in rows]
+
+    def projects(self, organization: Optional[str] = None) -> List[Project]:
+        """Return the stored projects, optionally of one organization, sorted by full name."""
+        sql = "SELECT name, organization, description, created_on, updated_on, runtime FROM projects"
+        args: Tuple[Any, ...] = ()
+        if organization is not None:
+            sql += " WHERE organization = ?"
+            args = (organization,)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY organization, name", args).fetchall()
+        return [Project(*row) for row in rows]
+
+    def stacks(
+        self,
+        organization: Optional[str] = None,
+        project: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None,
+        tag_keys: Iterable[str] = (),
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+        min_resources: Optional[int] = None,
+        max_resources: Optional[int] = None,
+        order_by: str = "name",
+        limit: Optional[int] = None,
+    ) -> List[Stack]:
+        """
+        Query the stored stacks.
+
+        All filters are combined with AND.
+
+        Args:
+            organization: Only stacks of this organization
+            project: Only stacks of this project
+            tags: Only stacks with all of these tag values
+            tag_keys: Only stacks that have all of these tags, whatever their value
+            updated_after: Only stacks last updated at or after this time
+            updated_before: Only stacks last updated before this time
+            min_resources: Only stacks with at least this many resources
+            max_resources: Only stacks with at most this many resources
+            order_by: One of ``name``, ``last_update``, ``-last_update``, ``resource_count`` and
+                ``-resource_count`` (a leading ``-`` sorts in descending order)
+            limit: Maximum number of stacks to return
+
+        Returns:
+            List of Stack objects, with their tags
+        """
+        if order_by not in _ORDERINGS:
+            raise ValueError(f"order_by must be one of {', '.join(_ORDERINGS)}")
+
+        where, args = self._stack_filters(
+            organization, project, tags, tag_keys, updated_after, updated_before, min_resources, max_resources
+        )
+        selection = "FROM stacks"
+        if where:
+            selection += " WHERE " + " AND ".join(where)
+        selection += f" ORDER BY {_ORDERINGS[order_by]}"
+        if limit is not None:
+            selection += " LIMIT ?"
+            args.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, name, organization, project, last_update, resource_count, description {selection}", args
+            ).fetchall()
+            tags_by_id: Dict[int, Dict[str, str]] = {row[0]: {} for row in rows}
+            if rows:
+                # Select the tags with the same query rather than a list of IDs, which SQLite caps in size
+                for stack_id, key, value in self._conn.execute(
+                    f"SELECT stack_id, key, value FROM stack_tags WHERE stack_id IN (SELECT id {selection})", args
+                ):
+                    tags_by_id[stack_id][key] = value
+
+        return [
+            Stack(
+                name,
+                org_name,
+                project_name,
+                datetime.fromtimestamp(last_update, timezone.utc) if last_update is not None else None,
+                resource_count,
+                description=description,
+                tags=tags_by_id[stack_id],
+            )
+            for stack_id, name, org_name, project_name, last_update, resource_count, description in rows
+        ]
+
+    def count_stacks(self, **filters: Any) -> int:
+        """Return the number of stored stacks matching the filters accepted by :meth:`stacks`."""
+        where, args = self._stack_filters(**filters)
+        sql = "SELECT COUNT(*) FROM stacks"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        with self._lock:
+            return self._conn.execute(sql, args).fetchone()[0]
+
+    def tag_values(self, key: str) -> Dict[str, int]:
+        """Return the number of stored stacks per value of a tag."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT value, COUNT(*) FROM stack_tags WHERE key = ? GROUP BY value ORDER BY value", (key,)
+            ).fetchall()
+        return dict(rows)
+
+    @staticmethod
+    def _stack_filters(
+        organization: Optional[str] = None,
+        project: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None,
+        tag_keys: Iterable[str] = (),
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+        min_resources: Optional[int] = None,
+        max_resources: Optional[int] = None,
+    ) -> Tuple[List[str], List[Any]]:
+        """Return the WHERE clauses and arguments selecting the stacks matching the filters."""
+        where: List[str] = []
+        args: List[Any] = []
+        if organization is not None:
+            where.append("organization = ?")
+            args.append(organization)
+        if project is not None:
+            where.append("project = ?")
+            args.append(project)
+        for key, value in (tags or {}).items():
+            where.append("id IN (SELECT stack_id FROM stack_tags WHERE key = ? AND value = ?)")
+            args.extend((key, value))
+        for key in tag_keys:
+            where.append("id IN (SELECT stack_id FROM stack_tags WHERE key = ?)")
+            args.append(key)
+        if updated_after is not None:
+            where.append("last_update >= ?")
+            args.append(_epoch(updated_after))
+        if updated_before is not None:
+            where.append("last_update < ?")
+            args.append(_epoch(updated_before))
+        if min_resources is not None:
+            where.append("resource_count >= ?")
+            args.append(min_resources)
+        if max_resources is not None:
+            where.append("resource_count <= ?")
+            args.append(max_resources)
+        return where, args
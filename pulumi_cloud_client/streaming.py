@@ -0,0 +1,148 @@
+"""Incremental JSON parsing for the Pulumi Cloud API client.
+
+Lets callers walk the items of one array nested inside a large JSON document, such as the
+resources of a deployment export, while only ever holding one item and one chunk in memory.
+"""
+
+import codecs
+import json
+from typing import IO, Any, Iterable, Iterator, Sequence
+
+# Location of the resources array in a deployment export
+DEPLOYMENT_RESOURCES_PATH = ("deployment", "resources")
+
+_WHITESPACE = " \t\n\r"
+
+
+class _ChunkReader:
+    """Text buffer fed incrementally from an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer, returning False at the end of the input."""
+        if self.eof:
+            return False
+
+        # Drop the consumed part of the buffer so memory stays bounded by one item plus one chunk
+        if self.pos:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buf += text
+                return True
+
+        self.buf += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char: str) -> None:
+        """Consume ``char``, which must be the next non-whitespace character."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' but found '{found}' in JSON document")
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array_items(chunks: Iterable[bytes], path: Sequence[str]) -> Iterator[Any]:
+    """
+    Yield the items of the array found under ``path`` in a streamed JSON document.
+
+    Values outside the path are skipped without being kept, and the document after the array is
+    never read.
+
+    Args:
+        chunks: The JSON document as an iterable of byte chunks
+        path: Object keys leading from the top-level object to the array
+
+    Yields:
+        The decoded items of the array, one at a time
+    """
+    reader = _ChunkReader(chunks)
+
+    for key in path:
+        reader.expect("{")
+        while True:
+            char = reader.peek()
+            if char == "}":
+                return
+            if char == ",":
+                reader.pos += 1
+                continue
+
+            name = reader.read_value()
+            reader.expect(":")
+            if name == key:
+                break
+            reader.read_value()
+
+    if reader.peek() != "[":
+        return
+    reader.pos += 1
+
+    while True:
+        char = reader.peek()
+        if char == "]":
+            return
+        if char == ",":
+            reader.pos += 1
+            continue
+        yield reader.read_value()
+
+
+def read_chunks(file: IO[bytes], chunk_size: int = 65536) -> Iterator[bytes]:
+    """Yield the contents of a binary file object in chunks."""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_deployment_resources(file: IO[bytes], chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Yield the resources of a deployment export saved to a file, one at a time.
+
+    Args:
+        file: Binary file object holding an exported deployment
+        chunk_size: Number of bytes read at a time
+
+    Yields:
+        Resource dictionaries
+    """
+    return iter_array_items(read_chunks(file, chunk_size), DEPLOYMENT_RESOURCES_PATH)
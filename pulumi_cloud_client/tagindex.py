@@ -0,0 +1,360 @@
+"""In-memory inverted tag index over stacks.
+
+A :class:`TagIndex` maps every tag value to the set of stacks carrying it, so selector queries
+such as ``env=prod,team in (payments, billing)`` are answered by intersecting a few sets instead
+of scanning every stack. It is built from ``stacks.list`` results and updated incrementally as
+stacks are added, retagged or removed.
+
+Selectors follow the syntax of Kubernetes label selectors: comma-separated requirements that must
+all hold, each one of ``key=value`` (or ``key==value``), ``key!=value``, ``key in (a, b)``,
+``key notin (a, b)``, ``key`` (the tag exists) and ``!key`` (it does not). As in Kubernetes,
+``!=`` and ``notin`` also match stacks without the tag. Keys and values containing spaces or
+punctuation may be double-quoted.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from .models.stack import Stack
+
+EQUALS = "="
+NOT_EQUALS = "!="
+IN = "in"
+NOT_IN = "notin"
+EXISTS = "exists"
+NOT_EXISTS = "!exists"
+
+_TOKEN = re.compile(r'\s*(?:(==|!=|=|!|\(|\)|,)|"((?:[^"\\]|\\.)*)"|([^\s=!(),"]+))')
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class Requirement:
+    """One condition of a selector on a tag."""
+
+    key: str
+    operator: str
+    values: FrozenSet[str] = _EMPTY
+
+    def matches(self, tags: Mapping[str, str]) -> bool:
+        """Return True if a stack with these tags meets the requirement."""
+        value = tags.get(self.key)
+        if self.operator == EXISTS:
+            return value is not None
+        if self.operator == NOT_EXISTS:
+            return value is None
+        if self.operator in (EQUALS, IN):
+            return value in self.values
+        return value not in self.values
+
+    def __str__(self) -> str:
+        """Return the requirement in selector syntax."""
+        if self.operator == EXISTS:
+            return self.key
+        if self.operator == NOT_EXISTS:
+            return f"!{self.key}"
+        if self.operator in (EQUALS, NOT_EQUALS):
+            return f"{self.key}{self.operator}{next(iter(self.values))}"
+        return f"{self.key} {self.operator} ({', '.join(sorted(self.values))})"
+
+
+@dataclass(frozen=True)
+class Selector:
+    """A parsed selector: requirements that must all hold."""
+
+    requirements: Tuple[Requirement, ...]
+
+    def matches(self, tags: Optional[Mapping[str, str]]) -> bool:
+        """Return True if a stack with these tags is selected."""
+        tags = tags or {}
+        return all(requirement.matches(tags) for requirement in self.requirements)
+
+    def __str__(self) -> str:
+        """Return the selector in selector syntax."""
+        return ",".join(str(requirement) for requirement in self.requirements)
+
+
+@lru_cache(maxsize=1024)
+def parse_selector(text: str) -> Selector:
+    """
+    Parse a selector expression such as ``env=prod,team in (payments, billing),!deprecated``.
+
+    Args:
+        text: Selector expression; an empty one selects every stack
+
+    Returns:
+        The parsed selector
+
+    Raises:
+        ValueError: If the expression is malformed
+    """
+    tokens = _tokenize(text)
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position][0] if position < len(tokens) else None
+
+    def take(expected: Optional[str] = None) -> str:
+        nonlocal position
+        if position >= len(tokens):
+            raise ValueError(f"Unexpected end of selector {text!r}")
+        kind, value = tokens[position]
+        if expected is not None and kind != expected:
+            raise ValueError(f"Expected {expected!r} but found {value!r} in selector {text!r}")
+        position += 1
+        return value
+
+    requirements: List[Requirement] = []
+    while position < len(tokens):
+        if peek() == "!":
+            take("!")
+            requirements.append(Requirement(take("word"), NOT_EXISTS))
+        else:
+            key = take("word")
+            following = tokens[position] if position < len(tokens) else None
+            if following is None or following[0] == ",":
+                requirements.append(Requirement(key, EXISTS))
+            elif following[0] in ("=", "==", "!="):
+                operator = NOT_EQUALS if take() == "!=" else EQUALS
+                requirements.append(Requirement(key, operator, frozenset((take("word"),))))
+            elif following == ("word", IN) or following == ("word", NOT_IN):
+                operator = take()
+                take("(")
+                values = {take("word")}
+                while peek() == ",":
+                    take(",")
+                    values.add(take("word"))
+                take(")")
+                requirements.append(Requirement(key, operator, frozenset(values)))
+            else:
+                raise ValueError(f"Unexpected {following[1]!r} after {key!r} in selector {text!r}")
+        if position < len(tokens):
+            take(",")
+            if position == len(tokens):
+                raise ValueError(f"Trailing comma in selector {text!r}")
+    return Selector(tuple(requirements))
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    """Split a selector into (kind, value) tokens, the kind being the operator itself or "word"."""
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise ValueError(f"Invalid character at position {position} in selector {text!r}")
+        operator, quoted, word = match.groups()
+        if operator is not None:
+            tokens.append((operator, operator))
+        elif quoted is not None:
+            tokens.append(("word", re.sub(r"\\(.)", r"\1", quoted)))
+        else:
+            tokens.append(("word", word))
+        position = match.end()
+    return tokens
+
+
+class TagIndex:
+    """Thread-safe inverted index from tag values to stacks, queried with selectors.
+
+    Stacks are identified by their full name; adding a stack that is already indexed replaces its
+    tags. Query results are cached, so repeated queries take microseconds; adding, retagging or
+    removing a stack only drops the cached results whose stacks it changes.
+    """
+
+    def __init__(self, stacks: Optional[Iterable[Stack]] = None, cache_size: int = 256):
+        """
+        Initialize the index.
+
+        Args:
+            stacks: Stacks to index, typically from ``stacks.list``
+            cache_size: Number of query results kept, least recently used first dropped
+        """
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._stacks: Dict[str, Stack] = {}
+        self._tags: Dict[str, Dict[str, str]] = {}
+        # Tag key -> tag value -> full names of the stacks with that value
+        self._postings: Dict[str, Dict[str, Set[str]]] = {}
+        # Tag key -> full names of the stacks with that tag
+        self._with_key: Dict[str, Set[str]] = {}
+        self._results: "OrderedDict[Selector, FrozenSet[str]]" = OrderedDict()
+        if stacks is not None:
+            self.update(stacks)
+
+    def __len__(self) -> int:
+        """Return the number of indexed stacks."""
+        return len(self._stacks)
+
+    def __contains__(self, stack: object) -> bool:
+        """Return True if a stack, or a full stack name, is indexed."""
+        name = stack.full_name if isinstance(stack, Stack) else stack
+        return name in self._stacks
+
+    def add(self, stack: Stack) -> None:
+        """Index a stack, replacing the tags indexed for it before."""
+        with self._lock:
+            previous = self._tags.get(stack.full_name)
+            self._invalidate(previous, self._add(stack))
+
+    def update(self, stacks: Iterable[Stack]) -> None:
+        """Index many stacks, replacing the tags indexed for those seen before."""
+        with self._lock:
+            for stack in stacks:
+                self._add(stack)
+            # Checking every cached result against every stack would cost more than running the queries again
+            self._results.clear()
+
+    def remove(self, stack: Union[Stack, str]) -> bool:
+        """
+        Remove a stack from the index.
+
+        Args:
+            stack: The stack, or its full name
+
+        Returns:
+            True if the stack was indexed
+        """
+        name = stack.full_name if isinstance(stack, Stack) else stack
+        with self._lock:
+            if name not in self._stacks:
+                return False
+            del self._stacks[name]
+            self._invalidate(self._unlink(name), None)
+            return True
+
+    def _add(self, stack: Stack) -> Dict[str, str]:
+        """Index a stack, returning the tags indexed for it (call with the lock held)."""
+        name = stack.full_name
+        if name in self._stacks:
+            self._unlink(name)
+        tags = dict(stack.tags or {})
+        self._stacks[name] = stack
+        self._tags[name] = tags
+        for key, value in tags.items():
+            self._postings.setdefault(key, {}).setdefault(value, set()).add(name)
+            self._with_key.setdefault(key, set()).add(name)
+        return tags
+
+    def _unlink(self, name: str) -> Dict[str, str]:
+        """Remove a stack's tags from the postings, returning them (call with the lock held)."""
+        tags = self._tags.pop(name)
+        for key, value in tags.items():
+            values = self._postings[key]
+            values[value].discard(name)
+            if not values[value]:
+                del values[value]
+            self._with_key[key].discard(name)
+            if not self._with_key[key]:
+                del self._postings[key], self._with_key[key]
+        return tags
+
+    def _invalidate(self, previous: Optional[Dict[str, str]], current: Optional[Dict[str, str]]) -> None:
+        """Drop the cached results that a stack's change of tags affects (call with the lock held).
+
+        ``previous`` and ``current`` are None when the stack was not, or is no longer, indexed.
+        """
+        stale = [
+            selector
+            for selector in self._results
+            if (previous is not None and selector.matches(previous))
+            != (current is not None and selector.matches(current))
+        ]
+        for selector in stale:
+            del self._results[selector]
+
+    def names(self, selector: Union[str, Selector]) -> FrozenSet[str]:
+        """
+        Return the full names of the stacks matching a selector.
+
+        Args:
+            selector: Selector expression or parsed selector
+
+        Returns:
+            Full names of the matching stacks
+
+        Raises:
+            ValueError: If the selector is malformed
+        """
+        parsed = parse_selector(selector) if isinstance(selector, str) else selector
+        with self._lock:
+            return self._names(parsed)
+
+    def select(self, selector: Union[str, Selector]) -> List[Stack]:
+        """Return the stacks matching a selector, in no particular order."""
+        parsed = parse_selector(selector) if isinstance(selector, str) else selector
+        with self._lock:
+            stacks = self._stacks
+            return [stacks[name] for name in self._names(parsed)]
+
+    def count(self, selector: Union[str, Selector]) -> int:
+        """Return the number of stacks matching a selector."""
+        return len(self.names(selector))
+
+    def values(self, key: str) -> Dict[str, int]:
+        """
+        Return how many stacks carry each value of a tag.
+
+        Args:
+            key: Tag key
+
+        Returns:
+            Number of stacks keyed by tag value, sorted by value
+        """
+        with self._lock:
+            return {value: len(names) for value, names in sorted(self._postings.get(key, {}).items())}
+
+    def tag_keys(self) -> List[str]:
+        """Return every tag key carried by an indexed stack, sorted."""
+        with self._lock:
+            return sorted(self._postings)
+
+    def _names(self, selector: Selector) -> FrozenSet[str]:
+        """Return the stacks matching a selector, from the result cache if possible (call with the lock held)."""
+        result = self._results.get(selector)
+        if result is not None:
+            self._results.move_to_end(selector)
+            return result
+        result = self._results[selector] = self._evaluate(selector)
+        if len(self._results) > self.cache_size:
+            self._results.popitem(last=False)
+        return result
+
+    def _matching(self, requirement: Requirement) -> Set[str]:
+        """Return the stacks having the tag of a requirement with one of its values, or at all."""
+        if requirement.operator in (EXISTS, NOT_EXISTS):
+            return self._with_key.get(requirement.key, set())
+        postings = self._postings.get(requirement.key, {})
+        if len(requirement.values) == 1:
+            return postings.get(next(iter(requirement.values)), set())
+        return set().union(*(postings.get(value, _EMPTY) for value in requirement.values))
+
+    def _evaluate(self, selector: Selector) -> FrozenSet[str]:
+        """Evaluate a selector with set algebra (call with the lock held)."""
+        included = []
+        excluded = []
+        for requirement in selector.requirements:
+            matching = self._matching(requirement)
+            if requirement.operator in (EQUALS, IN, EXISTS):
+                if not matching:
+                    return _EMPTY
+                included.append(matching)
+            elif matching:
+                excluded.append(matching)
+
+        if included:
+            # Intersect from the smallest set, so the work is bounded by the most selective requirement
+            included.sort(key=len)
+            result = frozenset(included[0].intersection(*included[1:]))
+        else:
+            result = frozenset(self._stacks)
+        for matching in excluded:
+            if not result:
+                break
+            result = result.difference(matching)
+        return result
@@ -0,0 +1,631 @@
+"""Local stand-in for the Pulumi Cloud API, for load and fault testing.
+
+:class:`FakePulumiServer` serves a generated :class:`FakeDataset` over real HTTP on a local port,
+covering the endpoints used by the resource classes. Response latency, rate limiting and server
+errors can be injected, so retries, concurrency and throughput can be exercised offline::
+
+    with FakePulumiServer(FakeDataset(stacks=500), latency=lognormal_latency(0.02, 0.5)) as server:
+        client = server.client(max_retries=5)
+        stacks = client.stacks.list("org-0")
+"""
+
+import json
+import math
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Collection, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .client import PulumiClient
+from .routes import _split, endpoint_template
+
+# Draws a response latency in seconds
+LatencyModel = Callable[[random.Random], float]
+
+StackKey = Tuple[str, str, str]
+
+
+def constant_latency(seconds: float) -> LatencyModel:
+    """Return a latency model that always waits ``seconds``."""
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyModel:
+    """Return a latency model drawing uniformly between ``low`` and ``high`` seconds."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5, maximum: Optional[float] = None) -> LatencyModel:
+    """
+    Return a long-tailed latency model, as typically observed for real API calls.
+
+    Args:
+        median: Median latency in seconds
+        sigma: Spread of the distribution; larger values give a heavier tail
+        maximum: Optional cap on the latency in seconds
+
+    Returns:
+        The latency model
+    """
+    mu = math.log(median)
+
+    def latency(rng: random.Random) -> float:
+        value = rng.lognormvariate(mu, sigma)
+        return min(value, maximum) if maximum is not None else value
+
+    return latency
+
+
+@dataclass
+class FaultConfig:
+    """Random failures injected by a :class:`FakePulumiServer`.
+
+    Each request is rejected with a 429 with probability ``rate_limit_rate``, or otherwise with
+    ``error_status`` with probability ``error_rate``. ``endpoints`` restricts the faults to some
+    endpoint templates, e.g. ``{"/api/stacks/{org}/{project}/{stack}"}``. With ``max_concurrency``
+    set, requests arriving while that many are already being handled are rejected at once with a
+    429, like a service shedding load.
+    """
+
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit_rate: float = 0.0
+    retry_after: Optional[float] = None
+    endpoints: Optional[Collection[str]] = None
+    max_concurrency: Optional[int] = None
+
+
+class FakeDataset:
+    """Organizations, projects, stacks, members and policy packs served by a :class:`FakePulumiServer`.
+
+    The dataset is generated deterministically from its sizes and ``seed``. Stacks are named
+    ``stack-<n>`` in projects ``project-<n>`` of organizations ``org-<n>``, carry ``env`` and
+    ``team`` tags, and export ``resources`` resources each.
+    """
+
+    ENVIRONMENTS = ("dev", "staging", "prod")
+    TEAMS = ("platform", "payments", "search", "data")
+
+    def __init__(
+        self,
+        organizations: int = 1,
+        projects: int = 2,
+        stacks: int = 5,
+        resources: int = 10,
+        members: int = 3,
+        policy_packs: int = 1,
+        seed: int = 0,
+    ):
+        """
+        Initialize the dataset.
+
+        Args:
+            organizations: Number of organizations
+            projects: Number of projects per organization
+            stacks: Number of stacks per project
+            resources: Number of resources in each stack's deployment
+            members: Number of members per organization
+            policy_packs: Number of policy packs per organization
+            seed: Seed of the generated timestamps and tags
+        """
+        rng = random.Random(seed)
+        epoch = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        self.lock = threading.RLock()
+        self.organizations: Dict[str, Dict[str, Any]] = {}
+        self.projects: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.stacks: Dict[StackKey, Dict[str, Any]] = {}
+        self.members: Dict[str, List[Dict[str, Any]]] = {}
+        self.policy_packs: Dict[str, List[Dict[str, Any]]] = {}
+
+        for o in range(organizations):
+            org = f"org-{o}"
+            self.add_organization(org)
+            self.members[org] = [
+                {"role": "admin" if m == 0 else "member", "user": {"name": f"User {m}", "githubLogin": f"user-{m}"}}
+                for m in range(members)
+            ]
+            self.policy_packs[org] = [
+                {"name": f"policy-pack-{p}", "displayName": f"Policy Pack {p}", "version": 1, "organization": org}
+                for p in range(policy_packs)
+            ]
+            for p in range(projects):
+                for s in range(stacks):
+                    updated = epoch + timedelta(seconds=rng.randrange(365 * 86400))
+                    tags = {"env": rng.choice(self.ENVIRONMENTS), "team": rng.choice(self.TEAMS)}
+                    self.add_stack(org, f"project-{p}", f"stack-{s}", resources, updated, tags)
+
+    @staticmethod
+    def _timestamp(value: datetime) -> str:
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def add_organization(self, org: str) -> Dict[str, Any]:
+        """Add an organization if it does not exist yet and return it."""
+        with self.lock:
+            if org not in self.organizations:
+                self.organizations[org] = {"name": org, "displayName": org.title(), "githubLogin": org}
+                self.projects[org] = {}
+                self.members.setdefault(org, [])
+                self.policy_packs.setdefault(org, [])
+            return self.organizations[org]
+
+    def add_stack(
+        self,
+        org: str,
+        project: str,
+        stack: str,
+        resources: int = 0,
+        last_update: Optional[datetime] = None,
+        tags: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Add a stack, creating its organization and project as needed.
+
+        Args:
+            org: Organization name
+            project: Project name
+            stack: Stack name
+            resources: Number of resources in the stack's deployment
+            last_update: Time of the stack's last update (defaults to now)
+            tags: Stack tags
+
+        Returns:
+            The stack as returned by the API
+        """
+        updated = self._timestamp(last_update or datetime.now(timezone.utc))
+        item = {
+            "orgName": org,
+            "projectName": project,
+            "name": stack,
+            "lastUpdate": updated,
+            "resourceCount": resources,
+            "tags": dict(tags or {}),
+        }
+        with self.lock:
+            self.add_organization(org)
+            self.projects[org].setdefault(project, {"name": project, "createdOn": updated, "runtime": "python"})
+            self.stacks[(org, project, stack)] = item
+        return item
+
+    def list_stacks(self, org: str, project: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the stacks of an organization or project in listing order."""
+        with self.lock:
+            return [
+                item
+                for (stack_org, stack_project, _), item in self.stacks.items()
+                if stack_org == org and (project is None or stack_project == project)
+            ]
+
+    def export(self, key: StackKey) -> Dict[str, Any]:
+        """Return a generated deployment export for a stack."""
+        org, project, stack = key
+        count = self.stacks[key]["resourceCount"]
+        prefix = f"urn:pulumi:{stack}::{project}::"
+        provider = f"{prefix}pulumi:providers:aws::default"
+        resources: List[Dict[str, Any]] = [
+            {"urn": f"{prefix}pulumi:pulumi:Stack::{project}-{stack}", "type": "pulumi:pulumi:Stack"}
+        ]
+        resources.append({"urn": provider, "type": "pulumi:providers:aws", "id": "provider-0"})
+        for r in range(max(count - 2, 0)):
+            resources.append(
+                {
+                    "urn": f"{prefix}aws:s3/bucket:Bucket::bucket-{r}",
+                    "type": "aws:s3/bucket:Bucket",
+                    "id": f"bucket-{r}",
+                    "provider": f"{provider}::provider-0",
+                    "parent": resources[0]["urn"],
+                    "outputs": {"bucket": f"{org}-{stack}-bucket-{r}", "tags": self.stacks[key]["tags"]},
+                }
+            )
+        return {
+            "version": 3,
+            "deployment": {"manifest": {"time": self.stacks[key]["lastUpdate"]}, "resources": resources},
+        }
+
+
+class FakeAPIError(Exception):
+    """Raised by request handlers of the fake server to send an error response."""
+
+    def __init__(self, status_code: int, message: str):
+        """Initialize the error with the status code and message of the response."""
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid delayed-ACK stalls on keep-alive connections
+    disable_nagle_algorithm = True
+    server: "_HTTPServer"
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.fake.handle(self)
+
+    do_POST = do_PATCH = do_PUT = do_DELETE = do_HEAD = do_GET  # noqa: N815
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Accept bursts of connections from heavily concurrent clients
+    request_queue_size = 128
+    fake: "FakePulumiServer"
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients hang up on slow responses (timeouts, deadlines, lost hedges); that is expected
+        # here and not worth a traceback
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class FakePulumiServer:
+    """Local HTTP server mimicking the Pulumi Cloud API.
+
+    Every request is answered from a thread of its own after a delay drawn from ``latency``.
+    List endpoints return pages of ``page_size`` items with a continuation token. Failures come
+    from the random ``faults`` or are queued deterministically with :meth:`fail_next`.
+
+    The server counts requests per endpoint template and status code, and tracks the highest
+    number of requests handled at the same time, for assertions on the client's behavior.
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[FakeDataset] = None,
+        page_size: int = 100,
+        latency: Optional[LatencyModel] = None,
+        faults: Optional[FaultConfig] = None,
+        access_token: Optional[str] = None,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Initialize the server; it starts listening on :meth:`start` or when entering a ``with`` block.
+
+        Args:
+            dataset: Data served by the API (defaults to a small generated dataset)
+            page_size: Number of items per page of list endpoints
+            latency: Optional model of the delay before each response
+            faults: Optional random failures to inject
+            access_token: Token requests must carry (any token is accepted if None)
+            seed: Seed of the latency and fault draws
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+        """
+        self.dataset = dataset if dataset is not None else FakeDataset()
+        self.page_size = page_size
+        self.latency = latency
+        self.faults = faults
+        self.access_token = access_token
+        self.host = host
+        self.port = port
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._forced: Deque[Tuple[int, Optional[Collection[str]], Optional[float]]] = deque()
+        self._httpd: Optional[_HTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.request_counts: Counter = Counter()
+        self.status_counts: Counter = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self._routes: Dict[Tuple[str, str], Callable[[Dict[str, str], Dict[str, str], Any], Any]] = {
+            ("GET", "/api/user/organizations"): self._list_organizations,
+            ("GET", "/api/organizations/{org}"): self._get_organization,
+            ("GET", "/api/organizations/{org}/members"): self._list_members,
+            ("POST", "/api/organizations/{org}/members"): self._invite_member,
+            ("GET", "/api/organizations/{org}/projects"): self._list_projects,
+            ("GET", "/api/organizations/{org}/projects/{project}"): self._get_project,
+            ("GET", "/api/organizations/{org}/policy-packs"): self._list_policy_packs,
+            ("GET", "/api/organizations/{org}/policy-packs/{policy_pack}/versions/{version}"): self._get_policy_pack,
+            ("GET", "/api/stacks/{org}"): self._list_stacks,
+            ("GET", "/api/stacks/{org}/{project}"): self._list_stacks,
+            ("GET", "/api/stacks/{org}/{project}/{stack}"): self._get_stack,
+            ("POST", "/api/stacks/{org}/{project}/{stack}"): self._create_stack,
+            ("PATCH", "/api/stacks/{org}/{project}/{stack}"): self._update_stack,
+            ("DELETE", "/api/stacks/{org}/{project}/{stack}"): self._delete_stack,
+            ("GET", "/api/stacks/{org}/{project}/{stack}/updates/latest"): self._get_latest_update,
+            ("GET", "/api/stacks/{org}/{project}/{stack}/updates/{update_id}"): self._get_update,
+            ("GET", "/api/stacks/{org}/{project}/{stack}/tags"): self._get_tags,
+            ("PATCH", "/api/stacks/{org}/{project}/{stack}/tags"): self._update_tags,
+            ("GET", "/api/stacks/{org}/{project}/{stack}/export"): self._export,
+            ("POST", "/api/stacks/{org}/{project}/{stack}/transfer"): self._transfer,
+        }
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._httpd is None:
+            raise RuntimeError("The server is not running")
+        return f"http://{self.host}:{self._httpd.server_port}"
+
+    def start(self) -> "FakePulumiServer":
+        """Start serving requests in a background thread."""
+        if self._httpd is None:
+            self._httpd = _HTTPServer((self.host, self.port), _Handler)
+            self._httpd.fake = self
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-pulumi-server", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and close its socket."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakePulumiServer":
+        """Start the server when entering a ``with`` block."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the server when leaving a ``with`` block."""
+        self.stop()
+
+    def client(self, **kwargs: Any) -> PulumiClient:
+        """
+        Create a client talking to this server.
+
+        Args:
+            kwargs: Additional PulumiClient arguments
+
+        Returns:
+            The client
+        """
+        kwargs.setdefault("access_token", self.access_token or "fake-token")
+        return PulumiClient(base_url=self.url, **kwargs)
+
+    def fail_next(
+        self,
+        count: int = 1,
+        status_code: int = 503,
+        endpoints: Optional[Collection[str]] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Fail the next requests with an error status, regardless of the random faults.
+
+        Args:
+            count: Number of requests to fail
+            status_code: Status code of the error responses
+            endpoints: Only fail requests to these endpoint templates
+            retry_after: Value of the Retry-After header of the error responses
+        """
+        with self._lock:
+            self._forced.extend([(status_code, endpoints, retry_after)] * count)
+
+    def reset_stats(self) -> None:
+        """Clear the request counters."""
+        with self._lock:
+            self.request_counts.clear()
+            self.status_counts.clear()
+            self.max_in_flight = self.in_flight
+
+    def _injected_fault(self, endpoint: str) -> Optional[Tuple[int, Optional[float]]]:
+        """Return the status code and Retry-After of a fault to inject, if any (call with the lock held)."""
+        for index, (status_code, endpoints, retry_after) in enumerate(self._forced):
+            if endpoints is None or endpoint in endpoints:
+                del self._forced[index]
+                return status_code, retry_after
+
+        faults = self.faults
+        if faults is None or (faults.endpoints is not None and endpoint not in faults.endpoints):
+            return None
+        draw = self._rng.random()
+        if draw < faults.rate_limit_rate:
+            return 429, faults.retry_after
+        if draw < faults.rate_limit_rate + faults.error_rate:
+            return faults.error_status, None
+        return None
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        """Answer one HTTP request; called from the server's request threads."""
+        method = request.command
+        url = urlsplit(request.path)
+        endpoint = endpoint_template(url.path)
+        length = int(request.headers.get("Content-Length") or 0)
+        body = request.rfile.read(length) if length else b""
+
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.request_counts[f"{method} {endpoint}"] += 1
+            delay = self.latency(self._rng) if self.latency is not None else 0.0
+            faults = self.faults
+            fault: Optional[Tuple[int, Optional[float]]] = None
+            if method == "HEAD":
+                pass
+            elif faults is not None and faults.max_concurrency is not None and self.in_flight > faults.max_concurrency:
+                # Shed load straight away rather than after the usual latency
+                fault, delay = (429, faults.retry_after), 0.0
+            else:
+                fault = self._injected_fault(endpoint)
+
+        headers: Dict[str, str] = {}
+        status = 500
+        try:
+            if delay > 0:
+                time.sleep(delay)
+            if method == "HEAD":
+                status, payload = 200, None
+            elif self.access_token is not None and request.headers.get("Authorization") != f"token {self.access_token}":
+                status, payload = 401, {"code": 401, "message": "Unauthorized"}
+            elif fault is not None:
+                status, retry_after = fault
+                payload = {"code": status, "message": "Injected fault"}
+                if retry_after is not None:
+                    headers["Retry-After"] = f"{retry_after:g}"
+            else:
+                status, payload = self._route(method, url.path, endpoint, url.query, body)
+            self._respond(request, status, payload, headers)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.status_counts[status] += 1
+
+    def _route(self, method: str, path: str, endpoint: str, query: str, body: bytes) -> Tuple[int, Any]:
+        handler = self._routes.get((method, endpoint))
+        if handler is None:
+            return 404, {"code": 404, "message": f"No route for {method} {path}"}
+
+        args = {
+            template[1:-1]: value for template, value in zip(_split(endpoint), _split(path)) if template.startswith("{")
+        }
+        params = {key: values[-1] for key, values in parse_qs(query).items()}
+        try:
+            data = json.loads(body) if body else None
+            result = handler(args, params, data)
+            # Like the service, answer calls that return nothing with 204 No Content
+            return (200 if result is not None else 204), result
+        except FakeAPIError as e:
+            return e.status_code, {"code": e.status_code, "message": e.message}
+        except ValueError:
+            return 400, {"code": 400, "message": "Invalid JSON body"}
+
+    @staticmethod
+    def _respond(request: BaseHTTPRequestHandler, status: int, payload: Any, headers: Dict[str, str]) -> None:
+        content = json.dumps(payload).encode() if payload is not None else b""
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        if request.command != "HEAD":
+            request.wfile.write(content)
+
+    def _page(self, items: List[Any], items_key: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """Return one page of items, continuing from the offset encoded in the continuation token."""
+        start = int(params.get("continuationToken") or 0)
+        end = start + self.page_size
+        page: Dict[str, Any] = {items_key: items[start:end]}
+        if end < len(items):
+            page["continuationToken"] = str(end)
+        return page
+
+    def _stack(self, args: Dict[str, str]) -> Dict[str, Any]:
+        item = self.dataset.stacks.get((args["org"], args["project"], args["stack"]))
+        if item is None:
+            raise FakeAPIError(404, f"Stack '{args['org']}/{args['project']}/{args['stack']}' not found")
+        return item
+
+    def _organization(self, org: str) -> Dict[str, Any]:
+        item = self.dataset.organizations.get(org)
+        if item is None:
+            raise FakeAPIError(404, f"Organization '{org}' not found")
+        return item
+
+    def _list_organizations(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        with self.dataset.lock:
+            return list(self.dataset.organizations.values())
+
+    def _get_organization(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        return self._organization(args["org"])
+
+    def _list_members(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        self._organization(args["org"])
+        return self._page(list(self.dataset.members[args["org"]]), "members", params)
+
+    def _invite_member(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        self._organization(args["org"])
+        member = {"role": data.get("role", "member"), "user": {"email": data["email"]}}
+        with self.dataset.lock:
+            self.dataset.members[args["org"]].append(member)
+        return member
+
+    def _list_projects(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        self._organization(args["org"])
+        with self.dataset.lock:
+            projects = list(self.dataset.projects[args["org"]].values())
+        return self._page(projects, "projects", params)
+
+    def _get_project(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        self._organization(args["org"])
+        project = self.dataset.projects[args["org"]].get(args["project"])
+        if project is None:
+            raise FakeAPIError(404, f"Project '{args['project']}' not found")
+        return project
+
+    def _list_policy_packs(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        self._organization(args["org"])
+        return self._page(list(self.dataset.policy_packs[args["org"]]), "policyPacks", params)
+
+    def _get_policy_pack(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        self._organization(args["org"])
+        for pack in self.dataset.policy_packs[args["org"]]:
+            if pack["name"] == args["policy_pack"]:
+                return {**pack, "version": int(args["version"]) if args["version"].isdigit() else args["version"]}
+        raise FakeAPIError(404, f"Policy pack '{args['policy_pack']}' not found")
+
+    def _list_stacks(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        return self._page(self.dataset.list_stacks(args["org"], args.get("project")), "stacks", params)
+
+    def _get_stack(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        return self._stack(args)
+
+    def _create_stack(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        with self.dataset.lock:
+            if (args["org"], args["project"], args["stack"]) in self.dataset.stacks:
+                raise FakeAPIError(409, f"Stack '{args['stack']}' already exists")
+            return self.dataset.add_stack(args["org"], args["project"], args["stack"])
+
+    def _update_stack(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        with self.dataset.lock:
+            item = self._stack(args)
+            item.update(data or {})
+            return item
+
+    def _delete_stack(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        with self.dataset.lock:
+            self._stack(args)
+            del self.dataset.stacks[(args["org"], args["project"], args["stack"])]
+        return None
+
+    def _get_latest_update(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        item = self._stack(args)
+        return {"info": {"kind": "update", "result": "succeeded", "endTime": item["lastUpdate"]}, "version": 1}
+
+    def _get_update(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        self._stack(args)
+        return {"info": {"kind": "update", "result": "succeeded"}, "updateID": args["update_id"]}
+
+    def _get_tags(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        return dict(self._stack(args)["tags"])
+
+    def _update_tags(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        with self.dataset.lock:
+            self._stack(args)["tags"] = dict(data or {})
+        return None
+
+    def _export(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        self._stack(args)
+        return self.dataset.export((args["org"], args["project"], args["stack"]))
+
+    def _transfer(self, args: Dict[str, str], params: Dict[str, str], data: Any) -> Any:
+        new_org = (data or {}).get("toOrg")
+        if not new_org:
+            raise FakeAPIError(400, "toOrg is required")
+        with self.dataset.lock:
+            item = self._stack(args)
+            if (new_org, args["project"], args["stack"]) in self.dataset.stacks:
+                raise FakeAPIError(409, f"Stack '{args['stack']}' already exists in '{new_org}'")
+            del self.dataset.stacks[(args["org"], args["project"], args["stack"])]
+            updated = self.dataset.add_stack(new_org, args["project"], args["stack"], item["resourceCount"])
+            updated.update(lastUpdate=item["lastUpdate"], tags=item["tags"])
+        return None
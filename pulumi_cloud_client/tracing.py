@@ -0,0 +1,275 @@
+"""Request tracing for the Pulumi Cloud API client.
+
+Records nested spans for resource method calls, API requests, each retry attempt and the time
+spent queueing for the rate limiter, on the network, decoding, sleeping between attempts and
+building model objects. Finished spans are handed to a pluggable exporter.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """A timed operation, part of a trace.
+
+    ``start_time`` is in seconds since the epoch and ``duration`` in seconds. ``parent_id`` is
+    None for the root span of a trace.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_time",
+        "duration",
+        "attributes",
+        "error",
+        "_parent",
+        "_started",
+        "_last_child_end",
+    )
+
+    def __init__(
+        self, name: str, parent: Optional["Span"], started: float, start_time: float, attributes: Dict[str, Any]
+    ):
+        """Initialize the span; use :meth:`Tracer.start_span` rather than creating spans directly."""
+        self.name = name
+        self.trace_id: str = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.span_id: str = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_time = start_time
+        self.duration: Optional[float] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self._parent = parent
+        self._started = started
+        self._last_child_end: Optional[float] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a key-value attribute to the span."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the span as a JSON-compatible dictionary."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        """Return a short representation of the span."""
+        return f"Span(name={self.name!r}, duration={self.duration!r}, attributes={self.attributes!r})"
+
+
+class InMemoryExporter:
+    """Keeps finished spans in a list, e.g. for tests or in-process analysis."""
+
+    def __init__(self) -> None:
+        """Initialize the exporter."""
+        self._lock = threading.Lock()
+        self.spans: List[Span] = []
+
+    def export(self, span: Span) -> None:
+        """Store a finished span."""
+        with self._lock:
+            self.spans.append(span)
+
+    def traces(self) -> Dict[str, List[Span]]:
+        """Return the stored spans grouped by trace ID, in the order they finished."""
+        traces: Dict[str, List[Span]] = {}
+        with self._lock:
+            for span in self.spans:
+                traces.setdefault(span.trace_id, []).append(span)
+        return traces
+
+    def clear(self) -> None:
+        """Discard the stored spans."""
+        with self._lock:
+            self.spans.clear()
+
+
+class JSONFileExporter:
+    """Appends finished spans to a file as JSON lines."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: Path of the file to append to
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        """Write a finished span."""
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            self._file.close()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("pulumi_cloud_client_span", default=None)
+
+
+class Tracer:
+    """Creates spans and passes them to an exporter once they finish.
+
+    Pass one to ``PulumiClient(tracer=...)``. The current span is tracked in a context variable, so
+    spans nest across function calls, and :class:`~pulumi_cloud_client.bulk.BulkExecutor` workers
+    continue the trace of the caller. Without a tracer the client records nothing.
+    """
+
+    def __init__(self, exporter: Any = None):
+        """
+        Initialize the tracer.
+
+        Args:
+            exporter: Object with an ``export(span)`` method (defaults to an InMemoryExporter)
+        """
+        self.exporter = exporter if exporter is not None else InMemoryExporter()
+        # Spans are timed with the monotonic clock and reported in wall clock time
+        self._epoch_offset = time.time() - time.monotonic()
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        """Return the span active in the current context, if any."""
+        return _current_span.get()
+
+    def start_span(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        started: Optional[float] = None,
+        **attributes: Any,
+    ) -> Span:
+        """
+        Start a span without making it current.
+
+        Args:
+            name: Name of the span
+            parent: Parent span (defaults to the current span)
+            started: Start time on the ``time.monotonic`` clock (defaults to now)
+            attributes: Attributes of the span
+
+        Returns:
+            The started span; pass it to :meth:`finish` when the operation ends
+        """
+        if started is None:
+            started = time.monotonic()
+        if parent is None:
+            parent = _current_span.get()
+        return Span(name, parent, started, started + self._epoch_offset, attributes)
+
+    def finish(self, span: Span, ended: Optional[float] = None, error: Optional[BaseException] = None) -> None:
+        """
+        Finish a span and export it.
+
+        Args:
+            span: Span to finish
+            ended: End time on the ``time.monotonic`` clock (defaults to now)
+            error: Exception that ended the operation, if any
+        """
+        if ended is None:
+            ended = time.monotonic()
+        span.duration = ended - span._started
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        if span._parent is not None:
+            span._parent._last_child_end = ended
+        self.exporter.export(span)
+
+    def record(self, name: str, started: float, ended: float, parent: Optional[Span] = None, **attributes: Any) -> Span:
+        """
+        Record an operation that has already finished.
+
+        Args:
+            name: Name of the span
+            started: Start time on the ``time.monotonic`` clock
+            ended: End time on the ``time.monotonic`` clock
+            parent: Parent span (defaults to the current span)
+            attributes: Attributes of the span
+
+        Returns:
+            The exported span
+        """
+        span = self.start_span(name, parent, started, **attributes)
+        self.finish(span, ended)
+        return span
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Run a block inside a new span, made current for its duration.
+
+        Args:
+            name: Name of the span
+            attributes: Attributes of the span
+
+        Yields:
+            The span
+        """
+        span = self.start_span(name, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.finish(span, error=e)
+            raise
+        else:
+            self.finish(span)
+        finally:
+            _current_span.reset(token)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """
+    Trace calls to a resource method when its client has a tracer.
+
+    The method runs inside a span named ``name``. The time between the end of its last child span
+    (usually the API request) and the method's return is recorded as a ``model`` span, covering
+    the construction of the returned model objects.
+
+    Args:
+        name: Name of the span, e.g. ``stacks.get``
+
+    Returns:
+        The method decorator
+    """
+
+    def decorator(method: F) -> F:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            tracer = getattr(self.client, "tracer", None)
+            if not isinstance(tracer, Tracer):
+                return method(self, *args, **kwargs)
+
+            with tracer.span(name) as span:
+                result = method(self, *args, **kwargs)
+                if span._last_child_end is not None:
+                    tracer.record("model", span._last_child_end, time.monotonic(), parent=span)
+                return result
+
+        return cast(F, wrapper)
+
+    return decorator
@@ -0,0 +1,153 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from pulumi_cloud_client.circuit import HALF_OPEN, CircuitBreaker
+from pulumi_cloud_client.exceptions import DeadlineExceededError, PulumiAPIError
+from pulumi_cloud_client.models.stack import Stack
+from pulumi_cloud_client.ratelimit import RateLimiter
+from pulumi_cloud_client.resources.stacks import AsyncStacksResource
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    from pulumi_cloud_client.async_client import AsyncPulumiClient
+except ImportError:  # pragma: no cover
+    web = None  # type: ignore[assignment]
+
+
+class TestAsyncStacksResource(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncStacksResource class."""
+
+    def setUp(self):
+        """Set up test fixtures before each test."""
+        self.mock_client = Mock()
+        self.mock_client._make_request = AsyncMock()
+        self.stacks_resource = AsyncStacksResource(self.mock_client)
+
+    async def test_list(self):
+        """Test listing stacks."""
+        self.mock_client._make_request.return_value = [
+            {"name": "dev", "orgName": "test-org", "projectName": "test-project", "resourceCount": 5},
+        ]
+
+        result = await self.stacks_resource.list("test-org", "test-project")
+
+        self.mock_client._make_request.assert_awaited_once_with("get", "/api/stacks/test-org/test-project")
+        self.assertIsInstance(result[0], Stack)
+        self.assertEqual(result[0].resource_count, 5)
+
+    async def test_transfer_stack(self):
+        """Test transferring a stack."""
+        self.mock_client._make_request.return_value = {
+            "name": "dev",
+            "orgName": "new-org",
+            "projectName": "test-project",
+        }
+
+        result = await self.stacks_resource.transfer_stack("test-org", "test-project", "dev", "new-org")
+
+        self.mock_client._make_request.assert_awaited_once_with(
+            "post", "/api/stacks/test-org/test-project/dev/transfer", data={"toOrg": "new-org"}
+        )
+        self.assertEqual(result.organization, "new-org")
+
+    async def test_transfer_stack_without_content(self):
+        """Test that a transfer answered with no content reads the stack back from its new organization."""
+        self.mock_client._make_request.side_effect = [
+            None,
+            {"name": "dev", "orgName": "new-org", "projectName": "test-project"},
+        ]
+
+        result = await self.stacks_resource.transfer_stack("test-org", "test-project", "dev", "new-org")
+
+        self.mock_client._make_request.assert_awaited_with("get", "/api/stacks/new-org/test-project/dev")
+        self.assertEqual(result.full_name, "new-org/test-project/dev")
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncPulumiClient(unittest.IsolatedAsyncioTestCase):
+    """Tests for AsyncPulumiClient against a local HTTP server."""
+
+    async def asyncSetUp(self):
+        """Start a local server that fails once before succeeding."""
+        self.calls = 0
+
+        async def get_org(request):
+            self.calls += 1
+            if self.calls == 1:
+                return web.json_response({"message": "try again"}, status=503)
+            return web.json_response({"name": request.match_info["org"]})
+
+        async def missing(request):
+            return web.json_response({"message": "not found"}, status=404)
+
+        async def slow(request):
+            await asyncio.sleep(1)
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_get("/api/organizations/{org}", get_org)
+        app.router.add_get("/api/missing", missing)
+        app.router.add_get("/api/slow", slow)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.client = AsyncPulumiClient("token", base_url=str(self.server.make_url("")), retry_delay=0)
+
+    async def asyncTearDown(self):
+        """Stop the server and close the client."""
+        await self.client.close()
+        await self.server.close()
+
+    async def test_retries_server_errors(self):
+        """Test that 5xx responses are retried."""
+        org = await self.client.organizations.get("acme")
+
+        self.assertEqual(org.name, "acme")
+        self.assertEqual(self.calls, 2)
+
+    async def test_raises_api_error(self):
+        """Test that non-retryable errors raise PulumiAPIError."""
+        with self.assertRaises(PulumiAPIError) as ctx:
+            await self.client.request("GET", "/api/missing")
+
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(ctx.exception.message, "not found")
+
+    async def test_deadline(self):
+        """Test that a call's deadline cuts short a slow attempt and its retries."""
+        with self.assertRaises(DeadlineExceededError) as ctx:
+            await self.client.request("GET", "/api/slow", deadline=0.1)
+
+        self.assertIsInstance(ctx.exception.__cause__, asyncio.TimeoutError)
+
+    async def test_cancelled_call_releases_probe(self):
+        """Test that cancelling a half-open probe call lets the next call probe the endpoint."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0)
+        breaker.record("/api/slow", 503)
+        self.client.circuit_breaker = breaker
+
+        task = asyncio.ensure_future(self.client.request("GET", "/api/slow"))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        breaker.before_call("/api/slow")
+        self.assertEqual(breaker.state("/api/slow"), HALF_OPEN)
+
+    async def test_deadline_bounds_rate_limiter_wait(self):
+        """Test that a call fails at once rather than wait for a rate limiter slot past its deadline."""
+        self.client.rate_limiter = RateLimiter(rate=1, burst=1)
+        self.client.rate_limiter.reserve()
+
+        with self.assertRaises(DeadlineExceededError) as ctx:
+            await self.client.request("GET", "/api/organizations/acme", deadline=0.1)
+
+        self.assertEqual(ctx.exception.attempts, 0)
+        self.assertEqual(self.calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.run import compare, main, run_benchmarks
+
+
+def _results(**values):
+    return {
+        "meta": {"scale": 1.0},
+        "results": {
+            name: {"value": value, "unit": "", "higher_is_better": name.endswith("throughput")}
+            for name, value in values.items()
+        },
+    }
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Tests for the benchmark runner."""
+
+    def test_compare(self):
+        """Test that only metrics worse than the baseline by more than the tolerance are reported."""
+        baseline = _results(list_throughput=1000.0, get_p99=10.0, import_time=100.0)
+        current = _results(list_throughput=700.0, get_p99=11.0, import_time=200.0, new_metric=1.0)
+
+        regressions = compare(current, baseline, tolerance=0.25)
+
+        self.assertEqual([r.name for r in regressions], ["list_throughput", "import_time"])
+        self.assertAlmostEqual(regressions[0].change, -0.3)
+        self.assertEqual(compare(baseline, current, tolerance=0.25), [])
+
+    def test_quick_run_against_baseline(self):
+        """Test a scaled-down run, saving a baseline and comparing with it."""
+        results = run_benchmarks(["list", "transfer", "models"], scale=0.01)
+        self.assertEqual(
+            set(results["results"]),
+            {"stacks_list.throughput", "transfer_many.throughput", "stack_model.construction"},
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            baseline = os.path.join(tmpdir, "baseline.json")
+            with open(baseline, "w") as f:
+                json.dump(_results(**{"stack_model.construction": 1e-9}), f)
+
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                exit_code = main(["--only", "models", "--scale", "0.01", "--baseline", baseline])
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("REGRESSION stack_model.construction", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from pulumi_cloud_client.bulk import BulkExecutor, TagDiff, TransferJournal, diff_tags
+from pulumi_cloud_client.exceptions import PulumiAPIError
+from pulumi_cloud_client.models.stack import Stack
+from pulumi_cloud_client.resources.stacks import StacksResource
+from pulumi_cloud_client.testing import FakeDataset, FakePulumiServer
+
+TAGS_ENDPOINT = "/api/stacks/{org}/{project}/{stack}/tags"
+
+
+def _stack(name):
+    return Stack(name=name, organization="old-org", project="proj", last_update=None, resource_count=0)
+
+
+class TestBulkExecutor(unittest.TestCase):
+    """Tests for the BulkExecutor class."""
+
+    def test_map_unordered_captures_errors(self):
+        """Test that every item yields a result and errors are captured."""
+
+        def fn(item):
+            if item == 3:
+                raise ValueError("boom")
+            return item * 2
+
+        results = list(BulkExecutor(max_workers=2).map_unordered(fn, range(5)))
+
+        self.assertEqual(sorted(r.result for r in results if r.ok), [0, 2, 4, 8])
+        self.assertEqual([r.item for r in results if not r.ok], [3])
+
+
+class TestTransferMany(unittest.TestCase):
+    """Tests for StacksResource.transfer_many."""
+
+    def setUp(self):
+        """Set up a mocked client and a temporary journal path."""
+        self.client = Mock()
+        self.stacks_resource = StacksResource(self.client)
+        self.client.stacks = self.stacks_resource
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.tmpdir.name, "transfer.jsonl")
+
+    def tearDown(self):
+        """Remove the temporary journal."""
+        self.tmpdir.cleanup()
+
+    def _transfer_response(self, fail=()):
+        def make_request(method, path, data=None):
+            stack_name = path.split("/")[-2]
+            if stack_name in fail:
+                raise PulumiAPIError(status_code=409, message="conflict")
+            return {"name": stack_name, "orgName": data["toOrg"], "projectName": "proj"}
+
+        return make_request
+
+    def test_transfers_and_journals(self):
+        """Test that transfers are journaled as they complete."""
+        self.client._make_request.side_effect = self._transfer_response(fail={"b"})
+        progress = []
+
+        summary = self.stacks_resource.transfer_many(
+            "new-org",
+            [_stack("a"), _stack("b"), _stack("c")],
+            journal_path=self.journal_path,
+            max_workers=2,
+            progress_callback=lambda p, key, error: progress.append((p.remaining, key, error)),
+        )
+
+        self.assertEqual(sorted(s.name for s in summary.transferred), ["a", "c"])
+        self.assertEqual(summary.failed, {"old-org/proj/b": "conflict (Status: 409)"})
+        self.assertEqual(sorted(remaining for remaining, _, _ in progress), [0, 1, 2])
+
+        plan, transferred, failed = TransferJournal(self.journal_path).load()
+        self.assertEqual(plan["destination"], "new-org")
+        self.assertEqual(transferred, {"old-org/proj/a", "old-org/proj/c"})
+        self.assertEqual(set(failed), {"old-org/proj/b"})
+
+    def test_transfer_without_response_body_succeeds(self):
+        """Test that transfers the API answers with 204 No Content count as transferred."""
+        server = FakePulumiServer(FakeDataset(organizations=1, projects=1, stacks=3, resources=0))
+        server.start()
+        self.addCleanup(server.stop)
+        client = server.client()
+        self.addCleanup(client.close)
+
+        summary = client.stacks.transfer_many("org-9", client.stacks.list("org-0"), journal_path=self.journal_path)
+
+        self.assertEqual(summary.failed, {})
+        self.assertEqual(
+            sorted(s.full_name for s in summary.transferred), [f"org-9/project-0/stack-{i}" for i in range(3)]
+        )
+        self.assertEqual(server.status_counts[204], 3)
+        self.assertEqual(len(TransferJournal(self.journal_path).load()[1]), 3)
+
+    def test_resume_skips_transferred_stacks(self):
+        """Test that a restarted job reads the plan from the journal and skips finished stacks."""
+        self.client._make_request.side_effect = self._transfer_response(fail={"b"})
+        self.stacks_resource.transfer_many("new-org", [_stack("a"), _stack("b")], journal_path=self.journal_path)
+
+        # Simulate a crash in the middle of writing a record
+        with open(self.journal_path, "a") as journal:
+            journal.write('{"type": "transf')
+
+        self.client._make_request.reset_mock()
+        self.client._make_request.side_effect = self._transfer_response()
+        summary = self.stacks_resource.transfer_many("new-org", journal_path=self.journal_path)
+
+        self.client._make_request.assert_called_once_with(
+            "post", "/api/stacks/old-org/proj/b/transfer", data={"toOrg": "new-org"}
+        )
+        self.assertEqual([s.name for s in summary.transferred], ["b"])
+        self.assertEqual(summary.skipped, 1)
+
+    def test_resume_rejects_other_destination(self):
+        """Test that a journal cannot be resumed towards a different organization."""
+        self.client._make_request.side_effect = self._transfer_response()
+        self.stacks_resource.transfer_many("new-org", [_stack("a")], journal_path=self.journal_path)
+
+        with self.assertRaises(ValueError):
+            self.stacks_resource.transfer_many("other-org", journal_path=self.journal_path)
+
+    def test_requires_stacks_without_journal(self):
+        """Test that stacks are required when there is nothing to resume."""
+        with self.assertRaises(ValueError):
+            self.stacks_resource.transfer_many("new-org")
+
+
+class TestDiffTags(unittest.TestCase):
+    """Tests for the diff_tags function."""
+
+    def test_minimal_diff(self):
+        """Test that only tags that differ are reported, and None values remove tags."""
+        current = {"env": "dev", "team": "web", "owner": "alice"}
+
+        diff = diff_tags(current, {"env": "prod", "team": "web", "cost": "123", "owner": None, "gone": None})
+
+        self.assertEqual(
+            diff, TagDiff(added={"cost": "123"}, changed={"env": ("dev", "prod")}, removed={"owner": "alice"})
+        )
+        self.assertEqual(diff.apply(current), {"env": "prod", "team": "web", "cost": "123"})
+        self.assertFalse(diff_tags(current, {"env": "dev"}))
+        self.assertEqual(diff_tags(current, {"env": "dev"}, prune=True).removed, {"team": "web", "owner": "alice"})
+
+
+class TestUpdateTagsMany(unittest.TestCase):
+    """Tests for StacksResource.update_tags_many against a local server."""
+
+    def setUp(self):
+        """Start a server with ten stacks tagged with an environment and a team."""
+        self.server = FakePulumiServer(FakeDataset(projects=2, stacks=5, resources=0))
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.client = self.server.client()
+        self.addCleanup(self.client.close)
+        self.stacks = self.client.stacks.list("org-0")
+
+    def _requests(self, method):
+        return self.server.request_counts.get(f"{method} {TAGS_ENDPOINT}", 0)
+
+    def test_writes_only_stacks_that_differ(self):
+        """Test that listed tags are reused and only stacks whose tags differ are written, once."""
+        prod = {stack.full_name for stack in self.stacks if stack.tags["env"] == "prod"}
+        self.assertTrue(prod)
+
+        def policy(stack):
+            return {"tier": "critical"} if stack.tags["env"] == "prod" else None
+
+        summary = self.client.stacks.update_tags_many(policy, self.stacks, max_workers=3)
+
+        self.assertEqual(set(summary.changed), prod)
+        self.assertEqual(len(summary.unchanged), 10 - len(prod))
+        self.assertEqual((summary.failed, summary.fetched), ({}, 0))
+        self.assertEqual((self._requests("GET"), self._requests("PATCH")), (0, len(prod)))
+        for key in prod:
+            self.assertEqual(self.server.dataset.stacks[tuple(key.split("/"))]["tags"]["tier"], "critical")
+
+        # The updated Stack objects carry their new tags, so a second run writes nothing
+        summary = self.client.stacks.update_tags_many(policy, self.stacks)
+        self.assertEqual((summary.changed, len(summary.unchanged)), ({}, 10))
+        self.assertEqual(self._requests("PATCH"), len(prod))
+
+    def test_fetches_tags_without_stacks(self):
+        """Test that a desired mapping without stacks fetches current tags, and that failures are reported."""
+        desired = {
+            "org-0/project-0/stack-0": {"env": "prod", "team": None},
+            "org-0/project-0/stack-1": {"env": "prod"},
+            "org-0/project-0/missing": {"env": "prod"},
+        }
+        self.client.stacks.update_tags("org-0", "project-0", "stack-1", {"env": "prod"})
+
+        summary = self.client.stacks.update_tags_many(desired, prune=True, dry_run=True)
+
+        self.assertEqual(summary.fetched, 2)
+        self.assertEqual(list(summary.changed), ["org-0/project-0/stack-0"])
+        self.assertEqual(summary.changed["org-0/project-0/stack-0"].removed["team"], self.stacks[0].tags["team"])
+        self.assertEqual(summary.unchanged, ["org-0/project-0/stack-1"])
+        self.assertIn("404", summary.failed["org-0/project-0/missing"])
+        self.assertEqual(self._requests("PATCH"), 1)
+
+    def test_fetches_tags_missing_from_listing(self):
+        """Test that stacks listed without tags have them fetched rather than treated as untagged."""
+        listed = Stack.from_api_response({"name": "stack-0", "orgName": "org-0", "projectName": "project-0"})
+        before = dict(self.server.dataset.stacks[("org-0", "project-0", "stack-0")]["tags"])
+
+        summary = self.client.stacks.update_tags_many({listed.full_name: {"tier": "critical"}}, [listed])
+
+        self.assertEqual(summary.fetched, 1)
+        self.assertEqual(
+            self.server.dataset.stacks[("org-0", "project-0", "stack-0")]["tags"], {**before, "tier": "critical"}
+        )
+        self.assertEqual(listed.tags, {**before, "tier": "critical"})
+
+    def test_requires_stacks_for_a_function(self):
+        """Test that a policy function needs the stacks to apply it to."""
+        with self.assertRaises(ValueError):
+            self.client.stacks.update_tags_many(lambda stack: {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import json
+import unittest
+from unittest.mock import Mock
+
+from pulumi_cloud_client.cache import ResponseCache
+from pulumi_cloud_client.client import PulumiClient
+from pulumi_cloud_client.routes import endpoint_template
+from tests.helpers import FakeClock
+
+
+def _response(status_code=200, body=None, headers=None):
+    content = json.dumps(body).encode() if body is not None else b""
+    return Mock(status_code=status_code, headers=headers or {}, content=content)
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the ResponseCache class."""
+
+    def setUp(self):
+        """Set up a cache driven by a fake clock."""
+        self.clock = FakeClock()
+        self.cache = ResponseCache(max_entries=2, default_ttl=10, clock=self.clock)
+
+    def test_endpoint_template(self):
+        """Test mapping request paths to endpoint templates."""
+        self.assertEqual(endpoint_template("/api/stacks/o/p/s/export"), "/api/stacks/{org}/{project}/{stack}/export")
+        self.assertEqual(
+            endpoint_template("/api/stacks/o/p/s/updates/latest"), "/api/stacks/{org}/{project}/{stack}/updates/latest"
+        )
+        self.assertEqual(
+            endpoint_template("api/stacks/o/p/s/updates/7"), "/api/stacks/{org}/{project}/{stack}/updates/{update_id}"
+        )
+        self.assertEqual(endpoint_template("/api/unknown/thing"), "/api/unknown/thing")
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after their TTL."""
+        key = self.cache.key("/api/organizations/acme")
+        self.cache.store(key, {"name": "acme"})
+
+        entry, fresh = self.cache.lookup(key)
+        self.assertEqual(entry.value, {"name": "acme"})
+        self.assertTrue(fresh)
+
+        self.clock.now = 11
+        self.assertFalse(self.cache.lookup(key)[1])
+        # Expired entries without validators cannot be revalidated and are dropped
+        self.assertIsNone(self.cache.lookup(key)[0])
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        keys = [self.cache.key(f"/api/organizations/org-{i}") for i in range(3)]
+        self.cache.store(keys[0], 0)
+        self.cache.store(keys[1], 1)
+        self.cache.lookup(keys[0])
+        self.cache.store(keys[2], 2)
+
+        self.assertIsNone(self.cache.lookup(keys[1])[0])
+        self.assertIsNotNone(self.cache.lookup(keys[0])[0])
+        self.assertEqual(self.cache.stats().evictions, 1)
+
+    def test_export_not_cached_by_default(self):
+        """Test that deployment exports are not cached unless configured."""
+        key = self.cache.key("/api/stacks/o/p/s/export")
+        self.cache.store(key, {"deployment": {}})
+
+        self.assertIsNone(self.cache.lookup(key)[0])
+
+    def test_invalidation(self):
+        """Test that mutations invalidate the resource, its listings and sibling sub-resources."""
+        cache = ResponseCache(max_entries=10, clock=self.clock)
+        for path in [
+            "/api/stacks/o",
+            "/api/stacks/o/p",
+            "/api/stacks/o/p/s",
+            "/api/stacks/o/p/s/tags",
+            "/api/stacks/o/p/t",
+        ]:
+            cache.store(cache.key(path), path)
+
+        self.assertEqual(cache.invalidate("/api/stacks/o/p/s/transfer"), 4)
+        self.assertIsNotNone(cache.lookup(cache.key("/api/stacks/o/p/t"))[0])
+
+
+class TestClientCaching(unittest.TestCase):
+    """Tests for response caching in PulumiClient."""
+
+    def setUp(self):
+        """Set up a client with a cache and a mocked session."""
+        self.clock = FakeClock()
+        self.client = PulumiClient("token", cache=ResponseCache(default_ttl=10, clock=self.clock))
+        self.client.session = Mock()
+
+    def test_repeated_get_is_served_from_cache(self):
+        """Test that a fresh cached response avoids the network."""
+        self.client.session.request.return_value = _response(body={"name": "acme"})
+
+        self.client.organizations.get("acme")
+        org = self.client.organizations.get("acme")
+
+        self.assertEqual(org.name, "acme")
+        self.assertEqual(self.client.session.request.call_count, 1)
+        self.assertEqual(self.client.cache.stats().hits, 1)
+
+    def test_stale_entry_is_revalidated(self):
+        """Test that stale entries are revalidated with a conditional GET."""
+        self.client.session.request.side_effect = [
+            _response(body={"environment": "prod"}, headers={"ETag": '"v1"'}),
+            _response(status_code=304),
+        ]
+
+        self.client.stacks.list_tags("o", "p", "s")
+        self.clock.now = 11
+        tags = self.client.stacks.list_tags("o", "p", "s")
+
+        self.assertEqual(tags, {"environment": "prod"})
+        self.assertEqual(self.client.session.request.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(self.client.cache.stats().revalidations, 1)
+
+    def test_mutation_invalidates(self):
+        """Test that updating tags invalidates the cached tags."""
+        self.client.session.request.return_value = _response(body={"environment": "prod"})
+
+        self.client.stacks.list_tags("o", "p", "s")
+        self.client.stacks.update_tags("o", "p", "s", {"environment": "dev"})
+        self.client.stacks.list_tags("o", "p", "s")
+
+        self.assertEqual(self.client.session.request.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+from unittest.mock import patch
+
+from pulumi_cloud_client.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from pulumi_cloud_client.exceptions import CircuitOpenError, DeadlineExceededError, PulumiAPIError
+from pulumi_cloud_client.ratelimit import RateLimiter
+from pulumi_cloud_client.testing import FakeDataset, FakePulumiServer, FaultConfig
+from tests.helpers import FakeClock
+
+ENDPOINT = "/api/stacks/{org}/{project}/{stack}"
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests for the CircuitBreaker class."""
+
+    def setUp(self):
+        """Create a breaker with a fake clock that records state changes."""
+        self.clock = FakeClock()
+        self.changes = []
+        self.breaker = CircuitBreaker(
+            failure_threshold=3,
+            recovery_time=10,
+            on_state_change=lambda *change: self.changes.append(change),
+            clock=self.clock,
+        )
+
+    def _attempt(self, status_code):
+        self.breaker.before_call(ENDPOINT)
+        self.breaker.record(ENDPOINT, status_code)
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that consecutive server and network errors open the circuit, and other responses reset the count."""
+        for status_code in (503, None, 404, 500, 502):
+            self._attempt(status_code)
+        self.assertEqual(self.breaker.state(ENDPOINT), CLOSED)
+
+        self._attempt(None)
+
+        self.assertEqual(self.breaker.state(ENDPOINT), OPEN)
+        self.clock.now = 4
+        with self.assertRaises(CircuitOpenError) as raised:
+            self.breaker.before_call(ENDPOINT)
+        self.assertEqual((raised.exception.status_code, raised.exception.retry_in), (503, 6))
+        self.assertEqual(self.breaker.state("/api/stacks/{org}"), CLOSED)
+
+    def test_half_open_probes(self):
+        """Test that an open circuit lets one probe through after the recovery time."""
+        for _ in range(3):
+            self._attempt(503)
+
+        self.clock.now = 10
+        self.breaker.before_call(ENDPOINT)
+        self.assertEqual(self.breaker.state(ENDPOINT), HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call(ENDPOINT)
+
+        self.breaker.record(ENDPOINT, 500)
+        self.assertEqual(self.breaker.state(ENDPOINT), OPEN)
+
+        self.clock.now = 20
+        self._attempt(200)
+        self.assertEqual(self.breaker.state(ENDPOINT), CLOSED)
+        self.assertEqual([change[2] for change in self.changes], [OPEN, HALF_OPEN, OPEN, HALF_OPEN, CLOSED])
+
+        status = self.breaker.snapshot()[ENDPOINT]
+        self.assertEqual((status.state, status.opened, status.rejected, status.retry_in), (CLOSED, 2, 1, None))
+
+    def test_release_gives_back_probe(self):
+        """Test that releasing an abandoned probe lets the next one through."""
+        for _ in range(3):
+            self._attempt(503)
+
+        self.clock.now = 10
+        self.breaker.before_call(ENDPOINT)
+        self.breaker.release(ENDPOINT)
+        self.breaker.before_call(ENDPOINT)
+        self.assertEqual(self.breaker.state(ENDPOINT), HALF_OPEN)
+
+    def test_failure_rate(self):
+        """Test that a failure rate over a full window opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=100, failure_rate=0.5, window=10, clock=self.clock)
+
+        for status_code in [200, 503] * 4 + [200]:
+            breaker.before_call(ENDPOINT)
+            breaker.record(ENDPOINT, status_code)
+        self.assertEqual(breaker.state(ENDPOINT), CLOSED)
+
+        breaker.record(ENDPOINT, 503)
+        self.assertEqual(breaker.state(ENDPOINT), OPEN)
+
+        breaker.reset()
+        self.assertEqual(breaker.state(ENDPOINT), CLOSED)
+
+
+class TestClientCircuitBreaker(unittest.TestCase):
+    """Tests for circuit breaking in PulumiClient against a local server."""
+
+    def setUp(self):
+        """Start a server whose stack endpoint always fails."""
+        faults = FaultConfig(error_rate=1.0, endpoints={ENDPOINT})
+        self.server = FakePulumiServer(FakeDataset(), faults=faults)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.breaker = CircuitBreaker(failure_threshold=3, recovery_time=60)
+        self.client = self.server.client(max_retries=10, retry_delay=0.001, circuit_breaker=self.breaker)
+        self.addCleanup(self.client.close)
+
+    def test_fails_fast_once_open(self):
+        """Test that retries stop when the circuit opens and later calls are not sent at all."""
+        with self.assertRaises(CircuitOpenError):
+            self.client.stacks.get("org-0", "project-0", "stack-0")
+        self.assertEqual(self.server.request_counts[f"GET {ENDPOINT}"], 3)
+
+        with self.assertRaises(PulumiAPIError) as raised:
+            self.client.stacks.get("org-0", "project-0", "stack-1")
+        self.assertIsInstance(raised.exception, CircuitOpenError)
+        self.assertEqual(self.server.request_counts[f"GET {ENDPOINT}"], 3)
+
+        self.assertEqual(len(self.client.stacks.list("org-0")), 10)
+        self.assertEqual(self.breaker.snapshot()[ENDPOINT].rejected, 2)
+
+    def test_half_open_probe_survives_aborted_calls(self):
+        """Test that calls ending before they are sent do not keep the half-open probe slot."""
+        endpoint = "/api/organizations/{org}"
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0)
+        limiter = RateLimiter(rate=5, burst=1)
+        client = self.server.client(circuit_breaker=breaker, rate_limiter=limiter)
+        self.addCleanup(client.close)
+        breaker.record(endpoint, 503)
+        limiter.reserve()
+
+        # The limiter slot comes after the deadline, then the attempt is interrupted while being sent
+        with self.assertRaises(DeadlineExceededError):
+            client.request("GET", "/api/organizations/org-0", deadline=0.1)
+        with patch.object(client, "_get_session", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                client.organizations.get("org-0")
+
+        self.assertEqual(client.organizations.get("org-0").name, "org-0")
+        self.assertEqual(breaker.snapshot()[endpoint].state, CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pulumi_cloud_client.client import PulumiClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Minimal keep-alive handler answering every request with a small JSON body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        """Answer warmup requests."""
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        """Return an organization named after the last path segment."""
+        body = json.dumps({"name": self.path.rstrip("/").split("/")[-1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep test output quiet."""
+
+
+class TestPulumiClientConnectionPool(unittest.TestCase):
+    """Tests for the connection pool configuration of PulumiClient."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start a local HTTP server."""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the local HTTP server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_invalid_session_strategy(self):
+        """Test that unknown session strategies are rejected."""
+        with self.assertRaises(ValueError):
+            PulumiClient("token", session_strategy="bogus")
+
+    def test_warmup_opens_reusable_connections(self):
+        """Test that warmed-up connections serve a concurrent burst without new handshakes."""
+        with PulumiClient("token", base_url=self.base_url, pool_maxsize=4, pool_block=True) as client:
+            self.assertEqual(client.warmup(), 4)
+            self.assertEqual(client.connection_stats()["connections_opened"], 4)
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                names = list(executor.map(lambda i: client.organizations.get(f"org-{i}").name, range(40)))
+
+            self.assertEqual(names, [f"org-{i}" for i in range(40)])
+            stats = client.connection_stats()
+            self.assertEqual(stats["connections_opened"], 4)
+            self.assertEqual(stats["requests"], 44)
+
+    def test_per_thread_sessions(self):
+        """Test that the per-thread strategy gives each thread its own session."""
+        client = PulumiClient("token", base_url=self.base_url, session_strategy="per_thread")
+        sessions = []
+
+        def record_session():
+            sessions.append(client._get_session())
+            client.organizations.get("acme")
+
+        threads = [threading.Thread(target=record_session) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(session) for session in sessions}), 3)
+        self.assertEqual(client.connection_stats()["requests"], 3)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
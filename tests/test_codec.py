@@ -0,0 +1,69 @@
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+from pulumi_cloud_client.cache import ResponseCache
+from pulumi_cloud_client.client import PulumiClient
+from pulumi_cloud_client.codec import JSONCodec, OrjsonCodec, default_codec
+
+DOCUMENT = {"name": "dev", "tags": {"owner": "é ✓"}, "resourceCount": 3, "ok": True, "parent": None}
+
+
+class TestCodecs(unittest.TestCase):
+    """Tests for the JSON codecs."""
+
+    def test_round_trip(self):
+        """Test that every available codec decodes what it encodes."""
+        codecs = [JSONCodec()]
+        try:
+            codecs.append(OrjsonCodec())
+        except ImportError:
+            pass
+
+        for codec in codecs:
+            with self.subTest(codec=codec.name):
+                encoded = codec.dumps(DOCUMENT)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(codec.loads(encoded), DOCUMENT)
+                self.assertEqual(JSONCodec().loads(encoded), DOCUMENT)
+                with self.assertRaises(ValueError):
+                    codec.loads(b"{not json")
+
+    def test_default_codec_falls_back_to_stdlib(self):
+        """Test that the standard library codec is used when orjson is not installed."""
+        with patch.dict(sys.modules, {"orjson": None}):
+            self.assertEqual(default_codec().name, "json")
+
+
+class TestClientCodec(unittest.TestCase):
+    """Tests for the codec hook and raw mode of PulumiClient."""
+
+    def setUp(self):
+        """Set up a client with a mocked session."""
+        self.codec = Mock(wraps=JSONCodec())
+        self.client = PulumiClient("token", codec=self.codec, cache=ResponseCache())
+        self.client.session = Mock()
+        self.client.session.request.return_value = Mock(status_code=200, headers={}, content=b'{"name": "acme"}')
+
+    def test_bodies_go_through_the_codec(self):
+        """Test that request bodies are encoded and responses decoded by the codec."""
+        result = self.client.request("POST", "/api/orgs/acme", data={"name": "acme"})
+
+        self.assertEqual(result, {"name": "acme"})
+        self.assertEqual(self.client.session.request.call_args.kwargs["data"], b'{"name":"acme"}')
+        self.codec.loads.assert_called_once_with(b'{"name": "acme"}')
+
+    def test_raw_returns_undecoded_bytes(self):
+        """Test that raw requests skip decoding and the response cache."""
+        first = self.client.request("GET", "/api/orgs/acme", raw=True)
+        second = self.client.request("GET", "/api/orgs/acme", raw=True)
+
+        self.assertEqual(first, b'{"name": "acme"}')
+        self.assertEqual(bytes(memoryview(second)[2:6]), b"name")
+        self.assertEqual(self.client.session.request.call_count, 2)
+        self.codec.loads.assert_not_called()
+        self.assertEqual(self.client.cache.stats().size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
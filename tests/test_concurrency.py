@@ -0,0 +1,140 @@
+import unittest
+
+import requests
+
+from pulumi_cloud_client.bulk import BulkExecutor
+from pulumi_cloud_client.concurrency import AdaptiveConcurrencyLimiter, is_overload_error
+from pulumi_cloud_client.exceptions import CircuitOpenError, DeadlineExceededError, PulumiAPIError
+from pulumi_cloud_client.metrics import MetricsRecorder
+from pulumi_cloud_client.testing import FakeDataset, FakePulumiServer, FaultConfig, constant_latency
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    """Tests for the AdaptiveConcurrencyLimiter class."""
+
+    def test_increases_while_latency_is_stable(self):
+        """Test that the limit grows by about one per window of calls, up to the maximum."""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=10)
+
+        # Windows of 2, 3 and 4 calls
+        for _ in range(9):
+            limiter.record(0.01)
+        self.assertIn(limiter.limit, (4, 5))
+
+        for _ in range(1000):
+            limiter.record(0.01)
+        self.assertEqual(limiter.limit, 10)
+
+    def test_overload_cuts_once_per_window(self):
+        """Test that overloads halve the limit, ignoring further overloads until a window of calls completed."""
+        limiter = AdaptiveConcurrencyLimiter(initial=16, max_limit=16)
+
+        limiter.record(0.01, overloaded=True)
+        limiter.record(0.01, overloaded=True)
+        limiter.record_overload()
+        self.assertEqual(limiter.limit, 8)
+
+        for _ in range(8):
+            limiter.record(0.01)
+        limiter.record_overload()
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.stats().decreases, 2)
+
+    def test_latency_spike_cuts_the_limit(self):
+        """Test that a sustained rise in latency above the baseline reduces the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial=10, max_limit=10)
+        for _ in range(20):
+            limiter.record(0.01)
+
+        for _ in range(10):
+            limiter.record(0.1)
+
+        self.assertLess(limiter.limit, 10)
+        self.assertAlmostEqual(limiter.stats().baseline_latency, 0.01, places=3)
+
+    def test_reacts_to_retried_attempts(self):
+        """Test that 429 and 5xx attempts recorded by a client's metrics cut the limit until detached."""
+        metrics = MetricsRecorder()
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8)
+        limiter.attach(metrics)
+
+        metrics.record_attempt("/api/stacks/{org}", 200, 0.01)
+        self.assertEqual(limiter.limit, 8)
+        metrics.record_attempt("/api/stacks/{org}", 429, 0.01)
+        self.assertEqual(limiter.limit, 4)
+
+        limiter.detach()
+        for _ in range(10):
+            limiter.record(0.01)
+        metrics.record_attempt("/api/stacks/{org}", 503, 0.01)
+        self.assertEqual(limiter.stats().decreases, 1)
+
+    def test_overload_errors(self):
+        """Test which errors count as overload signals."""
+        self.assertTrue(is_overload_error(PulumiAPIError(429, "Too Many Requests")))
+        self.assertTrue(is_overload_error(PulumiAPIError(503, "Service Unavailable")))
+        self.assertTrue(is_overload_error(requests.ConnectionError()))
+        self.assertFalse(is_overload_error(PulumiAPIError(404, "Not Found")))
+        self.assertFalse(is_overload_error(None))
+
+    def test_client_side_errors_are_not_overload(self):
+        """Test that open circuits and exceeded deadlines do not count as overload despite their 503/504."""
+        self.assertFalse(is_overload_error(CircuitOpenError("/api/stacks/{org}", 5.0)))
+        self.assertFalse(is_overload_error(DeadlineExceededError("/api/stacks/{org}", 2, 1.5)))
+
+    def test_invalid_limits(self):
+        """Test that inconsistent limits are rejected."""
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(initial=10, max_limit=5)
+
+
+class TestAdaptiveBulkExecution(unittest.TestCase):
+    """Tests for adaptive concurrency against a local server that sheds load."""
+
+    def setUp(self):
+        """Start a server handling at most four requests at once."""
+        faults = FaultConfig(max_concurrency=4, retry_after=0.01)
+        self.server = FakePulumiServer(
+            FakeDataset(projects=1, stacks=50, resources=0), latency=constant_latency(0.005), faults=faults
+        )
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.metrics = MetricsRecorder()
+        self.client = self.server.client(max_retries=10, retry_delay=0.01, pool_maxsize=32, metrics=self.metrics)
+        self.addCleanup(self.client.close)
+
+    def test_executor_backs_off_from_rate_limiting(self):
+        """Test that the executor settles below a concurrency the server rejects."""
+        limiter = AdaptiveConcurrencyLimiter(initial=16, max_limit=32)
+        limiter.attach(self.metrics)
+        executor = BulkExecutor(limiter=limiter)
+
+        outcomes = list(
+            executor.map_unordered(
+                lambda i: self.client.stacks.get("org-0", "project-0", f"stack-{i % 50}"), range(300)
+            )
+        )
+
+        self.assertTrue(all(outcome.ok for outcome in outcomes))
+        self.assertLess(limiter.limit, 16)
+        self.assertEqual(executor.concurrency, limiter.limit)
+        self.assertGreater(limiter.stats().decreases, 0)
+
+    def test_transfer_many_reports_concurrency(self):
+        """Test that transfer_many runs with a limiter and reports its current limit."""
+        stacks = self.client.stacks.list("org-0")
+        limits = []
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=8)
+
+        summary = self.client.stacks.transfer_many(
+            "org-1", stacks, limiter=limiter, progress_callback=lambda progress, *_: limits.append(progress.concurrency)
+        )
+
+        self.assertEqual((len(summary.transferred), summary.failed), (50, {}))
+        self.assertEqual(len(limits), 50)
+        self.assertTrue(all(1 <= limit <= 8 for limit in limits))
+        self.assertEqual(self.metrics._listeners, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
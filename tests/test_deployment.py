@@ -0,0 +1,86 @@
+import unittest
+
+from pulumi_cloud_client.models.deployment import Deployment
+from pulumi_cloud_client.models.stack import StackResource
+
+STACK_URN = "urn:pulumi:dev::web::pulumi:pulumi:Stack::web-dev"
+PROVIDER_URN = "urn:pulumi:dev::web::pulumi:providers:aws::default_6_0_0"
+PROVIDER_REF = f"{PROVIDER_URN}::04da6b54-80e4-46f7-96ec-b56ff0331ba9"
+BUCKET_URN = "urn:pulumi:dev::web::aws:s3/bucket:Bucket::website"
+OBJECT_URN = "urn:pulumi:dev::web::aws:s3/bucket:Bucket$aws:s3/bucketObject:BucketObject::index.html"
+
+EXPORT = {
+    "version": 3,
+    "deployment": {
+        "manifest": {"time": "2023-01-01T12:00:00Z"},
+        "resources": [
+            {"urn": STACK_URN, "type": "pulumi:pulumi:Stack"},
+            {"urn": PROVIDER_URN, "type": "pulumi:providers:aws", "id": "04da6b54-80e4-46f7-96ec-b56ff0331ba9"},
+            {
+                "urn": BUCKET_URN,
+                "type": "aws:s3/bucket:Bucket",
+                "id": "website-1234",
+                "provider": PROVIDER_REF,
+                "parent": STACK_URN,
+                "inputs": {"acl": "private"},
+                "outputs": {"acl": "private", "arn": "arn:aws:s3:::website-1234"},
+            },
+            {
+                "urn": OBJECT_URN,
+                "type": "aws:s3/bucketObject:BucketObject",
+                "id": "index.html",
+                "provider": PROVIDER_REF,
+                "parent": BUCKET_URN,
+                "inputs": {"key": "index.html"},
+            },
+        ],
+    },
+}
+
+
+class TestDeployment(unittest.TestCase):
+    """Tests for the Deployment model."""
+
+    def setUp(self):
+        """Index the sample export."""
+        self.deployment = Deployment.from_export(EXPORT)
+
+    def test_lookup_by_urn(self):
+        """Test looking up resources by URN."""
+        bucket = self.deployment[BUCKET_URN]
+
+        self.assertIsInstance(bucket, StackResource)
+        self.assertEqual(bucket.name, "website")
+        self.assertEqual(bucket.resource_id, "website-1234")
+        self.assertEqual(bucket.properties["arn"], "arn:aws:s3:::website-1234")
+        self.assertIs(self.deployment.get(BUCKET_URN), bucket)
+        self.assertIsNone(self.deployment.get("urn:missing"))
+        with self.assertRaises(KeyError):
+            self.deployment["urn:missing"]
+
+    def test_resources_are_built_lazily(self):
+        """Test that StackResource objects are only built when accessed."""
+        self.assertEqual(len(self.deployment._materialized), 0)
+
+        self.deployment.by_type("aws:s3/bucket:Bucket")
+
+        self.assertEqual(list(self.deployment._materialized), [BUCKET_URN])
+
+    def test_indexes(self):
+        """Test the type, provider and parent indexes."""
+        self.assertEqual([r.name for r in self.deployment.by_type("aws:s3/bucketObject:BucketObject")], ["index.html"])
+        self.assertEqual(len(self.deployment.by_provider(PROVIDER_REF)), 2)
+        self.assertEqual(len(self.deployment.by_provider(PROVIDER_URN)), 2)
+        self.assertEqual([r.urn for r in self.deployment.children(STACK_URN)], [BUCKET_URN])
+        self.assertEqual(self.deployment.type_counts()["pulumi:pulumi:Stack"], 1)
+
+    def test_container_protocol(self):
+        """Test length, membership and iteration order."""
+        self.assertEqual(len(self.deployment), 4)
+        self.assertIn(OBJECT_URN, self.deployment)
+        self.assertEqual([r.urn for r in self.deployment], self.deployment.urns())
+        self.assertEqual(self.deployment.version, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+import itertools
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pulumi_cloud_client.circuit import CircuitBreaker
+from pulumi_cloud_client.client import PulumiClient
+from pulumi_cloud_client.exceptions import DeadlineExceededError, PulumiAPIError
+from pulumi_cloud_client.hedging import HedgingPolicy
+from pulumi_cloud_client.metrics import MetricsRecorder
+from pulumi_cloud_client.ratelimit import RateLimiter
+from pulumi_cloud_client.testing import FakeDataset, FakePulumiServer, constant_latency
+
+ENDPOINT = "/api/stacks/{org}/{project}/{stack}"
+
+
+class TestHedgingPolicy(unittest.TestCase):
+    """Tests for the HedgingPolicy class."""
+
+    def setUp(self):
+        """Create a thread pool for the exchanges."""
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_delay_from_latency_quantile(self):
+        """Test that the delay is the fallback until enough samples were observed, then their quantile."""
+        policy = HedgingPolicy(quantile=0.9, fallback_delay=0.5, min_samples=10, max_delay=1.0)
+        for _ in range(9):
+            policy.observe(ENDPOINT, 0.02)
+        self.assertEqual(policy.delay(ENDPOINT), 0.5)
+
+        policy.observe(ENDPOINT, 0.02)
+        self.assertLessEqual(policy.delay(ENDPOINT), 0.025)
+        self.assertEqual(policy.delay("/api/user"), 0.5)
+
+        for _ in range(100):
+            policy.observe(ENDPOINT, 5.0)
+        self.assertEqual(policy.delay(ENDPOINT), 1.0)
+
+    def test_hedge_wins_and_loser_is_discarded(self):
+        """Test that a hedge is sent after the delay, its response is used and the slow one is discarded."""
+        policy = HedgingPolicy(fallback_delay=0.02, budget_ratio=1.0)
+        calls = itertools.count()
+        discarded = []
+        hedges = []
+
+        def send():
+            if next(calls) == 0:
+                time.sleep(0.3)
+                return "slow"
+            return "fast"
+
+        started = time.monotonic()
+        result = policy.run(self.executor, ENDPOINT, send, discarded.append, lambda *hedge: hedges.append(hedge))
+
+        self.assertEqual(result, "fast")
+        self.assertLess(time.monotonic() - started, 0.2)
+        self.assertEqual(hedges, [(0.02, True)])
+        self.executor.shutdown()
+        self.assertEqual(discarded, ["slow"])
+        self.assertEqual(policy.stats().wins, 1)
+
+    def test_fast_response_is_not_hedged(self):
+        """Test that no hedge is sent when the response arrives before the delay."""
+        policy = HedgingPolicy(fallback_delay=0.5)
+        self.assertEqual(policy.run(self.executor, ENDPOINT, lambda: "ok", lambda _: None), "ok")
+        self.assertEqual((policy.stats().calls, policy.stats().hedges), (1, 0))
+
+    def test_waiting_for_a_thread_does_not_trigger_hedges(self):
+        """Test that the hedge delay starts when the request is sent, not when it is queued."""
+        policy = HedgingPolicy(fallback_delay=0.02, budget_ratio=1.0)
+        for _ in range(4):
+            self.executor.submit(time.sleep, 0.1)
+
+        self.assertEqual(policy.run(self.executor, ENDPOINT, lambda: "ok", lambda _: None), "ok")
+        self.assertEqual(policy.stats().hedges, 0)
+
+    def test_budget_caps_hedges(self):
+        """Test that hedges beyond the budget are refused and the call waits for the original response."""
+        policy = HedgingPolicy(fallback_delay=0.01, budget_ratio=0.0)
+
+        def send():
+            time.sleep(0.05)
+            return "ok"
+
+        self.assertEqual(policy.run(self.executor, ENDPOINT, send, lambda _: None), "ok")
+
+        self.assertEqual((policy.stats().hedges, policy.stats().refused), (0, 1))
+
+    def test_raises_error_when_every_exchange_fails(self):
+        """Test that the error of the original exchange is raised if no exchange succeeds."""
+        policy = HedgingPolicy(fallback_delay=0.01, budget_ratio=1.0)
+        calls = itertools.count()
+
+        def send():
+            number = next(calls)
+            time.sleep(0.05 if number == 0 else 0)
+            raise ValueError(number)
+
+        with self.assertRaises(ValueError) as raised:
+            policy.run(self.executor, ENDPOINT, send, lambda _: None)
+        self.assertEqual(raised.exception.args, (0,))
+
+    def test_refused_hedges_are_not_sent(self):
+        """Test that no hedge is sent once the caller refuses one."""
+        policy = HedgingPolicy(fallback_delay=0.01, budget_ratio=1.0, max_hedges=3)
+        admitted = []
+
+        def send():
+            time.sleep(0.1)
+            return "ok"
+
+        def admit():
+            admitted.append(True)
+            return False
+
+        self.assertEqual(policy.run(self.executor, ENDPOINT, send, lambda _: None, admit=admit), "ok")
+        self.assertEqual((policy.stats().hedges, len(admitted)), (0, 1))
+
+    def test_wait_is_bounded_by_deadline(self):
+        """Test that the call stops waiting at its deadline and the late response is discarded."""
+        policy = HedgingPolicy(fallback_delay=0.01, budget_ratio=0.0)
+        discarded = []
+
+        def send():
+            time.sleep(0.3)
+            return "late"
+
+        started = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            policy.run(self.executor, ENDPOINT, send, discarded.append, deadline=started + 0.05)
+
+        self.assertLess(time.monotonic() - started, 0.2)
+        self.executor.shutdown()
+        self.assertEqual(discarded, ["late"])
+
+
+class TestClientHedging(unittest.TestCase):
+    """Tests for hedged GET requests in PulumiClient against a local server."""
+
+    def test_hedging_cuts_tail_latency(self):
+        """Test that calls hitting a slow response are answered by their hedge."""
+        requests = itertools.count(1)
+        # Every 25th request is slow, so the 95th percentile stays at the typical latency
+        server = FakePulumiServer(FakeDataset(), latency=lambda rng: 1.0 if next(requests) % 25 == 0 else 0.002)
+        server.start()
+        self.addCleanup(server.stop)
+        metrics = MetricsRecorder()
+        policy = HedgingPolicy(fallback_delay=0.05, budget_ratio=0.5, endpoints={ENDPOINT})
+        client = server.client(metrics=metrics, hedging=policy)
+        self.addCleanup(client.close)
+
+        durations = []
+        for i in range(100):
+            started = time.monotonic()
+            client.stacks.get("org-0", f"project-{i % 2}", f"stack-{i % 5}")
+            durations.append(time.monotonic() - started)
+        client.organizations.get("org-0")
+
+        self.assertLess(max(durations), 0.5)
+        stats = metrics.snapshot()[ENDPOINT]
+        self.assertGreater(stats["hedge_wins"], 0)
+        self.assertLessEqual(stats["hedges"], 50)
+        self.assertEqual(stats["requests"], 100)
+        self.assertEqual(metrics.snapshot()["/api/organizations/{org}"]["hedges"], 0)
+
+    def _slow_server(self):
+        """Start a server answering every request after 0.2 seconds."""
+        server = FakePulumiServer(FakeDataset(), latency=constant_latency(0.2))
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_no_hedges_without_rate_limit_tokens(self):
+        """Test that hedges are not sent when the rate limiter has no token for them."""
+        server = self._slow_server()
+        policy = HedgingPolicy(fallback_delay=0.02, budget_ratio=1.0)
+        client = server.client(hedging=policy, rate_limiter=RateLimiter(rate=1.0, burst=1.0))
+        self.addCleanup(client.close)
+
+        client.stacks.get("org-0", "project-0", "stack-0")
+
+        self.assertEqual(policy.stats().hedges, 0)
+        self.assertEqual(server.request_counts[f"GET {ENDPOINT}"], 1)
+
+    def test_hedge_outcomes_are_recorded_on_circuit_breaker(self):
+        """Test that failed hedges count towards opening the circuit like any other attempt."""
+        server = self._slow_server()
+        server.fail_next(2, status_code=500)
+        breaker = CircuitBreaker(failure_threshold=2)
+        policy = HedgingPolicy(fallback_delay=0.02, budget_ratio=1.0)
+        client = server.client(hedging=policy, circuit_breaker=breaker, max_retries=0)
+        self.addCleanup(client.close)
+
+        with self.assertRaises(PulumiAPIError):
+            client.stacks.get("org-0", "project-0", "stack-0")
+        time.sleep(0.3)
+
+        self.assertEqual(policy.stats().hedges, 1)
+        self.assertEqual(breaker.state(ENDPOINT), "open")
+
+    def test_deadline_bounds_hedged_call(self):
+        """Test that a hedged call gives up at the client's deadline."""
+        server = self._slow_server()
+        policy = HedgingPolicy(fallback_delay=0.02, budget_ratio=0.0)
+        client = server.client(hedging=policy, deadline=0.05)
+        self.addCleanup(client.close)
+
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            client.stacks.get("org-0", "project-0", "stack-0")
+        self.assertLess(time.monotonic() - started, 0.15)
+
+    def test_pool_sized_from_connection_pool(self):
+        """Test that the hedging threads default to enough for every pooled connection and its hedges."""
+        client = PulumiClient("token", pool_maxsize=20, hedging=HedgingPolicy(max_hedges=2))
+        self.addCleanup(client.close)
+
+        self.assertEqual(client._get_hedge_executor(client.hedging)._max_workers, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock
+
+from pulumi_cloud_client.exceptions import PulumiAPIError
+from pulumi_cloud_client.inventory import InventoryCrawler, InventorySnapshot
+from pulumi_cloud_client.models import Organization, Project, Stack
+
+TREE = {
+    "acme": {"web": ["dev", "prod"], "api": ["dev"]},
+    "globex": {"infra": ["prod"], "broken": None},
+}
+
+
+def _client(delay=0.0, failing_tags=()):
+    client = Mock()
+    client.organizations.list.side_effect = lambda: [Organization(name=name) for name in TREE]
+
+    def list_projects(org_name):
+        time.sleep(delay)
+        return [Project(name=name, organization=org_name) for name in TREE[org_name]]
+
+    def list_stacks(org_name, project_name):
+        time.sleep(delay)
+        if TREE[org_name][project_name] is None:
+            raise PulumiAPIError(status_code=500, message="boom")
+        return [
+            Stack(name=name, organization=org_name, project=project_name, last_update=None, resource_count=1)
+            for name in TREE[org_name][project_name]
+        ]
+
+    def list_tags(org_name, project_name, stack_name):
+        time.sleep(delay)
+        if stack_name in failing_tags:
+            raise PulumiAPIError(status_code=404, message="gone")
+        return {"env": stack_name}
+
+    client.projects.list.side_effect = list_projects
+    client.stacks.list.side_effect = list_stacks
+    client.stacks.list_tags.side_effect = list_tags
+    return client
+
+
+class TestInventoryCrawler(unittest.TestCase):
+    """Tests for the InventoryCrawler class."""
+
+    def test_run_collects_snapshot(self):
+        """Test that a crawl collects every level and records failed listings."""
+        snapshot = InventoryCrawler(_client()).run()
+
+        self.assertEqual(set(snapshot.organizations), {"acme", "globex"})
+        self.assertEqual(set(snapshot.projects), {"acme/web", "acme/api", "globex/infra", "globex/broken"})
+        self.assertEqual(set(snapshot.stacks), {"acme/web/dev", "acme/web/prod", "acme/api/dev", "globex/infra/prod"})
+        self.assertEqual(snapshot.stacks["acme/web/prod"].tags, {"env": "prod"})
+        self.assertEqual(snapshot.errors, {"globex/broken": "boom (Status: 500)"})
+        self.assertFalse(snapshot.complete)
+        self.assertEqual([s.name for s in snapshot.stacks_in("acme", "web")], ["dev", "prod"])
+
+    def test_events_stream_parents_before_children(self):
+        """Test that organizations and projects are yielded before their stacks."""
+        seen = set()
+        for event in InventoryCrawler(_client(), organizations=["acme"]).crawl():
+            if event.kind == "project":
+                self.assertIn(event.key.split("/")[0], seen)
+            if event.kind == "stack":
+                self.assertIn(event.key.rsplit("/", 1)[0], seen)
+            seen.add(event.key)
+
+        self.assertEqual(len(seen), 6)
+
+    def test_tag_failures_are_reported(self):
+        """Test that a stack whose tags cannot be fetched is reported as an error."""
+        snapshot = InventorySnapshot()
+        events = list(InventoryCrawler(_client(failing_tags={"prod"}), organizations=["acme"]).crawl(snapshot))
+
+        self.assertEqual(snapshot.errors, {"acme/web/prod": "gone (Status: 404)"})
+        self.assertEqual(len([e for e in events if e.kind == "stack"]), 2)
+
+    def test_without_tags(self):
+        """Test that tags are not fetched when disabled."""
+        client = _client()
+
+        snapshot = InventoryCrawler(client, fetch_tags=False).run()
+
+        client.stacks.list_tags.assert_not_called()
+        self.assertEqual(len(snapshot.stacks), 4)
+
+    def test_levels_run_concurrently(self):
+        """Test that listings and tag fetches overlap instead of running one after another."""
+        started = time.monotonic()
+        InventoryCrawler(_client(delay=0.1)).run()
+
+        # Sequentially this is 2 + 4 + 4 calls of 100ms each
+        self.assertLess(time.monotonic() - started, 0.6)
+
+
+class TestInventorySync(unittest.TestCase):
+    """Tests for incremental inventory sync."""
+
+    def setUp(self):
+        """Set up a mocked client over a mutable stack listing."""
+        self.listing = {
+            "web": {"dev": "2023-01-01T00:00:00Z", "prod": "2023-01-02T00:00:00Z"},
+            "api": {"dev": "2023-01-03T00:00:00Z"},
+        }
+        self.client = Mock()
+        self.client.projects.list.side_effect = lambda org: [
+            Project(name=name, organization=org) for name in self.listing
+        ]
+        self.client.stacks.list.side_effect = lambda org, project: [
+            Stack(name=name, organization=org, project=project, last_update=updated, resource_count=1)
+            for name, updated in self.listing[project].items()
+        ]
+        self.client.stacks.get.side_effect = lambda org, project, name: Stack(
+            name=name, organization=org, project=project, last_update=self.listing[project][name], resource_count=1
+        )
+        self.client.stacks.list_tags.side_effect = lambda org, project, name: {"stack": name}
+        self.client.stacks.get_latest_update.side_effect = lambda org, project, name: {"version": 1}
+        self.crawler = InventoryCrawler(self.client, organizations=["acme"])
+
+    def test_sync_refetches_only_changed_stacks(self):
+        """Test that only added and changed stacks are refetched and that removals are reported."""
+        previous = self.crawler.sync(InventorySnapshot()).snapshot
+        self.client.stacks.get.reset_mock()
+
+        self.listing["web"]["prod"] = "2023-02-01T00:00:00Z"
+        del self.listing["api"]["dev"]
+        self.listing["api"]["test"] = "2023-02-02T00:00:00Z"
+        delta = self.crawler.sync(previous)
+
+        self.assertEqual(delta.added, ["acme/api/test"])
+        self.assertEqual(delta.changed, ["acme/web/prod"])
+        self.assertEqual(delta.removed, ["acme/api/dev"])
+        self.assertEqual(delta.unchanged, 1)
+        self.assertEqual(self.client.stacks.get.call_count, 2)
+        self.assertEqual(set(delta.snapshot.stacks), {"acme/web/dev", "acme/web/prod", "acme/api/test"})
+        self.assertEqual(set(delta.snapshot.latest_updates), set(delta.snapshot.stacks))
+        self.assertIs(delta.snapshot.stacks["acme/web/dev"], previous.stacks["acme/web/dev"])
+
+    def test_details_differing_from_listing_are_not_changes(self):
+        """Test that a stack is not seen as changed because its details disagree with its listing."""
+        self.client.stacks.get.side_effect = lambda org, project, name: Stack(
+            name=name, organization=org, project=project, last_update="2024-01-01T00:00:00Z", resource_count=7
+        )
+        previous = self.crawler.sync(InventorySnapshot()).snapshot
+
+        delta = self.crawler.sync(previous)
+
+        self.assertTrue(delta.empty)
+        self.assertEqual(delta.unchanged, 3)
+
+    def test_failed_listing_is_not_reported_as_removal(self):
+        """Test that stacks under a failed listing are carried over."""
+        previous = self.crawler.sync(InventorySnapshot()).snapshot
+        list_stacks = self.client.stacks.list.side_effect
+
+        def flaky_list(org, project):
+            if project == "api":
+                raise PulumiAPIError(status_code=503, message="unavailable")
+            return list_stacks(org, project)
+
+        self.client.stacks.list.side_effect = flaky_list
+        delta = self.crawler.sync(previous)
+
+        self.assertTrue(delta.empty)
+        self.assertIn("acme/api/dev", delta.snapshot.stacks)
+        self.assertEqual(delta.snapshot.errors, {"acme/api": "unavailable (Status: 503)"})
+
+    def test_uncrawled_organization_is_kept(self):
+        """Test that organizations outside the crawler's list are carried over with their stacks."""
+        previous = InventoryCrawler(self.client, organizations=["acme", "other"]).sync(InventorySnapshot()).snapshot
+
+        delta = self.crawler.sync(previous)
+
+        self.assertTrue(delta.empty)
+        self.assertEqual(delta.snapshot.stacks.keys(), previous.stacks.keys())
+        self.assertEqual(delta.snapshot.projects.keys(), previous.projects.keys())
+        self.assertEqual(set(delta.snapshot.organizations), {"acme", "other"})
+
+    def test_vanished_organization_is_removed(self):
+        """Test that an organization missing from the listing is dropped with everything under it."""
+        crawler = InventoryCrawler(self.client)
+        self.client.organizations.list.side_effect = lambda: [Organization(name="acme"), Organization(name="gone")]
+        previous = crawler.sync(InventorySnapshot()).snapshot
+        self.client.organizations.list.side_effect = lambda: [Organization(name="acme")]
+
+        delta = crawler.sync(previous)
+
+        self.assertEqual(delta.removed, ["gone/api/dev", "gone/web/dev", "gone/web/prod"])
+        self.assertEqual(set(delta.snapshot.organizations), {"acme"})
+        self.assertTrue(all(key.startswith("acme/") for key in delta.snapshot.projects))
+        self.assertTrue(all(key.startswith("acme/") for key in delta.snapshot.stacks))
+
+    def test_save_and_load(self):
+        """Test that a snapshot survives a round trip through a file."""
+        snapshot = self.crawler.sync(InventorySnapshot()).snapshot
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "inventory.json")
+            snapshot.save(path)
+            loaded = InventorySnapshot.load(path)
+
+        self.assertEqual(loaded.stacks, snapshot.stacks)
+        self.assertEqual(loaded.projects, snapshot.projects)
+        self.assertEqual(loaded.latest_updates, snapshot.latest_updates)
+        self.assertEqual(loaded.completed_at, snapshot.completed_at)
+        self.assertTrue(self.crawler.sync(loaded).empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
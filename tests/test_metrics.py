@@ -0,0 +1,83 @@
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from pulumi_cloud_client.client import PulumiClient
+from pulumi_cloud_client.exceptions import PulumiAPIError
+from pulumi_cloud_client.metrics import Histogram, MetricsRecorder
+
+EXPORT_ENDPOINT = "/api/stacks/{org}/{project}/{stack}/export"
+
+
+def _response(status_code, body=b'{"version": 3}'):
+    response = Mock(status_code=status_code, headers={}, content=body, reason="")
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError()
+    return response
+
+
+class TestHistogram(unittest.TestCase):
+    """Tests for the Histogram class."""
+
+    def test_quantiles(self):
+        """Test that quantiles are estimated within the recorded range."""
+        histogram = Histogram()
+        for value in [0.01] * 90 + [2.0] * 10:
+            histogram.observe(value)
+
+        self.assertLessEqual(histogram.quantile(0.5), 0.01)
+        self.assertGreater(histogram.quantile(0.99), 1.5)
+        self.assertLessEqual(histogram.quantile(1.0), 2.0)
+        self.assertIsNone(Histogram().quantile(0.5))
+        self.assertEqual(histogram.to_dict()["count"], 100)
+
+
+class TestClientMetrics(unittest.TestCase):
+    """Tests for the metrics recorded by PulumiClient."""
+
+    def setUp(self):
+        """Set up a client with a recorder and a mocked session."""
+        self.events = []
+        self.metrics = MetricsRecorder(listeners=[self.events.append])
+        self.client = PulumiClient("token", metrics=self.metrics)
+        self.client.session = Mock()
+
+    @patch("time.sleep")
+    def test_records_retries_per_endpoint(self, sleep):
+        """Test that attempts, retries, status codes and sizes are recorded under the endpoint template."""
+        self.client.session.request.side_effect = [_response(503, b'{"message": "busy"}'), _response(200)]
+
+        self.client.stacks.export_deployment("acme", "web", "prod")
+
+        stats = self.metrics.snapshot()[EXPORT_ENDPOINT]
+        self.assertEqual((stats["requests"], stats["attempts"], stats["retries"]), (1, 2, 1))
+        self.assertEqual(stats["status_codes"], {"200": 1, "503": 1})
+        self.assertEqual(stats["bytes_received"], len(b'{"message": "busy"}') + len(b'{"version": 3}'))
+        self.assertEqual(stats["backoff_seconds"], sleep.call_args[0][0])
+        self.assertEqual(stats["decode_time"]["count"], 1)
+        self.assertEqual(stats["latency"]["count"], 1)
+        self.assertEqual([e.kind for e in self.events], ["attempt", "backoff", "attempt", "decode", "request"])
+        json.dumps(self.metrics.snapshot())
+
+    def test_records_failures_and_network_errors(self):
+        """Test that failed calls and attempts without a response are recorded."""
+        self.client.max_retries = 0
+        self.client.session.request.side_effect = requests.ConnectionError()
+
+        with self.assertRaises(requests.ConnectionError):
+            self.client.organizations.get("acme")
+        self.client.session.request.side_effect = [_response(404, b'{"message": "not found"}')]
+        with self.assertRaises(PulumiAPIError):
+            self.client.organizations.get("acme")
+
+        stats = self.metrics.snapshot()["/api/organizations/{org}"]
+        self.assertEqual((stats["requests"], stats["failures"], stats["network_errors"]), (2, 2, 1))
+        self.assertEqual(stats["status_codes"], {"404": 1})
+        self.assertFalse(self.events[-1].ok)
+        self.assertIsNotNone(self.metrics.quantile("/api/organizations/{org}", 0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
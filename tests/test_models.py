@@ -0,0 +1,87 @@
+import pickle
+import unittest
+from datetime import datetime, timezone
+
+from pulumi_cloud_client.models import Organization, PolicyPack, Project, Stack
+
+STACK_ITEM = {
+    "name": "dev",
+    "orgName": "org",
+    "projectName": "proj",
+    "lastUpdate": "2023-01-01T12:00:00Z",
+    "resourceCount": 5,
+    "tags": {"env": "dev"},
+}
+
+
+class TestSlottedModels(unittest.TestCase):
+    """Tests for the slotted model classes."""
+
+    def test_models_have_no_instance_dict(self):
+        """Test that model instances do not carry a __dict__."""
+        models = [
+            Stack.from_api_response(STACK_ITEM),
+            Project.from_api_response({"name": "proj"}, "org"),
+            Organization.from_api_response({"name": "org"}),
+            PolicyPack.from_api_response({"name": "pack"}),
+        ]
+
+        for model in models:
+            with self.subTest(model=type(model).__name__):
+                self.assertFalse(hasattr(model, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    model.unknown = 1  # type: ignore[attr-defined]
+
+    def test_timestamps_are_parsed_lazily(self):
+        """Test that timestamps stay strings until first read."""
+        stack = Stack.from_api_response(STACK_ITEM)
+
+        self.assertEqual(stack._last_update, "2023-01-01T12:00:00Z")
+        self.assertEqual(stack.last_update, datetime(2023, 1, 1, 12, tzinfo=timezone.utc))
+        self.assertIsInstance(stack._last_update, datetime)
+
+    def test_epoch_timestamps(self):
+        """Test that epoch seconds, including zero, become UTC datetimes."""
+        stack = Stack.from_api_response({**STACK_ITEM, "lastUpdate": 1680307200})
+        epoch = Stack("dev", "org", "proj", last_update=0, resource_count=0)
+
+        self.assertEqual(stack.last_update, datetime(2023, 4, 1, tzinfo=timezone.utc))
+        self.assertEqual(epoch.last_update, datetime(1970, 1, 1, tzinfo=timezone.utc))
+        self.assertIsNone(Stack("dev", "org", "proj", last_update="", resource_count=0).last_update)
+
+    def test_invalid_timestamp_raises_on_access(self):
+        """Test that a malformed timestamp only raises when it is read."""
+        project = Project.from_api_response({"name": "proj", "createdOn": "yesterday"}, "org")
+
+        self.assertIsNone(project.updated_on)
+        with self.assertRaises(ValueError):
+            project.created_on
+
+    def test_equality_repr_and_pickle(self):
+        """Test dataclass-style equality and repr, and pickling."""
+        stack = Stack.from_api_response(STACK_ITEM)
+        same = Stack(
+            name="dev",
+            organization="org",
+            project="proj",
+            last_update=datetime(2023, 1, 1, 12, tzinfo=timezone.utc),
+            resource_count=5,
+            tags={"env": "dev"},
+        )
+
+        self.assertEqual(stack, same)
+        self.assertNotEqual(stack, Organization(name="dev"))
+        self.assertTrue(repr(stack).startswith("Stack(name='dev', organization='org'"))
+        self.assertEqual(pickle.loads(pickle.dumps(stack)), stack)
+
+    def test_from_api_list(self):
+        """Test the bulk constructors."""
+        stacks = Stack.from_api_list([STACK_ITEM, {**STACK_ITEM, "name": "prod"}])
+        projects = Project.from_api_list([{"name": "a"}, {"name": "b"}], "org")
+
+        self.assertEqual([s.full_name for s in stacks], ["org/proj/dev", "org/proj/prod"])
+        self.assertEqual([p.full_name for p in projects], ["org/a", "org/b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import threading
+import time
+import unittest
+
+from pulumi_cloud_client.exceptions import PulumiAPIError
+from pulumi_cloud_client.pagination import PrefetchingPaginator, split_page
+from pulumi_cloud_client.resources.stacks import StacksResource
+
+
+class FakePagedClient:
+    """Client stub serving ``page_count`` pages of ``page_size`` stacks."""
+
+    def __init__(self, page_count, page_size=2, fail_on_page=None):
+        """Record the page layout and the pages requested so far."""
+        self.page_count = page_count
+        self.page_size = page_size
+        self.fail_on_page = fail_on_page
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def _make_request(self, method, path, params=None):
+        page = int((params or {}).get("continuationToken", 0))
+        with self.lock:
+            self.requested.append(page)
+        if page == self.fail_on_page:
+            raise PulumiAPIError(status_code=400, message="bad page")
+
+        stacks = [{"name": f"stack-{page}-{i}", "orgName": "org", "projectName": "proj"} for i in range(self.page_size)]
+        token = str(page + 1) if page + 1 < self.page_count else None
+        return {"stacks": stacks, "continuationToken": token}
+
+
+class TestPagination(unittest.TestCase):
+    """Tests for the pagination helpers."""
+
+    def test_split_page(self):
+        """Test splitting list and page object responses."""
+        self.assertEqual(split_page([{"a": 1}], "stacks"), ([{"a": 1}], None))
+        self.assertEqual(split_page({"stacks": [], "continuationToken": "t"}, "stacks"), ([], "t"))
+        self.assertEqual(split_page(None, "stacks"), ([], None))
+
+    def test_prefetching_preserves_order(self):
+        """Test that prefetched stacks are yielded in page order."""
+        client = FakePagedClient(page_count=5)
+        stacks = StacksResource(client)
+
+        names = [stack.name for stack in stacks.iter_stacks("org", prefetch=2)]
+
+        self.assertEqual(names, [f"stack-{p}-{i}" for p in range(5) for i in range(2)])
+
+    def test_prefetching_fetches_ahead(self):
+        """Test that the next page is requested while the current one is consumed."""
+        client = FakePagedClient(page_count=3)
+        paginator = PrefetchingPaginator(client, "/api/stacks/org", "stacks", depth=1)
+
+        pages = iter(paginator)
+        next(pages)
+        deadline = time.monotonic() + 2
+        while len(client.requested) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(client.requested, [0, 1])
+        paginator.close()
+
+    def test_max_buffered_items_bounds_lookahead(self):
+        """Test that the worker stops fetching while the item cap is reached."""
+        client = FakePagedClient(page_count=10, page_size=5)
+        paginator = PrefetchingPaginator(client, "/api/stacks/org", "stacks", depth=8, max_buffered_items=5)
+
+        pages = iter(paginator)
+        next(pages)
+        time.sleep(0.1)
+
+        # One page in the consumer's hands plus one buffered page reaching the cap
+        self.assertEqual(client.requested, [0, 1])
+        paginator.close()
+
+    def test_rejects_non_positive_buffer_limits(self):
+        """Test that a buffer cap below one item is rejected instead of stalling the worker."""
+        client = FakePagedClient(10, 2)
+        for limit in (0, -1):
+            with self.subTest(limit=limit), self.assertRaises(ValueError):
+                PrefetchingPaginator(client, "/api/stacks/org", "stacks", max_buffered_items=limit)
+
+    def test_prefetching_propagates_errors(self):
+        """Test that API errors raised in the worker surface in the consumer."""
+        client = FakePagedClient(page_count=5, fail_on_page=1)
+        stacks = StacksResource(client)
+
+        iterator = stacks.iter_stacks("org", prefetch=1)
+        self.assertEqual(next(iterator).name, "stack-0-0")
+        with self.assertRaises(PulumiAPIError):
+            list(iterator)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from pulumi_cloud_client.client import PulumiClient
+from pulumi_cloud_client.ratelimit import RateLimiter
+from pulumi_cloud_client.retry import retry_after_seconds
+from tests.helpers import FakeClock
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for the RateLimiter class."""
+
+    def setUp(self):
+        """Set up a limiter driven by a fake clock."""
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(rate=2, burst=2, clock=self.clock)
+
+    def test_reservations_queue_behind_each_other(self):
+        """Test that callers beyond the burst are spaced out at the configured rate."""
+        delays = [self.limiter.reserve() for _ in range(4)]
+
+        self.assertEqual(delays, [0.0, 0.0, 0.5, 1.0])
+
+    def test_tokens_refill_over_time(self):
+        """Test that tokens accrue at the configured rate."""
+        self.limiter.reserve()
+        self.limiter.reserve()
+        self.clock.now = 0.5
+
+        self.assertEqual(self.limiter.reserve(), 0.0)
+
+    def test_pause_holds_back_every_caller(self):
+        """Test that a pause delays all reservations."""
+        self.limiter.pause(3)
+
+        self.assertEqual(self.limiter.reserve(), 3)
+        self.assertEqual(self.limiter.budget().paused_for, 3)
+
+    def test_max_wait_reserves_nothing(self):
+        """Test that a reservation that would wait longer than allowed is refused without taking tokens."""
+        self.limiter.reserve()
+        self.limiter.reserve()
+
+        self.assertIsNone(self.limiter.try_reserve(0.4))
+        self.assertIsNone(self.limiter.acquire(max_wait=0.1))
+        self.assertEqual(self.limiter.try_reserve(0.5), 0.5)
+        self.assertEqual(self.limiter.reserve(), 1.0)
+
+    def test_update_from_headers(self):
+        """Test that the rate follows the remaining budget advertised by the service."""
+        self.limiter.update_from_headers(
+            {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "30", "X-RateLimit-Reset": "10"}
+        )
+
+        budget = self.limiter.budget()
+        self.assertEqual(budget.rate, 3)
+        self.assertEqual(budget.server_limit, 100)
+        self.assertEqual(budget.server_remaining, 30)
+        self.assertEqual(budget.server_reset_in, 10)
+
+    def test_exhausted_budget_pauses_until_reset(self):
+        """Test that a zero remaining budget pauses until the window resets."""
+        self.limiter.update_from_headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"})
+
+        self.assertEqual(self.limiter.budget().paused_for, 5)
+
+    def test_retry_after_seconds(self):
+        """Test parsing the Retry-After header."""
+        self.assertEqual(retry_after_seconds({"Retry-After": "7"}), 7)
+        self.assertIsNone(retry_after_seconds({"Retry-After": "soon"}))
+        self.assertIsNone(retry_after_seconds({}))
+
+
+class TestClientRateLimiting(unittest.TestCase):
+    """Tests for rate limit handling in PulumiClient._make_request."""
+
+    def _response(self, status_code, headers=None, body=b'{"name": "acme"}'):
+        response = Mock(status_code=status_code, headers=headers or {}, content=body, reason="")
+        if status_code >= 400:
+            response.raise_for_status.side_effect = requests.HTTPError()
+        return response
+
+    @patch("time.sleep")
+    def test_honors_retry_after(self, sleep):
+        """Test that the Retry-After header replaces the fixed backoff schedule."""
+        client = PulumiClient("token", retry_delay=1)
+        client.session = Mock()
+        client.session.request.side_effect = [self._response(429, {"Retry-After": "4"}), self._response(200)]
+
+        self.assertEqual(client.organizations.get("acme").name, "acme")
+        sleep.assert_called_once_with(4.0)
+
+    @patch("time.sleep")
+    def test_shared_limiter_pauses_on_429(self, sleep):
+        """Test that a 429 pauses the shared limiter rather than only the failing caller."""
+        limiter = RateLimiter(rate=100)
+        client = PulumiClient("token", rate_limiter=limiter)
+        client.session = Mock()
+        client.session.request.side_effect = [self._response(429, {"Retry-After": "2"}), self._response(200)]
+
+        client.organizations.get("acme")
+
+        # No private backoff, the retry waits in the limiter for the advertised pause
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(sleep.call_args_list[0][0][0], 0)
+        self.assertAlmostEqual(sleep.call_args_list[1][0][0], 2, places=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import time
+import unittest
+
+import requests
+
+from pulumi_cloud_client.bulk import BulkExecutor
+from pulumi_cloud_client.exceptions import DeadlineExceededError, PulumiAPIError
+from pulumi_cloud_client.ratelimit import RateLimiter
+from pulumi_cloud_client.retry import RetryBudget, backoff_delay, current_deadline, deadline
+from pulumi_cloud_client.testing import FakeDataset, FakePulumiServer, FaultConfig, constant_latency
+from tests.helpers import FakeClock
+
+ENDPOINT = "/api/stacks/{org}/{project}/{stack}"
+
+
+class TestBackoffDelay(unittest.TestCase):
+    """Tests for the backoff_delay function."""
+
+    def test_full_jitter_with_cap(self):
+        """Test that delays are spread between zero and the capped exponential delay."""
+        delays = [backoff_delay(1, 3, max_delay=30) for _ in range(200)]
+        self.assertTrue(all(0 <= delay <= 4 for delay in delays))
+        self.assertGreater(len(set(delays)), 100)
+
+        self.assertTrue(all(backoff_delay(1, 1000, max_delay=5) <= 5 for _ in range(100)))
+        self.assertEqual(backoff_delay(0, 5), 0)
+
+
+class TestRetryBudget(unittest.TestCase):
+    """Tests for the RetryBudget class."""
+
+    def test_ratio_of_requests(self):
+        """Test that retries are allowed up to the ratio of recent calls plus the reserve."""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0.1, window=10, clock=clock)
+
+        # The reserve alone allows one retry per window
+        self.assertTrue(budget.try_retry())
+        self.assertFalse(budget.try_retry())
+
+        for _ in range(10):
+            budget.record_request()
+        self.assertEqual(sum(budget.try_retry() for _ in range(10)), 5)
+        self.assertEqual((budget.stats().requests, budget.stats().retries, budget.stats().rejected), (10, 6, 6))
+
+    def test_window_slides(self):
+        """Test that calls and retries older than the window no longer count."""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=1.0, min_retries_per_second=0, window=5, clock=clock)
+        budget.record_request()
+        self.assertTrue(budget.try_retry())
+        self.assertFalse(budget.try_retry())
+
+        clock.now = 4.5
+        self.assertFalse(budget.try_retry())
+        clock.now = 5.5
+        budget.record_request()
+        self.assertTrue(budget.try_retry())
+        self.assertEqual((budget.stats().requests, budget.stats().retries), (1, 1))
+
+    def test_invalid_window(self):
+        """Test that a window must be positive."""
+        with self.assertRaises(ValueError):
+            RetryBudget(window=0)
+
+
+class TestDeadline(unittest.TestCase):
+    """Tests for the deadline context manager."""
+
+    def test_nested_deadlines_only_shorten(self):
+        """Test that an inner block cannot extend the deadline of an outer one."""
+        self.assertIsNone(current_deadline())
+        with deadline(1) as outer:
+            with deadline(60) as inner:
+                self.assertEqual(inner, outer)
+                self.assertEqual(current_deadline(), outer)
+                self.assertLess(current_deadline(0.5), outer)
+        self.assertIsNone(current_deadline())
+
+
+class TestClientDeadlines(unittest.TestCase):
+    """Tests for deadlines and retry budgets in PulumiClient against a local server."""
+
+    def setUp(self):
+        """Start a server whose stack endpoint always fails."""
+        faults = FaultConfig(error_rate=1.0, endpoints={ENDPOINT})
+        self.server = FakePulumiServer(FakeDataset(), latency=constant_latency(0.01), faults=faults)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def _client(self, **kwargs):
+        client = self.server.client(**kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_deadline_bounds_retries(self):
+        """Test that retries stop at the call's deadline instead of after max_retries."""
+        client = self._client(max_retries=100, retry_delay=0.02, max_retry_delay=0.05, deadline=0.3)
+
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceededError) as raised:
+            client.stacks.get("org-0", "project-0", "stack-0")
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(raised.exception.status_code, 504)
+        self.assertEqual(raised.exception.attempts, self.server.request_counts[f"GET {ENDPOINT}"])
+        # The last attempt either failed or was cut short by the deadline
+        self.assertIsInstance(raised.exception.__cause__, (PulumiAPIError, requests.Timeout))
+
+    def test_deadline_bounds_attempt_timeout(self):
+        """Test that a slow attempt is cut short by the deadline, also in bulk workers."""
+        self.server.latency = constant_latency(1.0)
+        client = self._client(timeout=30)
+
+        started = time.monotonic()
+        with deadline(0.2):
+            outcomes = list(BulkExecutor().map_unordered(lambda _: client.organizations.get("org-0"), range(2)))
+
+        self.assertLess(time.monotonic() - started, 0.8)
+        for outcome in outcomes:
+            self.assertIsInstance(outcome.error, DeadlineExceededError)
+            self.assertIsInstance(outcome.error.__cause__, requests.Timeout)
+
+    def test_deadline_bounds_rate_limiter_wait(self):
+        """Test that a call fails at once rather than wait for a rate limiter slot past its deadline."""
+        limiter = RateLimiter(rate=1, burst=1)
+        limiter.reserve()
+        client = self._client(rate_limiter=limiter)
+
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceededError) as raised:
+            client.request("GET", "/api/organizations/org-0", deadline=0.1)
+
+        self.assertLess(time.monotonic() - started, 0.05)
+        self.assertEqual(raised.exception.attempts, 0)
+        self.assertEqual(sum(self.server.request_counts.values()), 0)
+
+    def test_retry_budget_limits_amplification(self):
+        """Test that a retry budget caps retries to a share of calls when every call fails."""
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0)
+        client = self._client(max_retries=3, retry_delay=0, retry_budget=budget)
+
+        for _ in range(10):
+            with self.assertRaises(PulumiAPIError):
+                client.stacks.get("org-0", "project-0", "stack-0")
+
+        # Without the budget the server would see 40 requests
+        self.assertEqual(self.server.request_counts[f"GET {ENDPOINT}"], 15)
+        self.assertEqual(budget.stats().rejected, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from pulumi_cloud_client.client import PulumiClient
+from pulumi_cloud_client.exceptions import DeadlineExceededError, PulumiAPIError
+from pulumi_cloud_client.retry import deadline
+from pulumi_cloud_client.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Tests for the SingleFlight class."""
+
+    def _run_concurrently(self, single_flight, fn, callers=5):
+        """Call ``fn`` through ``single_flight`` from several threads while it is blocked."""
+        release = threading.Event()
+
+        def blocked():
+            release.wait()
+            return fn()
+
+        def call():
+            try:
+                return single_flight.do("key", blocked)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=callers) as executor:
+            futures = [executor.submit(call) for _ in range(callers)]
+            deadline = time.monotonic() + 2
+            while single_flight.stats()["coalesced"] < callers - 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            release.set()
+            return [future.result() for future in futures]
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent callers with the same key share a single execution."""
+        single_flight = SingleFlight()
+        fn = Mock(return_value={"name": "acme"})
+
+        results = self._run_concurrently(single_flight, fn)
+
+        fn.assert_called_once()
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(single_flight.stats(), {"executed": 1, "coalesced": 4, "in_flight": 0})
+
+    def test_errors_are_shared(self):
+        """Test that every waiter receives the leader's exception."""
+        single_flight = SingleFlight()
+        fn = Mock(side_effect=PulumiAPIError(status_code=404, message="not found"))
+
+        results = self._run_concurrently(single_flight, fn)
+
+        fn.assert_called_once()
+        self.assertTrue(all(isinstance(result, PulumiAPIError) for result in results))
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test that completed calls are not reused."""
+        single_flight = SingleFlight()
+        fn = Mock(return_value=1)
+
+        single_flight.do("key", fn)
+        single_flight.do("key", fn)
+
+        self.assertEqual(fn.call_count, 2)
+
+    def test_waiter_gives_up_at_its_deadline(self):
+        """Test that a waiting caller raises at its own deadline while the leader's call goes on."""
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(single_flight.do, "key", lambda: release.wait(2) and "done")
+            while single_flight.stats()["in_flight"] == 0:
+                time.sleep(0.001)
+
+            started = time.monotonic()
+            with deadline(0.05), self.assertRaises(DeadlineExceededError) as raised:
+                single_flight.do("key", Mock(), endpoint="/api/user")
+            self.assertLess(time.monotonic() - started, 0.5)
+            self.assertEqual(raised.exception.endpoint, "/api/user")
+
+            release.set()
+            self.assertEqual(leader.result(), "done")
+
+
+class TestClientCoalescing(unittest.TestCase):
+    """Tests for request coalescing in PulumiClient."""
+
+    def test_identical_gets_are_coalesced(self):
+        """Test that identical concurrent GETs send a single request."""
+        client = PulumiClient("token", coalesce_requests=True)
+
+        def slow_request(**kwargs):
+            time.sleep(0.2)
+            return Mock(status_code=200, headers={}, content=b'{"name": "acme"}')
+
+        client.session = Mock()
+        client.session.request.side_effect = slow_request
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            names = list(executor.map(lambda _: client.organizations.get("acme").name, range(8)))
+
+        self.assertEqual(names, ["acme"] * 8)
+        self.assertEqual(client.session.request.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
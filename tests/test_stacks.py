@@ -82,6 +82,38 @@ class TestStacksResource(unittest.TestCase):
         self.assertEqual(result[0].project, "project1")
         self.assertEqual(result[1].project, "project2")
 
+    def test_iter_stacks_follows_continuation_token(self):
+        """Test that paginated listings follow the continuation token lazily."""
+        first_page = {
+            "stacks": [{"name": "dev", "orgName": self.org_name, "projectName": self.project_name}],
+            "continuationToken": "page-2",
+        }
+        second_page = {"stacks": [{"name": "prod", "orgName": self.org_name, "projectName": self.project_name}]}
+        self.mock_client._make_request.side_effect = [first_page, second_page]
+
+        iterator = self.stacks_resource.iter_stacks(self.org_name)
+
+        # The first stack is available before the second page is requested
+        self.assertEqual(next(iterator).name, "dev")
+        self.mock_client._make_request.assert_called_once_with("get", f"/api/stacks/{self.org_name}")
+
+        self.assertEqual([stack.name for stack in iterator], ["prod"])
+        self.mock_client._make_request.assert_called_with(
+            "get", f"/api/stacks/{self.org_name}", params={"continuationToken": "page-2"}
+        )
+
+    def test_list_collects_all_pages(self):
+        """Test that list returns the stacks of every page."""
+        self.mock_client._make_request.side_effect = [
+            {"stacks": [{"name": "dev", "orgName": self.org_name, "projectName": "p"}], "continuationToken": "t"},
+            {"stacks": [{"name": "prod", "orgName": self.org_name, "projectName": "p"}], "continuationToken": None},
+        ]
+
+        result = self.stacks_resource.list(self.org_name)
+
+        self.assertEqual([stack.name for stack in result], ["dev", "prod"])
+        self.assertEqual(self.mock_client._make_request.call_count, 2)
+
     def test_get(self):
         """Test getting a single stack."""
         # Mock API response
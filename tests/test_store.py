@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from pulumi_cloud_client.inventory import InventoryDelta, InventorySnapshot
+from pulumi_cloud_client.models import Organization, Project, Stack
+from pulumi_cloud_client.store import InventoryStore
+
+
+def _stack(name, project="web", updated="2023-01-01T00:00:00Z", resources=1, tags=None):
+    return Stack(
+        name=name, organization="acme", project=project, last_update=updated, resource_count=resources, tags=tags
+    )
+
+
+class TestInventoryStore(unittest.TestCase):
+    """Tests for the InventoryStore class."""
+
+    def setUp(self):
+        """Fill an in-memory store."""
+        self.store = InventoryStore()
+        self.store.write(Organization(name="acme", created_on="2020-01-01T00:00:00+00:00"))
+        self.store.write([Project(name="web", organization="acme"), Project(name="api", organization="acme")])
+        self.store.write(
+            [
+                _stack("dev", tags={"env": "dev", "team": "payments"}),
+                _stack("prod", updated="2023-03-01T00:00:00Z", resources=40, tags={"env": "prod", "team": "payments"}),
+                _stack("prod", project="api", updated="2023-02-01T00:00:00Z", resources=10, tags={"env": "prod"}),
+                _stack("scratch", project="api", updated=None, resources=0, tags={}),
+            ]
+        )
+
+    def tearDown(self):
+        """Close the store."""
+        self.store.close()
+
+    def test_models_round_trip(self):
+        """Test that stored objects come back as equal model objects."""
+        self.assertEqual(self.store.organizations()[0].created_on, datetime(2020, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual([p.full_name for p in self.store.projects("acme")], ["acme/api", "acme/web"])
+
+        stack = self.store.stacks(project="web", tag_keys=["team"], tags={"env": "prod"})[0]
+        self.assertEqual(stack, _stack("prod", updated="2023-03-01T00:00:00+00:00", resources=40, tags=stack.tags))
+        self.assertEqual(stack.tags, {"env": "prod", "team": "payments"})
+
+    def test_filters_and_ordering(self):
+        """Test querying stacks by tags, update time and resource count."""
+        names = lambda stacks: [s.full_name for s in stacks]  # noqa: E731
+
+        self.assertEqual(names(self.store.stacks(tags={"env": "prod"})), ["acme/api/prod", "acme/web/prod"])
+        self.assertEqual(
+            names(self.store.stacks(updated_after=datetime(2023, 1, 15, tzinfo=timezone.utc), order_by="-last_update")),
+            ["acme/web/prod", "acme/api/prod"],
+        )
+        self.assertEqual(names(self.store.stacks(min_resources=5, max_resources=20)), ["acme/api/prod"])
+        self.assertEqual(names(self.store.stacks(order_by="-resource_count", limit=1)), ["acme/web/prod"])
+        self.assertEqual(self.store.count_stacks(tags={"team": "payments"}), 2)
+        self.assertEqual(self.store.tag_values("env"), {"dev": 1, "prod": 2})
+        with self.assertRaises(ValueError):
+            self.store.stacks(order_by="owner")
+
+    def test_epoch_timestamps(self):
+        """Test that stacks whose API response gives the last update in epoch seconds are stored and queried."""
+        item = {"name": "epoch", "orgName": "acme", "projectName": "web", "lastUpdate": 1680307200}
+        self.store.write(Stack.from_api_response(item))
+
+        [stack] = self.store.stacks(updated_after=datetime(2023, 3, 15, tzinfo=timezone.utc))
+        self.assertEqual((stack.name, stack.last_update), ("epoch", datetime(2023, 4, 1, tzinfo=timezone.utc)))
+
+    def test_updates_replace_tags_and_keep_them_when_unknown(self):
+        """Test that rewriting a stack replaces its tags, unless the new version has none."""
+        self.store.write(_stack("dev", resources=3, tags={"env": "staging"}))
+        self.store.write(_stack("dev", resources=4, tags=None))
+
+        stack = self.store.stacks(project="web", tag_keys=["env"], max_resources=4)[0]
+        self.assertEqual((stack.resource_count, stack.tags), (4, {"env": "staging"}))
+        self.assertEqual(self.store.count_stacks(), 4)
+
+    def test_listing_keeps_stored_tags(self):
+        """Test that writing a stack listing that carries no tags keeps the stored tags."""
+        item = {"name": "prod", "orgName": "acme", "projectName": "web", "lastUpdate": "2023-04-01T00:00:00Z"}
+        self.store.write(Stack.from_api_list([item]))
+
+        [stack] = self.store.stacks(project="web", tag_keys=["team"], tags={"env": "prod"})
+        self.assertEqual(stack.last_update, datetime(2023, 4, 1, tzinfo=timezone.utc))
+        self.assertEqual(stack.tags, {"env": "prod", "team": "payments"})
+
+    def test_apply_delta(self):
+        """Test writing the result of an incremental sync."""
+        snapshot = InventorySnapshot(stacks={"acme/web/canary": _stack("canary", tags={"env": "canary"})})
+        self.assertTrue(self.store.delete_stack("acme", "api", "scratch"))
+
+        self.store.apply_delta(InventoryDelta(snapshot, added=["acme/web/canary"], removed=["acme/web/dev"]))
+
+        self.assertEqual([s.full_name for s in self.store.stacks(project="web")], ["acme/web/canary", "acme/web/prod"])
+        self.assertEqual(self.store.tag_values("env"), {"canary": 1, "prod": 2})
+
+    def test_persists_to_disk(self):
+        """Test that a file-backed store keeps its data between connections."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "inventory.db")
+            with InventoryStore(path) as store:
+                store.write(_stack("dev", tags={"env": "dev"}))
+            with InventoryStore(path) as store:
+                self.assertEqual(store.stacks()[0].tags, {"env": "dev"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import io
+import json
+import unittest
+from unittest.mock import MagicMock, Mock
+
+from pulumi_cloud_client.resources.stacks import StacksResource
+from pulumi_cloud_client.streaming import iter_array_items, iter_deployment_resources
+
+DEPLOYMENT = {
+    "version": 3,
+    "deployment": {
+        "manifest": {"time": "2023-01-01T12:00:00Z", "magic": "abc", "plugins": [{"name": "aws", "kind": "resource"}]},
+        "secrets_providers": {"type": "service", "state": {"url": 'https://api.pulumi.com/"quoted"'}},
+        "resources": [
+            {"urn": "urn:pulumi:dev::proj::pulumi:pulumi:Stack::proj-dev", "type": "pulumi:pulumi:Stack"},
+            {"urn": "urn:pulumi:dev::proj::aws:s3/bucket:Bucket::website", "outputs": {"tags": {"name": "é ✓"}}},
+            {"urn": "urn:pulumi:dev::proj::random:index/randomInteger:RandomInteger::n", "outputs": {"result": 12345}},
+        ],
+        "pending_operations": [],
+    },
+}
+
+
+def _chunks(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestIterArrayItems(unittest.TestCase):
+    """Tests for the incremental JSON array parser."""
+
+    def test_yields_resources_for_any_chunk_size(self):
+        """Test that items are decoded correctly whatever the chunk boundaries."""
+        data = json.dumps(DEPLOYMENT, ensure_ascii=False).encode()
+        expected = DEPLOYMENT["deployment"]["resources"]
+
+        for size in (1, 3, 7, 64, len(data)):
+            with self.subTest(chunk_size=size):
+                items = list(iter_array_items(_chunks(data, size), ("deployment", "resources")))
+                self.assertEqual(items, expected)
+
+    def test_stops_reading_after_the_array(self):
+        """Test that the document after the array is never consumed."""
+        consumed = []
+
+        def chunks():
+            for chunk in [b'{"deployment": {"resources": [1, 2]', b', "rest": "x"}}']:
+                consumed.append(chunk)
+                yield chunk
+
+        self.assertEqual(list(iter_array_items(chunks(), ("deployment", "resources"))), [1, 2])
+        self.assertEqual(len(consumed), 1)
+
+    def test_missing_path_yields_nothing(self):
+        """Test that a document without the array yields no items."""
+        self.assertEqual(list(iter_array_items([b'{"version": 3, "deployment": {}}'], ("deployment", "resources"))), [])
+
+    def test_truncated_document_raises(self):
+        """Test that a truncated document raises a ValueError."""
+        with self.assertRaises(ValueError):
+            list(iter_array_items([b'{"deployment": {"resources": [{"urn": "a"'], ("deployment", "resources")))
+
+    def test_iter_deployment_resources_from_file(self):
+        """Test reading resources from a saved export."""
+        file = io.BytesIO(json.dumps(DEPLOYMENT).encode())
+
+        resources = list(iter_deployment_resources(file, chunk_size=16))
+
+        self.assertEqual(len(resources), 3)
+
+
+class TestStreamingExport(unittest.TestCase):
+    """Tests for the streaming export methods of StacksResource."""
+
+    def setUp(self):
+        """Set up a mocked client streaming a deployment export."""
+        self.data = json.dumps(DEPLOYMENT).encode()
+        self.response = MagicMock()
+        self.response.iter_content.side_effect = lambda chunk_size: iter(_chunks(self.data, chunk_size))
+        self.client = Mock()
+        self.client._stream_request.return_value = self.response
+        self.stacks_resource = StacksResource(self.client)
+
+    def test_export_deployment_to_file_object(self):
+        """Test streaming an export into a file object."""
+        destination = io.BytesIO()
+
+        written = self.stacks_resource.export_deployment_to("org", "proj", "dev", destination, chunk_size=10)
+
+        self.client._stream_request.assert_called_once_with("get", "/api/stacks/org/proj/dev/export")
+        self.assertEqual(written, len(self.data))
+        self.assertEqual(destination.getvalue(), self.data)
+        self.response.close.assert_called_once()
+
+    def test_iter_deployment_resources(self):
+        """Test iterating over the resources of a streamed export."""
+        resources = list(self.stacks_resource.iter_deployment_resources("org", "proj", "dev", chunk_size=10))
+
+        self.assertEqual([r["urn"].split("::")[-1] for r in resources], ["proj-dev", "website", "n"])
+        self.response.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
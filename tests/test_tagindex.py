@@ -0,0 +1,106 @@
+import random
+import unittest
+
+from pulumi_cloud_client.models.stack import Stack
+from pulumi_cloud_client.tagindex import EXISTS, NOT_EXISTS, NOT_IN, Requirement, TagIndex, parse_selector
+
+
+def _stack(name, project="proj", **tags):
+    return Stack(name=name, organization="org", project=project, last_update=None, resource_count=0, tags=tags)
+
+
+class TestParseSelector(unittest.TestCase):
+    """Tests for the parse_selector function."""
+
+    def test_operators(self):
+        """Test every kind of requirement, with quoted and spaced values."""
+        selector = parse_selector('env==prod, team notin (web, "data eng"),owner, !deprecated,pulumi:project!=x')
+
+        self.assertEqual(
+            selector.requirements,
+            (
+                Requirement("env", "=", frozenset({"prod"})),
+                Requirement("team", NOT_IN, frozenset({"web", "data eng"})),
+                Requirement("owner", EXISTS),
+                Requirement("deprecated", NOT_EXISTS),
+                Requirement("pulumi:project", "!=", frozenset({"x"})),
+            ),
+        )
+        self.assertEqual(str(parse_selector("env in (b, a),!x")), "env in (a, b),!x")
+        self.assertEqual(parse_selector("").requirements, ())
+
+    def test_malformed(self):
+        """Test that malformed selectors are rejected."""
+        for text in ("env=", "env in prod", "env in (a,", "env=prod,", "=prod", "env prod", 'env="prod'):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_selector(text)
+
+
+class TestTagIndex(unittest.TestCase):
+    """Tests for the TagIndex class."""
+
+    def setUp(self):
+        """Index a few hundred randomly tagged stacks."""
+        rng = random.Random(0)
+        self.stacks = []
+        for i in range(300):
+            tags = {"env": rng.choice(["dev", "staging", "prod"]), "team": rng.choice(["web", "payments", "data"])}
+            if rng.random() < 0.3:
+                tags["owner"] = rng.choice(["alice", "bob"])
+            self.stacks.append(_stack(f"stack-{i}", **tags))
+        self.index = TagIndex(self.stacks)
+
+    def _scan(self, selector):
+        parsed = parse_selector(selector)
+        return {stack.full_name for stack in self.stacks if parsed.matches(stack.tags)}
+
+    def test_queries_match_a_scan(self):
+        """Test that index queries return the same stacks as matching every stack in turn."""
+        for selector in (
+            "env=prod,team=payments",
+            "env in (prod, staging),team!=web",
+            "owner,env notin (dev)",
+            "!owner",
+            "env!=prod,!owner",
+            "owner=carol",
+            "region",
+            "region!=eu",
+            "",
+        ):
+            with self.subTest(selector=selector):
+                self.assertEqual(self.index.names(selector), self._scan(selector))
+                self.assertEqual(self.index.count(selector), len(self._scan(selector)))
+
+        self.assertEqual(len(self.index.select("env=prod")), self.index.values("env")["prod"])
+        self.assertEqual(self.index.tag_keys(), ["env", "owner", "team"])
+
+    def test_incremental_updates(self):
+        """Test that adding, retagging and removing stacks keeps cached results correct."""
+        self.assertEqual(self.index.names("env=prod,team=payments"), self._scan("env=prod,team=payments"))
+        self.assertEqual(self.index.names("region=eu"), frozenset())
+
+        moved = next(stack for stack in self.stacks if stack.tags["env"] == "dev")
+        moved.tags = {"env": "prod", "team": "payments", "region": "eu"}
+        self.index.add(moved)
+        new = _stack("new", project="other", region="eu")
+        self.stacks.append(new)
+        self.index.add(new)
+
+        self.assertIn(moved.full_name, self.index.names("env=prod,team=payments"))
+        self.assertEqual(self.index.names("region=eu"), {moved.full_name, new.full_name})
+        self.assertEqual(self.index.names("env!=prod,team!=web"), self._scan("env!=prod,team!=web"))
+
+        self.assertTrue(self.index.remove(new.full_name))
+        self.assertFalse(self.index.remove(new))
+        self.assertNotIn(new, self.index)
+        self.assertEqual(self.index.names("region=eu"), {moved.full_name})
+
+        moved.tags = {}
+        self.index.add(moved)
+        self.assertEqual(self.index.values("region"), {})
+        self.assertNotIn("region", self.index.tag_keys())
+        self.assertEqual(len(self.index), 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
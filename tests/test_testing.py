@@ -0,0 +1,110 @@
+import contextlib
+import io
+import time
+import unittest
+
+import requests
+
+from pulumi_cloud_client.exceptions import PulumiAPIError
+from pulumi_cloud_client.testing import FakeDataset, FakePulumiServer, FaultConfig, constant_latency
+
+STACK_ENDPOINT = "/api/stacks/{org}/{project}/{stack}"
+
+
+class TestFakePulumiServer(unittest.TestCase):
+    """Tests for the local fake Pulumi Cloud server, through a real client."""
+
+    def setUp(self):
+        """Start a server with a small dataset and small pages."""
+        self.server = FakePulumiServer(FakeDataset(organizations=2, projects=2, stacks=10, resources=4), page_size=7)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.client = self.server.client(retry_delay=0.001)
+        self.addCleanup(self.client.close)
+
+    def test_paginated_listings(self):
+        """Test that list endpoints are paged and followed to the end by the client."""
+        stacks = self.client.stacks.list("org-0")
+
+        self.assertEqual(len(stacks), 20)
+        self.assertEqual(len({stack.full_name for stack in stacks}), 20)
+        self.assertEqual(self.server.request_counts["GET /api/stacks/{org}"], 3)
+        self.assertEqual(len(self.client.stacks.list("org-0", "project-1")), 10)
+        self.assertEqual([project.name for project in self.client.projects.list("org-1")], ["project-0", "project-1"])
+        self.assertEqual([org.name for org in self.client.organizations.list()], ["org-0", "org-1"])
+
+    def test_stack_operations(self):
+        """Test reading, tagging, exporting and transferring a stack."""
+        self.client.stacks.update_tags("org-0", "project-0", "stack-1", {"team": "payments"})
+        self.assertEqual(self.client.stacks.list_tags("org-0", "project-0", "stack-1"), {"team": "payments"})
+        self.assertEqual(len(self.client.stacks.get_deployment("org-0", "project-0", "stack-1")), 4)
+
+        moved = self.client.stacks.transfer_stack("org-0", "project-0", "stack-1", "org-9")
+
+        self.assertEqual((moved.organization, moved.tags), ("org-9", {"team": "payments"}))
+        with self.assertRaises(PulumiAPIError) as raised:
+            self.client.stacks.get("org-0", "project-0", "stack-1")
+        self.assertEqual(raised.exception.status_code, 404)
+
+    def test_injected_failures_are_retried(self):
+        """Test that queued 5xx and 429 responses are retried by the client."""
+        self.server.fail_next(2, 503, endpoints={STACK_ENDPOINT})
+        self.server.fail_next(1, 429, retry_after=0.01)
+
+        stack = self.client.stacks.get("org-1", "project-0", "stack-0")
+
+        self.assertEqual(stack.name, "stack-0")
+        self.assertEqual(self.server.status_counts, {503: 2, 429: 1, 200: 1})
+
+    def test_random_faults(self):
+        """Test that random faults are limited to their endpoints."""
+        self.server.faults = FaultConfig(error_rate=1.0, error_status=500, endpoints={STACK_ENDPOINT})
+        self.client.max_retries = 1
+
+        with self.assertRaises(PulumiAPIError) as raised:
+            self.client.stacks.get("org-0", "project-0", "stack-0")
+
+        self.assertEqual(raised.exception.status_code, 500)
+        self.assertEqual(self.server.request_counts[f"GET {STACK_ENDPOINT}"], 2)
+        self.assertEqual(len(self.client.stacks.list("org-0")), 20)
+
+    def test_concurrent_requests(self):
+        """Test that requests are served concurrently on real sockets."""
+        self.server.latency = constant_latency(0.05)
+        stacks = self.client.stacks.list("org-1", "project-0")
+        self.server.reset_stats()
+
+        summary = self.client.stacks.transfer_many("org-2", stacks, max_workers=5)
+
+        self.assertEqual(len(summary.transferred), 10)
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertEqual(len(self.server.dataset.list_stacks("org-2")), 10)
+
+    def test_access_token(self):
+        """Test that requests with the wrong token are rejected when a token is configured."""
+        self.server.access_token = "secret"
+
+        with self.assertRaises(PulumiAPIError) as raised:
+            self.client.organizations.get("org-0")
+
+        self.assertEqual(raised.exception.status_code, 401)
+        self.assertEqual(self.server.client(access_token="secret").organizations.get("org-0").name, "org-0")
+
+    def test_client_disconnects_are_quiet(self):
+        """Test that responses to clients that hung up do not print tracebacks."""
+        self.server.latency = constant_latency(0.2)
+        client = self.server.client(timeout=0.05, max_retries=0)
+        self.addCleanup(client.close)
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            for _ in range(3):
+                with self.assertRaises(requests.Timeout):
+                    client.organizations.get("org-0")
+            time.sleep(0.4)
+
+        self.assertEqual(stderr.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from pulumi_cloud_client.client import PulumiClient
+from pulumi_cloud_client.models import Stack
+from pulumi_cloud_client.tracing import JSONFileExporter, Tracer
+
+STACK = b'{"name": "prod", "orgName": "acme", "projectName": "web"}'
+
+
+def _response(status_code, body=STACK):
+    response = Mock(status_code=status_code, headers={}, content=body, reason="")
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError()
+    return response
+
+
+class TestTracing(unittest.TestCase):
+    """Tests for request tracing in PulumiClient."""
+
+    def setUp(self):
+        """Set up a traced client with a mocked session."""
+        self.tracer = Tracer()
+        self.client = PulumiClient("token", tracer=self.tracer)
+        self.client.session = Mock()
+
+    def _tree(self):
+        spans = self.tracer.exporter.spans
+        by_id = {span.span_id: span for span in spans}
+        children = {}
+        for span in spans:
+            children.setdefault(span.parent_id, []).append(span)
+        for siblings in children.values():
+            siblings.sort(key=lambda span: span.start_time)
+        return by_id, children
+
+    @patch("time.sleep")
+    def test_nested_spans_for_retried_call(self, sleep):
+        """Test the span tree of a resource method whose request is retried once."""
+        self.client.session.request.side_effect = [_response(503, b'{"message": "busy"}'), _response(200)]
+
+        self.client.stacks.get("acme", "web", "prod")
+
+        _, children = self._tree()
+        (root,) = children[None]
+        self.assertEqual(root.name, "stacks.get")
+        self.assertEqual([span.name for span in children[root.span_id]], ["request", "model"])
+
+        request = children[root.span_id][0]
+        self.assertEqual(request.attributes["endpoint"], "/api/stacks/{org}/{project}/{stack}")
+        self.assertEqual([span.name for span in children[request.span_id]], ["attempt", "backoff", "attempt"])
+
+        failed, _, succeeded = children[request.span_id]
+        self.assertEqual(failed.attributes, {"attempt": 1, "status_code": 503})
+        self.assertIn("PulumiAPIError", failed.error)
+        self.assertEqual([span.name for span in children[failed.span_id]], ["network", "decode"])
+        self.assertEqual([span.name for span in children[succeeded.span_id]], ["network", "decode"])
+        self.assertEqual(succeeded.attributes, {"attempt": 2, "status_code": 200})
+        self.assertEqual(len({span.trace_id for span in self.tracer.exporter.spans}), 1)
+
+    def test_bulk_workers_continue_the_trace(self):
+        """Test that calls made by BulkExecutor workers nest under the caller's span."""
+        self.client.session.request.return_value = _response(200)
+        stacks = [
+            Stack(name=name, organization="acme", project="web", last_update=None, resource_count=0) for name in "ab"
+        ]
+
+        with self.tracer.span("job") as job:
+            self.client.stacks.transfer_many("globex", stacks, max_workers=2)
+
+        _, children = self._tree()
+        self.assertEqual([span.name for span in children[None]], ["job"])
+        transfer_many = children[job.span_id][0]
+        self.assertEqual(transfer_many.name, "stacks.transfer_many")
+        names = [span.name for span in children[transfer_many.span_id]]
+        self.assertEqual(names.count("stacks.transfer_stack"), 2)
+
+    def test_json_file_exporter(self):
+        """Test that spans are written as JSON lines."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "spans.jsonl")
+            exporter = JSONFileExporter(path)
+            tracer = Tracer(exporter)
+            with tracer.span("outer", job="nightly"):
+                with tracer.span("inner"):
+                    pass
+            exporter.close()
+
+            with open(path) as file:
+                spans = [json.loads(line) for line in file]
+
+        self.assertEqual([span["name"] for span in spans], ["inner", "outer"])
+        self.assertEqual(spans[0]["parent_id"], spans[1]["span_id"])
+        self.assertEqual(spans[1]["attributes"], {"job": "nightly"})
+
+
+if __name__ == "__main__":
+    unittest.main()